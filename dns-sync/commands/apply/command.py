@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+from ..sync import read_plan, resolve_actions, apply_actions
+from ...commandbase import Command as BaseCommand
+from ...zonebase import Provider
+from argparse import Namespace, ArgumentParser
+from typing import List
+
+
+class Command(BaseCommand):
+    def __init__(self):
+        self.providers: List[Provider] = Provider.get_all()
+
+    def populate_argument_parser(self, parser: ArgumentParser):
+        parser.description = "Apply a plan written by sync --plan."
+
+        parser.add_argument(
+            metavar="plan",
+            dest="plan",
+            help="plan file to apply"
+        )
+
+    def run(self, arguments: Namespace):
+        plan = read_plan(arguments.plan)
+        destination_provider = next((p for p in self.providers if p.id == plan["destination"]), None)
+
+        if not destination_provider:
+            raise ValueError(f"Destination provider {plan['destination']} is not available")
+
+        for zone_plan in plan["zones"]:
+            zone = zone_plan["zone"]
+            destination_zone = destination_provider.get_destination_zone(zone)
+
+            if not destination_zone:
+                print(f"Zone {zone} does not exist in destination provider {destination_provider.id}")
+                continue
+
+            print(f"Applying zone {zone} to {destination_provider.id}")
+
+            apply_actions(zone, resolve_actions(zone_plan, destination_zone), destination_provider)
@@ -0,0 +1,5 @@
+#!/usr/bin/env python3
+
+from .command import Command
+from .memory_provider import MemoryProvider
+from .synthetic import default_mix, parse_mix, generate_zone_lines, mutate_zone_lines
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+
+from .diff_check import check_external_diff
+from .memory_provider import MemoryProvider
+from .request_count import count_requests, mock_api_server
+from .synthetic import default_mix, parse_mix, generate_zone_lines, mutate_zone_lines
+from ..sync import SyncAction, diff_zone, apply_actions
+from ...commandbase import Command as BaseCommand
+from ...providers.zonefile import Provider as ZonefileProvider
+from ...zonebase import ColumnarZone, Record
+from argparse import Namespace, ArgumentParser
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class Command(BaseCommand):
+    def populate_argument_parser(self, parser: ArgumentParser):
+        parser.description = "Benchmark each stage of a sync against synthetic zones."
+
+        parser.add_argument(
+            "-r",
+            "--records",
+            metavar="count",
+            dest="records",
+            type=int,
+            action="append",
+            help="number of records in the synthetic zone, can be given multiple times (default 10000)"
+        )
+
+        parser.add_argument(
+            "--mix",
+            metavar="mix",
+            dest="mix",
+            default=default_mix,
+            help=f"record type weights (default {default_mix})"
+        )
+
+        parser.add_argument(
+            "--round-robin",
+            metavar="size",
+            dest="round_robin",
+            type=int,
+            default=4,
+            help="number of A records that share a host name"
+        )
+
+        parser.add_argument(
+            "--txt-set",
+            metavar="size",
+            dest="txt_set",
+            type=int,
+            default=8,
+            help="number of TXT records that share a host name"
+        )
+
+        parser.add_argument(
+            "--change-rate",
+            metavar="rate",
+            dest="change_rate",
+            type=float,
+            default=0.1,
+            help="fraction of destination records that differ from the source"
+        )
+
+        parser.add_argument(
+            "--iterations",
+            metavar="count",
+            dest="iterations",
+            type=int,
+            default=3,
+            help="number of timed runs per stage, the fastest is reported"
+        )
+
+        parser.add_argument(
+            "--seed",
+            metavar="seed",
+            dest="seed",
+            type=int,
+            default=0,
+            help="random seed for zone generation"
+        )
+
+        parser.add_argument(
+            "--requests",
+            dest="requests",
+            action="store_true",
+            help="also count the requests each provider makes to load the zone from a local mock server"
+        )
+
+        parser.add_argument(
+            "-o",
+            "--output",
+            metavar="file",
+            dest="output",
+            help="write results as JSON to this file"
+        )
+
+    def run(self, arguments: Namespace):
+        mix = parse_mix(arguments.mix)
+        results: Dict[str, Any] = {
+            "version": get_version(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "parameters": {
+                "mix": arguments.mix,
+                "round_robin": arguments.round_robin,
+                "txt_set": arguments.txt_set,
+                "change_rate": arguments.change_rate,
+                "iterations": arguments.iterations,
+                "seed": arguments.seed
+            },
+            "runs": []
+        }
+
+        # one mock server is shared by every zone size, see mock_api_server
+        with mock_api_server() if arguments.requests else contextlib.nullcontext() as server:
+            for records in arguments.records or [10000]:
+                lines = generate_zone_lines(records, mix, arguments.round_robin, arguments.txt_set, arguments.seed)
+                destination_lines = mutate_zone_lines(lines, arguments.change_rate, arguments.seed)
+
+                print(f"Benchmarking zone with {len(lines) - 1} records")
+
+                stages = run_stages(lines, destination_lines, arguments.iterations)
+
+                for name, stage in stages.items():
+                    print(f"  {name:<24} {stage['seconds'] * 1000:>10.1f} ms {stage['peak_bytes'] / 1048576:>10.1f} MiB")
+
+                run = {"records": len(lines) - 1, "stages": stages}
+
+                if arguments.requests:
+                    run["requests"] = count_requests(
+                        server,
+                        "benchmark.example",
+                        [parse_line(line) for line in lines if not line.startswith("$")],
+                        [parse_line(line) for line in destination_lines if not line.startswith("$")]
+                    )
+
+                    for provider_id, counts in run["requests"].items():
+                        print(f"  {provider_id + ' requests':<24} {counts['default_page_size']:>10} at default page size {counts['max_page_size']:>10} at max page size")
+
+                results["runs"].append(run)
+
+        if arguments.output:
+            with open(arguments.output, "w") as f:
+                json.dump(results, f, indent=2)
+
+            print(f"Results written to {arguments.output}")
+
+
+def get_version() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_stages(lines: List[str], destination_lines: List[str], iterations: int) -> Dict[str, Dict[str, Any]]:
+    domain = "benchmark.example"
+    stages: Dict[str, Dict[str, Any]] = {}
+
+    with tempfile.TemporaryDirectory() as zonefile_path:
+        with open(os.path.join(zonefile_path, f"{domain}.db"), "w") as f:
+            f.write("\n".join(lines))
+
+        zonefile_provider = ZonefileProvider()
+        previous_path = os.environ.get("ZONEFILE_PATH")
+        os.environ["ZONEFILE_PATH"] = zonefile_path
+
+        try:
+            stages["zonefile_parse"] = measure(lambda: zonefile_provider.get_zone(domain), iterations)
+            source_zone = zonefile_provider.get_zone(domain)
+        finally:
+            if previous_path is None:
+                del os.environ["ZONEFILE_PATH"]
+            else:
+                os.environ["ZONEFILE_PATH"] = previous_path
+
+    fields = [(r.host, r.type, r.ttl, f"{r.data}") for r in source_zone.records]
+
+    stages["record_construction"] = measure(lambda: [build_record(*f) for f in fields], iterations)
+
+    destination_records = [parse_line(line) for line in destination_lines if not line.startswith("$")]
+
+    def make_destination() -> MemoryProvider:
+        provider = MemoryProvider()
+        provider.add_zone(domain, destination_records)
+
+        return provider
+
+    destination_provider = make_destination()
+    destination_zone = destination_provider.get_zone(domain)
+
+    stages["sync_diff"] = measure(lambda: diff_zone(source_zone, destination_zone, zonefile_provider, destination_provider), iterations)
+    check_external_diff(source_zone, destination_zone, zonefile_provider, destination_provider)
+    stages["zone_export"] = measure(lambda: str(source_zone), iterations)
+
+    stages["columnar_construction"] = measure(lambda: ColumnarZone.from_zone(source_zone), iterations)
+    columnar_source = ColumnarZone.from_zone(source_zone)
+    columnar_destination = ColumnarZone.from_zone(destination_zone)
+    stages["columnar_diff"] = measure(lambda: columnar_source.diff(columnar_destination), iterations)
+
+    def prepare_apply() -> Tuple[MemoryProvider, List[SyncAction]]:
+        provider = make_destination()
+
+        return provider, diff_zone(source_zone, provider.get_zone(domain), zonefile_provider, provider)
+
+    def apply(prepared: Tuple[MemoryProvider, List[SyncAction]]) -> List[SyncAction]:
+        provider, actions = prepared
+
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            apply_actions(domain, actions, provider)
+
+        return actions
+
+    # only applying the actions is timed, a fresh provider and its actions are prepared before each run
+    stages["sync_apply"] = measure(apply, iterations, prepare_apply)
+    stages["sync_apply"]["actions"] = stages["sync_apply"]["count"]
+
+    return stages
+
+
+# With a setup callable, its result is built before each run and passed to the stage, outside of the measurement.
+def measure(stage: Callable[..., Any], iterations: int, setup: Optional[Callable[[], Any]] = None) -> Dict[str, Any]:
+    timings = []
+
+    def prepare() -> tuple:
+        return (setup(),) if setup else ()
+
+    for _ in range(max(iterations, 1)):
+        arguments = prepare()
+        start = time.perf_counter()
+        stage(*arguments)
+        timings.append(time.perf_counter() - start)
+
+    # memory is measured in a separate run since tracing slows everything down
+    arguments = prepare()
+    tracemalloc.start()
+
+    try:
+        result = stage(*arguments)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    measurement = {
+        "seconds": min(timings),
+        "mean_seconds": sum(timings) / len(timings),
+        "peak_bytes": peak
+    }
+
+    if isinstance(result, list):
+        measurement["count"] = len(result)
+
+    return measurement
+
+
+def build_record(host, rtype, ttl, data) -> Record:
+    record = Record()
+    record.host = host
+    record.type = rtype
+    record.ttl = ttl
+    record.data = data
+
+    return record
+
+
+def parse_line(line: str) -> Record:
+    record = Record()
+    record.raw = line
+
+    return record
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+from ..sync import diff_zone, external_diff_zone, resolve_destinations
+from ...zonebase import Provider, Record, Zone
+from typing import List, Optional
+
+
+# Raises if the on-disk diff plans different actions than the in-memory diff. A small run size is used so the records
+# are spread over several sorted runs.
+def check_external_diff(source_zone: Zone, destination_zone: Zone, source_provider: Provider, destination_provider: Provider, run_size: int = 1000):
+    expected = describe_actions(diff_zone(source_zone, destination_zone, source_provider, destination_provider))
+    actual = describe_actions(resolve_destinations(external_diff_zone(source_zone, destination_zone, source_provider, destination_provider, run_size), destination_zone, destination_provider))
+
+    if expected != actual:
+        missing = [a for a in expected if a not in actual]
+        extra = [a for a in actual if a not in expected]
+
+        raise Exception(f"External diff for {destination_provider.id} differs from the in-memory diff: {len(missing)} actions missing, {len(extra)} extra, first {(missing + extra)[:1]}")
+
+
+# Records are described by content, since ttls rebuilt from disk are written in seconds rather than as in the zone.
+def describe_actions(actions) -> List[str]:
+    return sorted(f"{type(a).__name__} {describe_record(getattr(a, 'source', None))} {describe_record(getattr(a, 'destination', None))}" for a in actions)
+
+
+def describe_record(record: Optional[Record]) -> str:
+    if record is None:
+        return "-"
+
+    return f"{record.host} {record.ttl.seconds if record.ttl else 0} IN {record.type} {record.data.normalized}"
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+from ...common import DnsRecordType
+from ...zonebase import Provider, Record, Zone
+from itertools import count
+from typing import Dict, List, Optional
+
+
+class MemoryProvider(Provider):
+    @property
+    def description(self) -> str:
+        return "In-memory provider used for benchmarks."
+
+    @property
+    def id(self) -> str:
+        return "memory"
+
+    def __init__(self):
+        # records are kept by id, so that updating and deleting one doesn't scan the whole zone
+        self.zones: Dict[str, Dict[int, Record]] = {}
+        self.__next_id = count(1)
+
+    def add_zone(self, domain: str, records: List[Record]) -> Zone:
+        self.zones[domain] = {}
+
+        for record in records:
+            self.create_record(domain, record)
+
+        return self.get_zone(domain)
+
+    def list_zones(self) -> List[str]:
+        return list(self.zones.keys())
+
+    def get_zone(self, zone: str) -> Optional[Zone]:
+        if zone not in self.zones:
+            return None
+
+        z = Zone()
+        z.domain = zone
+        z.records = list(self.zones[zone].values())
+
+        return z
+
+    def can_read_type(self, rtype: DnsRecordType) -> bool:
+        return rtype not in [DnsRecordType.SOA]
+
+    def can_write_type(self, rtype: DnsRecordType) -> bool:
+        return self.can_read_type(rtype)
+
+    def create_record(self, zone: str, record: Record) -> Record:
+        new_record = self.__copy_record(record)
+        new_record.id = next(self.__next_id)
+
+        self.zones[zone][new_record.id] = new_record
+
+        return new_record
+
+    def update_record(self, zone: str, record: Record, new_record: Record) -> Record:
+        stored = self.zones[zone][record.id]
+        stored.ttl = new_record.ttl
+        stored.data = new_record.data
+
+        return stored
+
+    def delete_record(self, zone: str, record: Record):
+        del self.zones[zone][record.id]
+
+    @staticmethod
+    def __copy_record(record: Record) -> Record:
+        new_record = Record()
+        new_record.host = record.host
+        new_record.type = record.type
+        new_record.ttl = record.ttl
+        new_record.data = record.data
+
+        return new_record
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+import contextlib
+import os
+import threading
+
+from .diff_check import check_external_diff
+from .memory_provider import MemoryProvider
+from ...mockserver import MockServer, MockStore
+from ...zonebase import Provider, Record
+from typing import Dict, Iterator, List, Optional
+
+# Credentials only need to exist, since every request goes to the mock server.
+mock_credentials = {
+    "CF_API_TOKEN": "benchmark",
+    "DO_API_TOKEN": "benchmark",
+    "GD_API_KEY": "benchmark",
+    "GD_API_SECRET": "benchmark",
+    "LINODE_API_TOKEN": "benchmark",
+    "NAMECOM_API_USERNAME": "benchmark",
+    "NAMECOM_API_PASSWORD": "benchmark"
+}
+
+
+# Starts one mock server for every count in a run, since each provider's API is created once and keeps the base url of
+# the first server it was pointed at.
+@contextlib.contextmanager
+def mock_api_server() -> Iterator[MockServer]:
+    server = MockServer("127.0.0.1", 0, {provider_id: MockStore() for provider_id in MockServer.env_vars})
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    # the mock server has no rate limit, so the counts aren't slowed down by a shared budget
+    environment = {**mock_credentials, "HTTP_RATE_LIMIT_DIR": None, **{env_var: f"{server.base_url}/{provider_id}/" for provider_id, env_var in server.env_vars.items()}}
+
+    try:
+        with patch_environment(environment):
+            yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+# Counts the requests each API provider makes to load one zone, first with the API's default page size and then with
+# the largest page size it allows. The loaded zone is then diffed against the changed records, to check that the
+# on-disk diff plans the same actions as the in-memory diff for each provider's records.
+def count_requests(server: MockServer, domain: str, records: List[Record], changed_records: List[Record]) -> Dict[str, Dict[str, int]]:
+    source_provider = MemoryProvider()
+    source_zone = source_provider.add_zone(domain, changed_records)
+
+    for store in server.stores.values():
+        with store.lock:
+            zone = store.add_zone(domain)
+            zone.records = []
+
+            for record in records:
+                store.add_record(zone, MockStore.make_record(record.host, record.type, record.ttl.seconds if record.ttl else None, data=f"{record.data}"))
+
+    providers = [p for p in Provider.get_all() if p.id in server.env_vars]
+    counts: Dict[str, Dict[str, int]] = {}
+
+    for provider in sorted(providers, key=lambda p: p.id):
+        counts[provider.id] = {}
+
+        for name, page_size in [("default_page_size", "0"), ("max_page_size", None)]:
+            with patch_environment({"HTTP_PAGE_SIZE": page_size}):
+                provider.clear_cache()
+                start = server.request_count
+                zone = provider.get_zone(domain)
+
+                if zone is None:
+                    raise Exception(f"Zone {domain} was not found in provider {provider.id}")
+
+                len(zone.records)
+                counts[provider.id][name] = server.request_count - start
+
+        check_external_diff(source_zone, zone, source_provider, provider)
+        provider.clear_cache()
+
+    return counts
+
+
+@contextlib.contextmanager
+def patch_environment(values: Dict[str, Optional[str]]) -> Iterator[None]:
+    previous = {key: os.environ.get(key) for key in values}
+
+    try:
+        for key, value in values.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
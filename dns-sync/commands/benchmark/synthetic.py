@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+import random
+import re
+
+from ...common import DnsRecordType
+from typing import Dict, List
+
+
+default_mix = "A=40,AAAA=15,CNAME=15,MX=5,TXT=15,SRV=10"
+
+
+def parse_mix(mix: str) -> Dict[DnsRecordType, int]:
+    weights: Dict[DnsRecordType, int] = {}
+
+    for part in mix.split(","):
+        if not part.strip():
+            continue
+
+        rtype, _, weight = part.partition("=")
+        weights[DnsRecordType.parse(rtype.strip())] = int(weight or 1)
+
+    if not weights or sum(weights.values()) <= 0:
+        raise ValueError(f"Invalid record type mix: {mix}")
+
+    return weights
+
+
+def generate_zone_lines(records: int, mix: Dict[DnsRecordType, int], round_robin: int = 4, txt_set: int = 8, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    total_weight = sum(mix.values())
+    lines = ["$TTL 1h"]
+
+    for rtype, weight in sorted(mix.items(), key=lambda m: m[0].name):
+        count = records * weight // total_weight
+
+        for index in range(count):
+            lines.append(generate_line(rtype, index, rng, round_robin, txt_set))
+
+    return lines
+
+
+def generate_line(rtype: DnsRecordType, index: int, rng: random.Random, round_robin: int, txt_set: int) -> str:
+    ttl = rng.choice(["", "300 ", "3600 ", "1d "])
+
+    if rtype == DnsRecordType.A:
+        return f"rr{index // max(round_robin, 1)} {ttl}IN A 10.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}"
+
+    if rtype == DnsRecordType.AAAA:
+        return f"v6-{index} {ttl}IN AAAA 2001:db8::{index:x}"
+
+    if rtype == DnsRecordType.CNAME:
+        return f"alias{index} {ttl}IN CNAME rr{rng.randrange(max(index, 1))}"
+
+    if rtype == DnsRecordType.MX:
+        return f"mx{index // 4} {ttl}IN MX {10 * (index % 4 + 1)} mail{index}.example.net."
+
+    if rtype == DnsRecordType.SRV:
+        return f"_svc{index // 4}._tcp {ttl}IN SRV {index % 4} {rng.randrange(100)} {5000 + index % 100} target{index}.example.net."
+
+    if rtype in (DnsRecordType.TXT, DnsRecordType.SPF):
+        value = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz0123456789=") for _ in range(rng.randrange(16, 200)))
+
+        return f'txt{index // max(txt_set, 1)} {ttl}IN {rtype} "{value}"'
+
+    return f"host{index} {ttl}IN {rtype} {index}"
+
+
+def mutate_zone_lines(lines: List[str], change_rate: float, seed: int = 0) -> List[str]:
+    rng = random.Random(seed + 1)
+    result = []
+
+    for index, line in enumerate(lines):
+        if line.startswith("$") or rng.random() >= change_rate:
+            result.append(line)
+            continue
+
+        action = rng.randrange(3)
+
+        # drop the record, change its ttl, or replace it with a brand new record
+        if action == 1:
+            result.append(re.sub("^(?P<host>[^\\s]+)\\s+([^\\s]+\\s+)??IN\\s", "\\g<host> 120 IN ", line))
+        elif action == 2:
+            result.append(f"new{index} IN A 192.0.2.{index % 256}")
+
+    return result
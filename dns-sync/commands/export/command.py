@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+
+from ..sync import prefetch_zones
+from ...commandbase import Command as BaseCommand
+from ...zonebase import Provider
+from argparse import Namespace, ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+
+class Command(BaseCommand):
+    def __init__(self):
+        self.providers: List[Provider] = Provider.get_all()
+
+    def populate_argument_parser(self, parser: ArgumentParser):
+        parser.description = "Export zones from a provider as zone files."
+
+        parser.add_argument(
+            metavar="provider",
+            dest="provider",
+            choices=sorted(p.id for p in self.providers),
+            help="dns provider to export from"
+        )
+
+        parser.add_argument(
+            "-z",
+            "--zone",
+            metavar="zone",
+            dest="zones",
+            action="append",
+            help="zones to export, or all if none specified"
+        )
+
+        parser.add_argument(
+            "-o",
+            "--output",
+            metavar="directory",
+            dest="output",
+            default="-",
+            help="directory to write zone files to, or - for standard output"
+        )
+
+        parser.add_argument(
+            "-j",
+            "--jobs",
+            metavar="jobs",
+            dest="jobs",
+            type=int,
+            default=8,
+            help="maximum number of zones to export concurrently"
+        )
+
+    def run(self, arguments: Namespace):
+        provider = next(p for p in self.providers if p.id == arguments.provider)
+        zones = sorted(arguments.zones or provider.list_zones())
+
+        if arguments.output == "-":
+            prefetch_zones(zones, [provider], arguments.jobs)
+
+            for zone in zones:
+                self.__export_stream(provider, zone, len(zones) > 1)
+
+            return
+
+        os.makedirs(arguments.output, exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=max(arguments.jobs, 1)) as executor:
+            futures = {zone: executor.submit(self.__export_file, provider, zone, arguments.output) for zone in zones}
+
+        for zone, future in futures.items():
+            if future.exception():
+                print(f"Could not export zone {zone}: {future.exception()}")
+
+    @staticmethod
+    def __export_stream(provider: Provider, zone: str, include_origin: bool):
+        z = provider.get_zone(zone)
+
+        if not z:
+            print(f"Zone {zone} does not exist in provider {provider.id}", file=sys.stderr)
+            return
+
+        if include_origin:
+            sys.stdout.write(f"$ORIGIN {z.domain}.\n")
+
+        z.write(sys.stdout)
+        sys.stdout.write("\n")
+
+    @staticmethod
+    def __export_file(provider: Provider, zone: str, output: str):
+        z = provider.get_zone(zone)
+
+        if not z:
+            print(f"Zone {zone} does not exist in provider {provider.id}")
+            return
+
+        path = os.path.join(output, f"{z.domain}.db")
+        temp_path = f"{path}.tmp"
+
+        # write to a temporary file first, so an interrupted export never leaves a partial zone file behind
+        with open(temp_path, "w") as f:
+            z.write(f)
+            f.write("\n")
+
+        os.replace(temp_path, path)
+
+        print(f"Exported zone {zone} to {path}")
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+from ...commandbase import Command as BaseCommand
+from ...mockserver import MockServer, MockStore
+from ...zonebase import Provider
+from argparse import Namespace, ArgumentParser
+from typing import List
+
+
+class Command(BaseCommand):
+    def __init__(self):
+        self.providers: List[Provider] = Provider.get_all()
+
+    def populate_argument_parser(self, parser: ArgumentParser):
+        parser.description = "Run a local stand-in for the provider APIs with in-memory zones."
+
+        parser.add_argument(
+            "--host",
+            metavar="host",
+            dest="host",
+            default="127.0.0.1",
+            help="address to listen on"
+        )
+
+        parser.add_argument(
+            "--port",
+            metavar="port",
+            dest="port",
+            type=int,
+            default=8053,
+            help="port to listen on"
+        )
+
+        parser.add_argument(
+            "--page-size",
+            metavar="size",
+            dest="page_size",
+            type=int,
+            help="maximum and default page size for paginated listings"
+        )
+
+        parser.add_argument(
+            "--latency",
+            metavar="seconds",
+            dest="latency",
+            type=float,
+            default=0,
+            help="delay added to every request"
+        )
+
+        parser.add_argument(
+            "--throttle-rate",
+            metavar="rate",
+            dest="throttle_rate",
+            type=float,
+            default=0,
+            help="fraction of requests to reject with 429"
+        )
+
+        parser.add_argument(
+            "--max-concurrency",
+            metavar="count",
+            dest="max_concurrency",
+            type=int,
+            default=0,
+            help="requests in flight above this count are rejected with 429"
+        )
+
+        parser.add_argument(
+            "--zones",
+            metavar="count",
+            dest="zones",
+            type=int,
+            default=0,
+            help="number of synthetic zones to create"
+        )
+
+        parser.add_argument(
+            "--records",
+            metavar="count",
+            dest="records",
+            type=int,
+            default=10,
+            help="number of synthetic A records per zone"
+        )
+
+        parser.add_argument(
+            "--seed",
+            metavar="provider",
+            dest="seed",
+            choices=sorted(p.id for p in self.providers),
+            help="copy zones from this provider on startup"
+        )
+
+    def run(self, arguments: Namespace):
+        seed_provider = next(p for p in self.providers if p.id == arguments.seed) if arguments.seed else None
+        stores = {}
+
+        # each provider gets its own store, just like separate accounts
+        for provider_id in MockServer.env_vars:
+            store = MockStore()
+
+            if seed_provider:
+                store.seed_provider(seed_provider)
+
+            if arguments.zones:
+                store.seed_synthetic(arguments.zones, arguments.records)
+
+            stores[provider_id] = store
+
+        server = MockServer(
+            arguments.host,
+            arguments.port,
+            stores,
+            page_size=arguments.page_size,
+            latency=arguments.latency,
+            throttle_rate=arguments.throttle_rate,
+            max_concurrency=arguments.max_concurrency
+        )
+
+        print(f"Serving {len(next(iter(stores.values())).zones)} zones per provider on {server.base_url}")
+
+        for provider_id, env_var in sorted(server.env_vars.items()):
+            print(f"{env_var}={server.base_url}/{provider_id}/")
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            print(f"Handled {server.request_count} requests, {server.throttled_count} throttled")
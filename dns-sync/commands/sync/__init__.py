@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
 
 from .command import Command
+from .external_diff import external_diff_zone, resolve_destinations
+from .fan_out import fan_out_zone
+from .journal import Journal, resume_zone
+from .pairing import pair_records, record_similarity
+from .plan import plan_zone, write_plan, read_plan, resolve_actions, zone_fingerprint
+from .prefetch import prefetch_zones
 from .sync_action import SyncAction, CreateSyncAction, DeleteSyncAction, UpdateSyncAction
-from .sync_zone import sync_zone
+from .sync_zone import sync_zone, get_zones, diff_zone, apply_actions
@@ -1,10 +1,20 @@
 #!/usr/bin/env python3
 
+import sys
+
 from ...commandbase import Command as BaseCommand
+from ...common import Deadline, DeadlineExceededError
+from ...httpbase import AdaptiveConcurrency
+from ...providers.zonefile import Provider as ZonefileProvider
 from ...zonebase import Provider
+from .external_diff import default_run_size
+from .fan_out import fan_out_zone
+from .journal import Journal, resume_zone
+from .plan import plan_zone, write_plan
+from .prefetch import prefetch_zones
 from .sync_zone import sync_zone
 from argparse import Namespace, ArgumentParser
-from typing import List
+from typing import Callable, Dict, List, Optional, Set
 
 
 class Command(BaseCommand):
@@ -26,9 +36,10 @@ class Command(BaseCommand):
 
         parser.add_argument(
             metavar="destination",
-            dest="destination",
+            dest="destinations",
             choices=destination_providers,
-            help="destination dns provider"
+            nargs="+",
+            help="destination dns providers"
         )
 
         parser.add_argument(
@@ -40,14 +51,240 @@ class Command(BaseCommand):
             help="zones to sync, or all if none specified"
         )
 
+        parser.add_argument(
+            "-j",
+            "--jobs",
+            metavar="jobs",
+            dest="jobs",
+            type=int,
+            default=8,
+            help="maximum number of zones to prefetch concurrently, or 0 to disable prefetching"
+        )
+
+        parser.add_argument(
+            "--source-zones",
+            dest="source_zones",
+            action="store_true",
+            help="sync all zones in the source provider instead of the destination providers"
+        )
+
+        parser.add_argument(
+            "--changed-since",
+            metavar="since",
+            dest="changed_since",
+            help="only sync zones whose zone files or includes changed since this git revision, or since a time given as @timestamp or @date"
+        )
+
+        parser.add_argument(
+            "--plan",
+            metavar="file",
+            dest="plan",
+            help="write the changes to this file instead of applying them"
+        )
+
+        parser.add_argument(
+            "--external-diff",
+            metavar="records",
+            dest="run_size",
+            type=int,
+            nargs="?",
+            const=default_run_size,
+            help=f"compare zones by sorting them on disk, holding at most this many records in memory at once (default {default_run_size})"
+        )
+
+        parser.add_argument(
+            "--journal",
+            metavar="file",
+            dest="journal",
+            help="record each change to this file as it's made, so an interrupted sync can be resumed"
+        )
+
+        parser.add_argument(
+            "--resume",
+            dest="resume",
+            action="store_true",
+            help="only make the changes the journal shows were not finished, without reading the source provider"
+        )
+
+        parser.add_argument(
+            "--stats",
+            dest="stats",
+            action="store_true",
+            help="print request statistics and the concurrency limit reached for each provider api when done"
+        )
+
+        parser.add_argument(
+            "--timeout",
+            metavar="seconds",
+            dest="timeout",
+            type=float,
+            help="stop the whole run after this many seconds, reporting unfinished zones as incomplete"
+        )
+
+        parser.add_argument(
+            "--zone-timeout",
+            metavar="seconds",
+            dest="zone_timeout",
+            type=float,
+            help="stop syncing a zone after this many seconds and move on to the next one"
+        )
+
     def run(self, arguments: Namespace):
+        try:
+            with Deadline(arguments.timeout).activate():
+                self.__run(arguments)
+        finally:
+            if arguments.stats:
+                self.__print_stats()
+
+    def __run(self, arguments: Namespace):
         source_provider = next(p for p in self.providers if p.id == arguments.source)
-        destination_provider = next(p for p in self.providers if p.id == arguments.destination)
+        destination_providers = [p for p in self.providers if p.id in arguments.destinations]
+
+        if arguments.plan and len(destination_providers) > 1:
+            raise ValueError("Only one destination provider can be used with --plan")
+
+        if arguments.run_size is not None and len(destination_providers) > 1:
+            raise ValueError("Only one destination provider can be used with --external-diff")
+
+        if arguments.journal and (arguments.plan or len(destination_providers) > 1):
+            raise ValueError("--journal can only be used when syncing to one destination provider without --plan")
 
-        if arguments.zones:
+        if arguments.resume and not arguments.journal:
+            raise ValueError("--resume requires --journal")
+
+        journal = Journal(arguments.journal) if arguments.journal else None
+
+        if arguments.resume:
+            zone_plans = {p["zone"]: p for p in journal.unfinished() if not arguments.zones or p["zone"] in arguments.zones}
+
+            print(f"{len(zone_plans)} zones to resume from {arguments.journal}")
+
+            incomplete = self.__each_zone(list(zone_plans), arguments.zone_timeout, lambda zone: resume_zone(zone_plans[zone], destination_providers[0], journal))
+            self.__report_incomplete(incomplete)
+            return
+
+        if journal:
+            if journal.unfinished():
+                raise ValueError(f"Journal {arguments.journal} has unfinished zones, use --resume to finish them first")
+
+            journal.reset()
+
+        if arguments.changed_since:
+            if not isinstance(source_provider, ZonefileProvider):
+                raise ValueError("--changed-since can only be used with the zonefile source provider")
+
+            changed_zones = source_provider.get_changed_zones(arguments.changed_since)
+            zones = [zone for zone in changed_zones if not arguments.zones or zone in arguments.zones]
+
+            print(f"{len(zones)} zones changed since {arguments.changed_since}")
+        elif arguments.zones:
             zones = arguments.zones
+        elif arguments.source_zones:
+            zones = sorted(source_provider.list_zones())
         else:
-            zones = destination_provider.list_zones()
+            zones = sorted(self.__list_zones(destination_providers))
+
+        # prefetching keeps every record of a zone in memory, which --external-diff is meant to avoid
+        if not arguments.run_size:
+            prefetch_zones(zones, [source_provider, *destination_providers], arguments.jobs)
+
+        if len(destination_providers) > 1:
+            self.__fan_out(zones, source_provider, destination_providers, arguments.zone_timeout)
+            return
+
+        destination_provider = destination_providers[0]
+
+        if arguments.plan:
+            zone_plans = []
+            incomplete = self.__each_zone(zones, arguments.zone_timeout, lambda zone: zone_plans.append(plan_zone(zone, source_provider, destination_provider, arguments.run_size)))
+
+            write_plan(arguments.plan, source_provider, destination_provider, [p for p in zone_plans if p])
+            print(f"Plan written to {arguments.plan}")
+        else:
+            incomplete = self.__each_zone(zones, arguments.zone_timeout, lambda zone: sync_zone(zone, source_provider, destination_provider, arguments.run_size, journal))
+
+        self.__report_incomplete(incomplete)
+
+    @staticmethod
+    def __print_stats():
+        for scope, concurrency in sorted(AdaptiveConcurrency.get_all().items()):
+            stats = concurrency.stats()
+
+            print(f"[{scope}] {stats['requests']} requests, {stats['throttled']} throttled, {stats['errors']} failed, {stats['mean_seconds'] * 1000:.1f} ms mean latency, concurrency limit {stats['limit']} (peak {stats['max_in_flight']} in flight)")
+
+    @staticmethod
+    def __report_incomplete(incomplete: List[str]):
+        if incomplete:
+            print(f"{len(incomplete)} zones are incomplete: {', '.join(incomplete)}")
+            sys.exit(1)
+
+    # Runs action for each zone under its own deadline, and returns the zones that ran out of time.
+    @staticmethod
+    def __each_zone(zones: List[str], zone_timeout: Optional[float], action: Callable[[str], None]) -> List[str]:
+        run_deadline = Deadline.current()
+        incomplete: List[str] = []
 
         for zone in sorted(zones):
-            sync_zone(zone, source_provider, destination_provider)
+            if run_deadline.expired:
+                incomplete.append(zone)
+                continue
+
+            try:
+                with run_deadline.within(zone_timeout).activate():
+                    action(zone)
+            except DeadlineExceededError as e:
+                print(f"Zone {zone} is incomplete: {e}")
+                incomplete.append(zone)
+
+        return incomplete
+
+    @staticmethod
+    def __list_zones(destination_providers: List[Provider]) -> Set[str]:
+        zones: Set[str] = set()
+
+        for provider in destination_providers:
+            try:
+                zones.update(provider.list_zones())
+            except Exception as e:
+                if len(destination_providers) == 1:
+                    raise
+
+                print(f"[{provider.id}] Could not list zones: {e}")
+
+        return zones
+
+    @staticmethod
+    def __fan_out(zones: List[str], source_provider: Provider, destination_providers: List[Provider], zone_timeout: Optional[float]):
+        failures: Dict[str, List[str]] = {p.id: [] for p in destination_providers}
+        run_deadline = Deadline.current()
+
+        for zone in sorted(zones):
+            if run_deadline.expired:
+                print(f"Zone {zone} is incomplete: Deadline passed")
+
+                for failed_zones in failures.values():
+                    failed_zones.append(zone)
+
+                continue
+
+            try:
+                with run_deadline.within(zone_timeout).activate():
+                    results = fan_out_zone(zone, source_provider, destination_providers)
+            except DeadlineExceededError as e:
+                # the source zone couldn't be loaded in time, so no destination was synced
+                print(f"Zone {zone} is incomplete: {e}")
+                results = {p.id: e for p in destination_providers}
+
+            for destination_id, error in results.items():
+                if error:
+                    failures[destination_id].append(zone)
+
+        for destination_id, failed_zones in failures.items():
+            if failed_zones:
+                print(f"[{destination_id}] Failed to sync {len(failed_zones)} zones: {', '.join(failed_zones)}")
+            else:
+                print(f"[{destination_id}] All zones synced")
+
+        if any(failures.values()):
+            sys.exit(1)
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+
+import heapq
+import json
+import os
+import tempfile
+
+from .pairing import pair_records
+from .sync_action import SyncAction, CreateSyncAction, DeleteSyncAction, UpdateSyncAction
+from itertools import groupby
+from ...zonebase import Provider, Record, Zone
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Tuple
+
+# Number of records sorted in memory at once before they are written to disk as a sorted run.
+default_run_size = 100000
+
+# (host, type, position in zone, ttl or -1, ttl comparison flags, data, id as json), so each host and type group keeps
+# the zone's order and its records still compare ttls the way the provider's records do
+RecordRow = Tuple[str, str, int, int, int, str, str]
+
+managed_ttl_flag = 1
+matches_managed_ttl_flag = 2
+
+
+# Produces the same actions as diff_zone, but streams both zones into sorted files on disk and merges them, so that only
+# one host and type group is held in memory at a time. Destination records in the returned actions are rebuilt from disk
+# with their ids, use resolve_destinations to swap in the provider's own records before applying them.
+def external_diff_zone(source_zone: Zone, destination_zone: Zone, source_provider: Provider, destination_provider: Provider, run_size: int = default_run_size) -> Iterator[SyncAction]:
+    with tempfile.TemporaryDirectory(prefix="dns-sync-diff-") as directory:
+        destination_records = enumerate(destination_zone.stream_records())
+        source_runs = write_runs(
+            ((p, r) for p, r in enumerate(source_zone.stream_records()) if destination_provider.can_write_type(r.type)),
+            os.path.join(directory, "source"),
+            run_size
+        )
+        destination_runs = write_runs(
+            ((p, r) for p, r in destination_records if source_provider.can_read_type(r.type) and destination_provider.can_write_type(r.type)),
+            os.path.join(directory, "destination"),
+            run_size
+        )
+
+        # actions are kept on disk by kind, since diff_zone returns every delete before every create and update
+        kinds = ["delete", "create", "update"]
+        spills = {kind: open(os.path.join(directory, f"{kind}.jsonl"), "w+") for kind in kinds}
+
+        try:
+            for source_rows, destination_rows in merge_groups(read_runs(source_runs), read_runs(destination_runs)):
+                pairs, creates, deletes = pair_records([row_record(r) for r in source_rows], [row_record(r) for r in destination_rows])
+
+                for source_record, destination_record in pairs:
+                    if source_record.data.normalized != destination_record.data.normalized or not destination_record.compare_ttl(source_record):
+                        write_row(spills["update"], [record_row(source_record), record_row(destination_record)])
+
+                for source_record in creates:
+                    write_row(spills["create"], [record_row(source_record)])
+
+                for destination_record in deletes:
+                    write_row(spills["delete"], [record_row(destination_record)])
+
+            for kind in kinds:
+                spills[kind].seek(0)
+
+                for line in spills[kind]:
+                    rows = [row_record(tuple(r)) for r in json.loads(line)]
+
+                    if kind == "delete":
+                        yield DeleteSyncAction(rows[0])
+                    elif kind == "create":
+                        yield CreateSyncAction(rows[0])
+                    else:
+                        yield UpdateSyncAction(rows[0], rows[1])
+        finally:
+            for spill in spills.values():
+                spill.close()
+
+
+# Swaps the rebuilt destination records of each action for the provider's own records, built from their ids so the
+# zone doesn't have to be listed again. Providers that can't change a record by id alone, and records without ids, are
+# found among the zone's records instead, which loads them all.
+def resolve_destinations(actions: Iterable[SyncAction], destination_zone: Zone, destination_provider: Provider) -> Iterator[SyncAction]:
+    by_id: Optional[Dict[str, Record]] = None
+    by_content: Dict[Tuple, List[Record]] = {}
+
+    for action in actions:
+        if isinstance(action, CreateSyncAction):
+            yield action
+            continue
+
+        rebuilt = action.destination
+        destination = destination_provider.get_planned_record(destination_zone.domain, rebuilt, rebuilt.id) if rebuilt.id is not None else None
+
+        if destination is None:
+            if by_id is None:
+                by_id = {}
+
+                for record in destination_zone.records:
+                    if getattr(record, "id", None) is not None:
+                        by_id[json.dumps(record.id)] = record
+                    else:
+                        by_content.setdefault(content_key(record), []).append(record)
+
+            candidates = by_content.get(content_key(rebuilt))
+            destination = by_id.pop(json.dumps(rebuilt.id), None) if rebuilt.id is not None else candidates.pop(0) if candidates else None
+
+        if destination is None:
+            print(f"Skipping {action}: record not found in destination")
+            continue
+
+        yield UpdateSyncAction(action.source, destination) if isinstance(action, UpdateSyncAction) else DeleteSyncAction(destination)
+
+
+def write_runs(records: Iterable[Tuple[int, Record]], prefix: str, run_size: int) -> List[str]:
+    paths: List[str] = []
+    rows: List[RecordRow] = []
+
+    def flush():
+        path = f"{prefix}.{len(paths)}.jsonl"
+
+        with open(path, "w") as f:
+            for row in sorted(rows):
+                write_row(f, row)
+
+        paths.append(path)
+        rows.clear()
+
+    for position, record in records:
+        rows.append(record_row(record, position))
+
+        if len(rows) >= max(run_size, 1):
+            flush()
+
+    if rows or not paths:
+        flush()
+
+    return paths
+
+
+def read_runs(paths: List[str]) -> Iterator[RecordRow]:
+    def read_run(path: str) -> Iterator[RecordRow]:
+        with open(path, "r") as f:
+            for line in f:
+                yield tuple(json.loads(line))
+
+    return heapq.merge(*(read_run(path) for path in paths))
+
+
+def merge_groups(source_rows: Iterator[RecordRow], destination_rows: Iterator[RecordRow]) -> Iterator[Tuple[List[RecordRow], List[RecordRow]]]:
+    source_groups = groupby(source_rows, key=group_key)
+    destination_groups = groupby(destination_rows, key=group_key)
+    source = next(source_groups, None)
+    destination = next(destination_groups, None)
+
+    while source is not None or destination is not None:
+        if destination is None or (source is not None and source[0] < destination[0]):
+            yield list(source[1]), []
+            source = next(source_groups, None)
+        elif source is None or destination[0] < source[0]:
+            yield [], list(destination[1])
+            destination = next(destination_groups, None)
+        else:
+            yield list(source[1]), list(destination[1])
+            source = next(source_groups, None)
+            destination = next(destination_groups, None)
+
+
+def group_key(row: RecordRow) -> Tuple[str, str]:
+    return row[0], row[1]
+
+
+def content_key(record: Record) -> Tuple:
+    return record.host, f"{record.type}", record.ttl.seconds if record.ttl else -1, record.data.normalized
+
+
+def record_row(record: Record, position: int = 0) -> RecordRow:
+    flags = (managed_ttl_flag if record.managed_ttl else 0) | (matches_managed_ttl_flag if record.matches_managed_ttl else 0)
+
+    return record.host, record.type.name, position, record.ttl.seconds if record.ttl else -1, flags, f"{record.data}", json.dumps(getattr(record, "id", None))
+
+
+def row_record(row: RecordRow) -> Record:
+    host, rtype, _, ttl, flags, data, record_id = row
+    record = Record()
+    record.host = host
+    record.type = rtype
+    record.ttl = None if ttl == -1 else ttl
+    record.managed_ttl = bool(flags & managed_ttl_flag)
+    record.matches_managed_ttl = bool(flags & matches_managed_ttl_flag)
+    record.data = data
+    record.id = json.loads(record_id)
+
+    return record
+
+
+def write_row(f: IO, row: Any):
+    f.write(json.dumps(row, separators=(",", ":")))
+    f.write("\n")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+import threading
+
+from .sync_zone import diff_zone, apply_actions
+from ...common import Deadline
+from ...zonebase import Provider, Zone
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+# print writes the message and its newline separately, so lines from different destinations are printed one at a time
+log_lock = threading.Lock()
+
+
+def fan_out_zone(zone: str, source_provider: Provider, destination_providers: List[Provider]) -> Dict[str, Optional[Exception]]:
+    source_zone = source_provider.get_zone(zone)
+
+    if not source_zone:
+        print(f"Zone {zone} does not exist in source provider {source_provider.id}")
+        return {}
+
+    for _ in source_zone.records:
+        # load the source records once, before any destination reads them
+        pass
+
+    results: Dict[str, Optional[Exception]] = {}
+    deadline = Deadline.current()
+
+    with ThreadPoolExecutor(max_workers=len(destination_providers)) as executor:
+        futures = {p.id: executor.submit(sync_destination, zone, source_zone, source_provider, p, make_log(p), deadline) for p in destination_providers}
+
+    for destination_id, future in futures.items():
+        results[destination_id] = future.exception()
+
+        if results[destination_id]:
+            print(f"[{destination_id}] Could not sync zone {zone}: {results[destination_id]}")
+
+    return results
+
+
+def sync_destination(zone: str, source_zone: Zone, source_provider: Provider, destination_provider: Provider, log: Callable[[str], None], deadline: Optional[Deadline] = None):
+    with (deadline or Deadline()).activate():
+        destination_zone = destination_provider.get_destination_zone(zone)
+
+        if not destination_zone:
+            log(f"Zone {zone} does not exist in destination provider {destination_provider.id}")
+            return
+
+        log(f"Syncing zone {zone} from {source_provider.id} to {destination_provider.id}")
+
+        sync_actions = diff_zone(source_zone, destination_zone, source_provider, destination_provider)
+
+        apply_actions(zone, sync_actions, destination_provider, log)
+
+
+def make_log(provider: Provider) -> Callable[[str], None]:
+    def log(message: str):
+        with log_lock:
+            print(f"[{provider.id}] {message}", flush=True)
+
+    return log
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+
+import json
+import os
+import threading
+
+from .plan import serialize_action, deserialize_record, resolve_actions, record_key, zone_fingerprint
+from .sync_action import SyncAction, CreateSyncAction, DeleteSyncAction, UpdateSyncAction
+from .sync_zone import apply_actions
+from ...zonebase import Provider, Record, TransactionProvider, Zone
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+
+# An append-only log of the actions planned for each zone and of each one as it's applied, so that a sync that dies
+# part way through can be resumed without diffing the zone again. Every entry is flushed to disk before moving on.
+class Journal:
+    def __init__(self, path: str):
+        self.path = path
+        self.__lock = threading.Lock()
+        self.__keys: Dict[int, str] = {}
+        self.__zones = set()
+
+    def reset(self):
+        with self.__lock:
+            open(self.path, "w").close()
+
+    def begin(self, zone: str, destination_zone: Zone, destination_provider: Provider, sync_actions: List[SyncAction]):
+        if not sync_actions:
+            return
+
+        actions = [serialize_action(a) for a in sync_actions]
+
+        self.__write({
+            "event": "plan",
+            "zone": zone,
+            "destination": destination_provider.id,
+            "fingerprint": zone_fingerprint(destination_zone),
+            "actions": actions
+        })
+
+        self.track(zone, sync_actions, actions)
+
+    # Remembers what each action looked like before it was applied, since applying it can change its records.
+    def track(self, zone: str, sync_actions: List[SyncAction], actions: Optional[List[Dict[str, Any]]] = None):
+        with self.__lock:
+            self.__zones.add(zone)
+
+            for sync_action, action in zip(sync_actions, actions or [serialize_action(a) for a in sync_actions]):
+                self.__keys[id(sync_action)] = action_key(action)
+
+    def done(self, zone: str, sync_action: SyncAction, record: Optional[Record] = None):
+        key = self.__keys.get(id(sync_action))
+
+        if key is None:
+            return
+
+        entry = {"event": "done", "zone": zone, "key": json.loads(key)}
+
+        if getattr(record, "id", None) is not None:
+            entry["id"] = record.id
+
+        self.__write(entry)
+
+    def complete(self, zone: str):
+        if zone not in self.__zones:
+            return
+
+        self.__write({"event": "complete", "zone": zone})
+
+    # Returns a plan for each zone that was started but not completed, holding only the actions that weren't done.
+    def unfinished(self) -> List[Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return []
+
+        zone_plans: Dict[str, Dict[str, Any]] = {}
+        done: Dict[str, Counter] = {}
+        created: Dict[str, List[Any]] = {}
+
+        with open(self.path, "r") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # the last line may be cut short if the sync was killed while writing it
+                    continue
+
+                zone = entry["zone"]
+
+                if entry["event"] == "plan":
+                    zone_plans[zone] = entry
+                    done[zone] = Counter()
+                    created[zone] = []
+                elif entry["event"] == "done" and zone in done:
+                    done[zone][json.dumps(entry["key"])] += 1
+
+                    if entry["key"][0] == "create" and "id" in entry:
+                        created[zone].append(entry["id"])
+                elif entry["event"] == "complete":
+                    zone_plans.pop(zone, None)
+
+        unfinished: List[Dict[str, Any]] = []
+
+        for zone, zone_plan in zone_plans.items():
+            remaining = []
+
+            for action in zone_plan["actions"]:
+                key = action_key(action)
+
+                if done[zone][key]:
+                    done[zone][key] -= 1
+                else:
+                    remaining.append(action)
+
+            unfinished.append({**zone_plan, "actions": remaining, "created": created[zone]})
+
+        return unfinished
+
+    def __write(self, entry: Dict[str, Any]):
+        with self.__lock:
+            with open(self.path, "a") as f:
+                f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+
+def resume_zone(zone_plan: Dict[str, Any], destination_provider: Provider, journal: Journal):
+    zone = zone_plan["zone"]
+
+    if zone_plan["destination"] != destination_provider.id:
+        raise ValueError(f"Zone {zone} was journaled for destination provider {zone_plan['destination']}, not {destination_provider.id}")
+
+    # this only looks the zone up, its records aren't listed unless the journal can't account for every action
+    destination_zone = destination_provider.get_destination_zone(zone)
+
+    if not destination_zone:
+        print(f"Zone {zone} does not exist in destination provider {destination_provider.id}")
+        return
+
+    print(f"Resuming zone {zone} on {destination_provider.id} with {len(zone_plan['actions'])} remaining actions")
+
+    sync_actions = journaled_actions(zone_plan, destination_provider)
+
+    if sync_actions is None:
+        # an action that was applied but not journaled before the sync died is skipped by checking the zone's current
+        # records, leaving out the records the journal shows this sync created
+        print(f"Listing zone {zone} to check for a change that was in flight when the sync stopped")
+        sync_actions = resolve_actions(zone_plan, destination_zone, zone_plan.get("created", []))
+
+    journal.track(zone, sync_actions)
+    apply_actions(zone, sync_actions, destination_provider, journal=journal)
+
+
+# Rebuilds the remaining actions from the plan and the ids in it, without listing the zone. The first remaining action
+# may have been in flight when the sync stopped, and only an update can safely be made again without checking, since it
+# sets a record to the same values by id, so anything else returns None. So do records planned without an id, and
+# transactional providers, which only ever commit whole zones.
+def journaled_actions(zone_plan: Dict[str, Any], destination_provider: Provider) -> Optional[List[SyncAction]]:
+    zone = zone_plan["zone"]
+    actions = zone_plan["actions"]
+
+    if isinstance(destination_provider, TransactionProvider) or (actions and actions[0]["action"] != "update"):
+        return None
+
+    sync_actions: List[SyncAction] = []
+
+    for action in actions:
+        if action["action"] == "create":
+            sync_actions.append(CreateSyncAction(deserialize_record(action["source"])))
+            continue
+
+        if "id" not in action["destination"]:
+            return None
+
+        destination = destination_provider.get_planned_record(zone, deserialize_record(action["destination"]), action["destination"]["id"])
+
+        if destination is None:
+            return None
+
+        if action["action"] == "update":
+            sync_actions.append(UpdateSyncAction(deserialize_record(action["source"]), destination))
+        else:
+            sync_actions.append(DeleteSyncAction(destination))
+
+    return sync_actions
+
+
+# Resumed actions are rebuilt from the plan, so their source records lose any ids they had in the source provider.
+def action_key(action: Dict[str, Any]) -> str:
+    source = action.get("source")
+    destination = action.get("destination")
+
+    return json.dumps([
+        action["action"],
+        source and record_key(source),
+        destination and record_key(destination),
+        destination and destination.get("id")
+    ])
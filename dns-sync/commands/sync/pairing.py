@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+from ...common import DnsRecordType
+from ...zonebase import Record
+from typing import Dict, List, Tuple
+
+# Groups with more candidate pairs than this are paired in sorted order instead of by similarity.
+max_scored_pairs = 250000
+
+
+def pair_records(source_records: List[Record], destination_records: List[Record]) -> Tuple[List[Tuple[Record, Record]], List[Record], List[Record]]:
+    source_records = sorted(source_records, key=record_order)
+    destination_records = sorted(destination_records, key=record_order)
+    pairs: List[Tuple[Record, Record]] = []
+    destination_by_data: Dict[str, List[Record]] = {}
+    leftover_sources: List[Record] = []
+
+    for record in destination_records:
+        destination_by_data.setdefault(record.data.normalized, []).append(record)
+
+    for source_record in source_records:
+        candidates = destination_by_data.get(source_record.data.normalized)
+
+        if not candidates:
+            leftover_sources.append(source_record)
+            continue
+
+        # prefer a duplicate that already has the right ttl, so no update is needed
+        destination_record = next((r for r in candidates if r.compare_ttl(source_record)), candidates[0])
+        candidates.remove(destination_record)
+        pairs.append((source_record, destination_record))
+
+    leftover_destinations = [r for r in destination_records if r in destination_by_data.get(r.data.normalized, [])]
+
+    if len(leftover_sources) * len(leftover_destinations) > max_scored_pairs:
+        paired = min(len(leftover_sources), len(leftover_destinations))
+        pairs.extend(zip(leftover_sources, leftover_destinations))
+
+        return pairs, leftover_sources[paired:], leftover_destinations[paired:]
+
+    scored = sorted(
+        (-record_similarity(s, d), si, di)
+        for si, s in enumerate(leftover_sources)
+        for di, d in enumerate(leftover_destinations)
+    )
+    used_sources = set()
+    used_destinations = set()
+
+    for _, si, di in scored:
+        if si in used_sources or di in used_destinations:
+            continue
+
+        used_sources.add(si)
+        used_destinations.add(di)
+        pairs.append((leftover_sources[si], leftover_destinations[di]))
+
+    creates = [r for i, r in enumerate(leftover_sources) if i not in used_sources]
+    deletes = [r for i, r in enumerate(leftover_destinations) if i not in used_destinations]
+
+    return pairs, creates, deletes
+
+
+def record_order(record: Record) -> Tuple[str, int]:
+    return record.data.normalized, record.ttl.seconds if record.ttl else 0
+
+
+def record_similarity(source: Record, destination: Record) -> int:
+    score = 1 if destination.compare_ttl(source) else 0
+    source_data = source.data
+    destination_data = destination.data
+
+    if source.type in [DnsRecordType.A, DnsRecordType.AAAA]:
+        if source_data.ip_address is None or destination_data.ip_address is None:
+            return score
+
+        if source_data.ip_address.version != destination_data.ip_address.version:
+            return score
+
+        # addresses in the same network are more likely to be replacements for each other
+        source_bits = int(source_data.ip_address)
+        destination_bits = int(destination_data.ip_address)
+        width = source_data.ip_address.max_prefixlen
+        common_bits = width - (source_bits ^ destination_bits).bit_length()
+
+        return score + 2 + common_bits * 8 // width
+
+    if source.type == DnsRecordType.MX:
+        return score + (4 if source_data.target == destination_data.target else 0) + (2 if source_data.priority == destination_data.priority else 0)
+
+    if source.type == DnsRecordType.SRV:
+        score += 4 if source_data.target == destination_data.target else 0
+        score += 2 if source_data.port == destination_data.port else 0
+        score += 1 if source_data.priority == destination_data.priority else 0
+        score += 1 if source_data.weight == destination_data.weight else 0
+
+        return score
+
+    if source.type in [DnsRecordType.TXT, DnsRecordType.SPF]:
+        # TXT values of the same kind usually start the same way, such as v=spf1 or a verification key name
+        source_prefix = source_data.normalized.split("=", 1)[0].split(" ", 1)[0]
+        destination_prefix = destination_data.normalized.split("=", 1)[0].split(" ", 1)[0]
+
+        return score + (4 if source_prefix == destination_prefix else 0)
+
+    return score
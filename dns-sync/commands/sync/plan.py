@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+
+import hashlib
+import json
+
+from .external_diff import external_diff_zone
+from .sync_action import SyncAction, CreateSyncAction, DeleteSyncAction, UpdateSyncAction
+from .sync_zone import get_zones, diff_zone
+from ...zonebase import Provider, Record, Zone
+from typing import Any, Dict, Iterable, List, Optional
+
+plan_version = 1
+
+
+def plan_zone(zone: str, source_provider: Provider, destination_provider: Provider, run_size: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    zones = get_zones(zone, source_provider, destination_provider)
+
+    if not zones:
+        return None
+
+    source_zone, destination_zone = zones
+
+    print(f"Planning zone {zone} from {source_provider.id} to {destination_provider.id}")
+
+    if run_size:
+        sync_actions = external_diff_zone(source_zone, destination_zone, source_provider, destination_provider, run_size)
+    else:
+        sync_actions = diff_zone(source_zone, destination_zone, source_provider, destination_provider)
+
+    actions: List[Dict[str, Any]] = []
+
+    for action in sync_actions:
+        print(action)
+        actions.append(serialize_action(action))
+
+    return {
+        "zone": zone,
+        "fingerprint": zone_fingerprint(destination_zone),
+        "actions": actions
+    }
+
+
+def write_plan(path: str, source_provider: Provider, destination_provider: Provider, zones: List[Dict[str, Any]]):
+    plan = {
+        "version": plan_version,
+        "source": source_provider.id,
+        "destination": destination_provider.id,
+        "zones": zones
+    }
+
+    with open(path, "w") as f:
+        json.dump(plan, f, separators=(",", ":"))
+
+
+def read_plan(path: str) -> Dict[str, Any]:
+    with open(path, "r") as f:
+        plan = json.load(f)
+
+    if plan.get("version") != plan_version:
+        raise ValueError(f"Unsupported plan version {plan.get('version')} in {path}")
+
+    return plan
+
+
+def zone_fingerprint(zone: Zone) -> str:
+    digest = hashlib.sha256()
+
+    for line in sorted(f"{getattr(r, 'id', '')}\t{r.host}\t{r.type}\t{r.ttl.seconds if r.ttl else ''}\t{r.data.normalized}" for r in zone.records):
+        digest.update(line.encode("utf-8"))
+        digest.update(b"\n")
+
+    return digest.hexdigest()
+
+
+def serialize_record(record: Record) -> Dict[str, Any]:
+    data = {
+        "host": record.host,
+        "type": f"{record.type}",
+        "ttl": record.ttl.seconds if record.ttl else None,
+        "data": f"{record.data}"
+    }
+
+    if getattr(record, "id", None) is not None:
+        data["id"] = record.id
+
+    return data
+
+
+def deserialize_record(data: Dict[str, Any]) -> Record:
+    record = Record()
+    record.host = data["host"]
+    record.type = data["type"]
+    record.ttl = data["ttl"]
+    record.data = data["data"]
+
+    return record
+
+
+def serialize_action(action: SyncAction) -> Dict[str, Any]:
+    if isinstance(action, CreateSyncAction):
+        return {"action": "create", "source": serialize_record(action.source)}
+
+    if isinstance(action, UpdateSyncAction):
+        return {"action": "update", "source": serialize_record(action.source), "destination": serialize_record(action.destination)}
+
+    if isinstance(action, DeleteSyncAction):
+        return {"action": "delete", "destination": serialize_record(action.destination)}
+
+    raise ValueError(f"Cannot serialize sync action {action}")
+
+
+# Records with created_ids were created by this plan already, so they don't count as a create having already been made.
+def resolve_actions(zone_plan: Dict[str, Any], destination_zone: Zone, created_ids: Iterable[Any] = ()) -> List[SyncAction]:
+    verify = zone_plan["fingerprint"] != zone_fingerprint(destination_zone)
+    by_id = {f"{r.id}": r for r in destination_zone.records if getattr(r, "id", None) is not None}
+    by_content = {}
+    created = {f"{i}" for i in created_ids}
+
+    for record in destination_zone.records:
+        if getattr(record, "id", None) is not None and f"{record.id}" in created:
+            continue
+
+        by_content.setdefault(record_key(serialize_record(record)), []).append(record)
+
+    if verify:
+        print(f"Zone {zone_plan['zone']} changed since it was planned, verifying each action")
+
+    sync_actions: List[SyncAction] = []
+
+    for action in zone_plan["actions"]:
+        if action["action"] == "create":
+            source = deserialize_record(action["source"])
+
+            if verify and record_key(action["source"]) in by_content:
+                print(f"Skipping {CreateSyncAction(source)}: record already exists")
+                continue
+
+            sync_actions.append(CreateSyncAction(source))
+            continue
+
+        destination = find_record(action["destination"], by_id, by_content)
+
+        if not destination or (verify and record_key(serialize_record(destination)) != record_key(action["destination"])):
+            print(f"Skipping {action['action']} of {deserialize_record(action['destination'])}: record changed since it was planned")
+            continue
+
+        if action["action"] == "update":
+            sync_actions.append(UpdateSyncAction(deserialize_record(action["source"]), destination))
+        else:
+            sync_actions.append(DeleteSyncAction(destination))
+
+    return sync_actions
+
+
+def find_record(data: Dict[str, Any], by_id: Dict[str, Record], by_content: Dict[str, List[Record]]) -> Optional[Record]:
+    if "id" in data:
+        return by_id.pop(f"{data['id']}", None)
+
+    # records without ids are matched by content, and each one can only be matched once
+    records = by_content.get(record_key(data))
+
+    return records.pop(0) if records else None
+
+
+def record_key(data: Dict[str, Any]) -> str:
+    return f"{data['host']}\t{data['type']}\t{data['ttl']}\t{data['data']}"
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+from ...common import Deadline
+from ...zonebase import Provider
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from threading import Lock
+from typing import ContextManager, Dict, List
+
+# Up to this many zones are looked up one by one, more than that and each provider's zone list is loaded instead.
+max_zone_lookups = 10
+
+
+def prefetch_zones(zones: List[str], providers: List[Provider], jobs: int):
+    if jobs < 1 or not zones:
+        return
+
+    deadline = Deadline.current()
+
+    # Without a loaded zone list, each lookup fills the provider's zone cache itself, so a provider's zones are
+    # prefetched one at a time to keep the lookups from racing to fill it.
+    locks: Dict[str, ContextManager] = {provider.id: Lock() for provider in providers}
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        if len(zones) > max_zone_lookups:
+            # Load each provider's zone list first so that record listings don't race to fetch it.
+            listed = [executor.submit(prefetch_zone_list, provider, deadline) for provider in providers]
+            wait(listed)
+
+            for provider, future in zip(providers, listed):
+                if future.result():
+                    locks[provider.id] = nullcontext()
+
+        wait([executor.submit(prefetch_zone, zone, provider, deadline, locks[provider.id]) for zone in zones for provider in providers])
+
+
+def prefetch_zone_list(provider: Provider, deadline: Deadline) -> bool:
+    if deadline.expired:
+        return False
+
+    try:
+        with deadline.activate():
+            provider.list_zones()
+
+        return True
+    except Exception as e:
+        print(f"Could not prefetch zones from provider {provider.id}: {e}")
+
+        return False
+
+
+def prefetch_zone(zone: str, provider: Provider, deadline: Deadline, lock: ContextManager):
+    # zones that weren't prefetched are still loaded when they're synced, if there's time left
+    if deadline.expired:
+        return
+
+    try:
+        with lock, deadline.activate():
+            provider.prefetch_zone(zone)
+    except Exception as e:
+        print(f"Could not prefetch zone {zone} from provider {provider.id}: {e}")
@@ -1,30 +1,62 @@
 #!/usr/bin/env python3
 
+from .external_diff import external_diff_zone, resolve_destinations
+from .pairing import pair_records
 from .sync_action import SyncAction, UpdateSyncAction, CreateSyncAction, DeleteSyncAction
-from ...common import DnsRecordType
-from ...zonebase import Provider, Record, TransactionProvider
-from typing import Dict, List, Tuple
+from ...common import Deadline, DeadlineExceededError, DnsRecordType
+from ...zonebase import Provider, Record, TransactionProvider, Zone
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 
-def sync_zone(zone: str, source_provider: Provider, destination_provider: Provider):
+def sync_zone(zone: str, source_provider: Provider, destination_provider: Provider, run_size: Optional[int] = None, journal=None):
+    zones = get_zones(zone, source_provider, destination_provider)
+
+    if not zones:
+        return
+
+    source_zone, destination_zone = zones
+
+    print(f"Syncing zone {zone} from {source_provider.id} to {destination_provider.id}")
+
+    if run_size:
+        # actions are applied as they're read back from disk, unless the journal needs the whole plan up front
+        sync_actions = resolve_destinations(external_diff_zone(source_zone, destination_zone, source_provider, destination_provider, run_size), destination_zone, destination_provider)
+
+        if journal:
+            sync_actions = list(sync_actions)
+    else:
+        sync_actions = diff_zone(source_zone, destination_zone, source_provider, destination_provider)
+
+    if journal:
+        journal.begin(zone, destination_zone, destination_provider, sync_actions)
+
+    apply_actions(zone, sync_actions, destination_provider, journal=journal)
+
+
+def get_zones(zone: str, source_provider: Provider, destination_provider: Provider) -> Optional[Tuple[Zone, Zone]]:
     source_zone = source_provider.get_zone(zone)
-    destination_zone = destination_provider.get_zone(zone)
+    destination_zone = destination_provider.get_destination_zone(zone)
 
     if not source_zone:
         print(f"Zone {zone} does not exist in source provider {source_provider.id}")
-        return
+        return None
 
     if not destination_zone:
         print(f"Zone {zone} does not exist in destination provider {destination_provider.id}")
-        return
+        return None
 
-    print(f"Syncing zone {zone} from {source_provider.id} to {destination_provider.id}")
+    return source_zone, destination_zone
 
+
+def diff_zone(source_zone: Zone, destination_zone: Zone, source_provider: Provider, destination_provider: Provider) -> List[SyncAction]:
     source_types: Dict[Tuple[str, DnsRecordType], List[Record]] = {}
     destination_types: Dict[Tuple[str, DnsRecordType], List[Record]] = {}
     sync_actions: List[SyncAction] = []
 
-    for record in source_zone.records:
+    # Start loading the destination first, so its pages keep arriving while the source index is built.
+    destination_records = destination_zone.iter_records()
+
+    for record in source_zone.iter_records():
         # Skip records from the source that the destination cannot write.
         if not destination_provider.can_write_type(record.type):
             continue
@@ -36,7 +68,7 @@ def sync_zone(zone: str, source_provider: Provider, destination_provider: Provid
 
         source_types[key].append(record)
 
-    for record in destination_zone.records:
+    for record in destination_records:
         # Skip records from the destination that the source cannot read.
         if not source_provider.can_read_type(record.type):
             continue
@@ -52,57 +84,70 @@ def sync_zone(zone: str, source_provider: Provider, destination_provider: Provid
 
         destination_types[key].append(record)
 
-    all_types: List[Tuple[str, DnsRecordType]] = [*set([*source_types.keys()] + [*destination_types.keys()])]
+    all_types: List[Tuple[str, DnsRecordType]] = sorted({*source_types.keys(), *destination_types.keys()}, key=lambda k: (k[0], k[1].name))
 
     for record_type in all_types:
         source_records = source_types[record_type] if record_type in source_types else []
         destination_records = destination_types[record_type] if record_type in destination_types else []
+        pairs, creates, deletes = pair_records(source_records, destination_records)
 
-        for source_record in [r for r in source_records]:
-            destination_record = next((r for r in destination_records if r.data.normalized == source_record.data.normalized), None)
+        for source_record, destination_record in pairs:
+            if source_record.data.normalized != destination_record.data.normalized or not destination_record.compare_ttl(source_record):
+                sync_actions.append(UpdateSyncAction(source_record, destination_record))
 
-            if destination_record:
-                if not destination_record.compare_ttl(source_record):
-                    sync_actions.append(UpdateSyncAction(source_record, destination_record))
+        for source_record in creates:
+            sync_actions.append(CreateSyncAction(source_record))
 
-                source_records.remove(source_record)
-                destination_records.remove(destination_record)
+        for destination_record in deletes:
+            sync_actions.append(DeleteSyncAction(destination_record))
 
-    for record_type in all_types:
-        source_records = source_types[record_type] if record_type in source_types else []
-        destination_records = destination_types[record_type] if record_type in destination_types else []
+    return sorted(sync_actions, key=sort_action)
 
-        for source_record in source_records:
-            destination_record = next(iter(destination_records), None)
 
-            if destination_record:
-                sync_actions.append(UpdateSyncAction(source_record, destination_record))
-                destination_records.remove(destination_record)
-                continue
+def apply_actions(zone: str, sync_actions: Iterable[SyncAction], destination_provider: Provider, log: Callable[[str], None] = print, journal=None):
+    deadline = Deadline.current()
+    applied = 0
 
-            sync_actions.append(CreateSyncAction(source_record))
+    # transactional providers only make changes when the zone is committed, so their actions can't be journaled one by one
+    journal_actions = journal if not isinstance(destination_provider, TransactionProvider) else None
 
-        for destination_record in destination_records:
-            sync_actions.append(DeleteSyncAction(destination_record))
+    try:
+        for action in sync_actions:
+            if deadline.expired:
+                # nothing is committed to transactional providers, other providers keep the actions applied so far
+                remaining = f"{len(sync_actions) - applied} " if isinstance(sync_actions, list) else ""
+                log(f"Deadline passed, cancelling {remaining}remaining actions")
+                raise DeadlineExceededError(f"Zone {zone} is incomplete")
 
-    for action in sorted(sync_actions, key=sort_action):
-        print(action)
+            log(f"{action}")
 
-        if isinstance(action, CreateSyncAction):
-            destination_provider.create_record(zone, action.source)
-            continue
+            record = None
 
-        if isinstance(action, UpdateSyncAction):
-            destination_provider.update_record(zone, action.destination, action.source)
-            continue
+            if isinstance(action, CreateSyncAction):
+                record = destination_provider.create_record(zone, action.source)
+            elif isinstance(action, UpdateSyncAction):
+                record = destination_provider.update_record(zone, action.destination, action.source)
+            elif isinstance(action, DeleteSyncAction):
+                destination_provider.delete_record(zone, action.destination)
 
-        if isinstance(action, DeleteSyncAction):
-            destination_provider.delete_record(zone, action.destination)
-            continue
+            if journal_actions:
+                journal_actions.done(zone, action, record)
+
+            applied += 1
+
+        if applied and isinstance(destination_provider, TransactionProvider):
+            log(f"Committing zone {zone} to provider {destination_provider.id}")
+            destination_provider.commit_zone(zone)
+    except Exception:
+        # a transactional provider's uncommitted changes, and the cached records they were made to, would otherwise be
+        # replayed by the next commit to the zone
+        if isinstance(destination_provider, TransactionProvider):
+            destination_provider.clear_cache()
+
+        raise
 
-    if sync_actions and isinstance(destination_provider, TransactionProvider):
-        print(f"Committing zone {zone} to provider {destination_provider.id}")
-        destination_provider.commit_zone(zone)
+    if journal:
+        journal.complete(zone)
 
 
 def sort_action(action: SyncAction) -> int:
@@ -0,0 +1,4 @@
+#!/usr/bin/env python3
+
+from .command import Command
+from .watcher import Watcher, InotifyWatcher, PollingWatcher
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+import os
+import time
+
+from .watcher import Watcher
+from ..sync import sync_zone, fan_out_zone
+from ...commandbase import Command as BaseCommand
+from ...providers.zonefile import Provider as ZonefileProvider
+from ...zonebase import Provider
+from argparse import Namespace, ArgumentParser
+from typing import List
+
+
+class Command(BaseCommand):
+    def __init__(self):
+        self.providers: List[Provider] = Provider.get_all()
+
+    def populate_argument_parser(self, parser: ArgumentParser):
+        parser.description = "Watch the zone file repository and sync zones as they change."
+
+        destination_providers = sorted(p.id for p in self.providers if not p.read_only)
+
+        parser.add_argument(
+            metavar="destination",
+            dest="destinations",
+            choices=destination_providers,
+            nargs="+",
+            help="destination dns providers"
+        )
+
+        parser.add_argument(
+            "-z",
+            "--zone",
+            metavar="zone",
+            dest="zones",
+            action="append",
+            help="zones to watch, or all zone files if none specified"
+        )
+
+        parser.add_argument(
+            "--poll-interval",
+            metavar="seconds",
+            dest="poll_interval",
+            type=float,
+            default=2,
+            help="how often to check for changes when inotify is unavailable"
+        )
+
+        parser.add_argument(
+            "--settle",
+            metavar="seconds",
+            dest="settle",
+            type=float,
+            default=0.5,
+            help="wait this long after a change for further changes before syncing"
+        )
+
+        parser.add_argument(
+            "--refresh-interval",
+            metavar="seconds",
+            dest="refresh_interval",
+            type=float,
+            default=3600,
+            help="reload destination zones this often to pick up changes made elsewhere"
+        )
+
+    def run(self, arguments: Namespace):
+        source_provider = ZonefileProvider()
+        destination_providers = [p for p in self.providers if p.id in arguments.destinations]
+        watcher = Watcher.create(arguments.poll_interval)
+
+        print(f"Watching {os.path.abspath(os.environ.get('ZONEFILE_PATH', '.'))} using {watcher.__class__.__name__}")
+
+        index = source_provider.get_include_index()
+        zones = [zone for zone in sorted(source_provider.list_zones()) if not arguments.zones or zone in arguments.zones]
+
+        watcher.watch([os.environ.get("ZONEFILE_PATH", "."), *index.get_files()])
+        self.__sync(zones, source_provider, destination_providers)
+
+        last_refresh = time.monotonic()
+
+        try:
+            while True:
+                changed = watcher.wait(arguments.poll_interval)
+
+                if not changed:
+                    if time.monotonic() - last_refresh >= arguments.refresh_interval:
+                        for provider in destination_providers:
+                            provider.clear_cache()
+
+                        last_refresh = time.monotonic()
+
+                    continue
+
+                # editors often write a file in several steps, so collect everything that changes together
+                while True:
+                    more = watcher.wait(arguments.settle)
+
+                    if not more:
+                        break
+
+                    changed |= more
+
+                # zone files that were just created aren't in the index until it's updated
+                index = source_provider.get_include_index()
+                changed_zones = sorted(z for z in index.get_zones(changed) if not arguments.zones or z in arguments.zones)
+
+                watcher.watch(list(index.get_files()))
+
+                if changed_zones:
+                    self.__sync(changed_zones, source_provider, destination_providers)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            watcher.close()
+
+    @staticmethod
+    def __sync(zones: List[str], source_provider: Provider, destination_providers: List[Provider]):
+        for zone in zones:
+            failed: List[Provider] = []
+
+            try:
+                if len(destination_providers) == 1:
+                    sync_zone(zone, source_provider, destination_providers[0])
+                else:
+                    results = fan_out_zone(zone, source_provider, destination_providers)
+                    failed = [p for p in destination_providers if results.get(p.id)]
+            except Exception as e:
+                print(f"Could not sync zone {zone}: {e}")
+                failed = destination_providers
+
+            # a failed sync can leave a destination's cache, and a transactional provider's pending changes, out of step
+            # with the zone, so it's reloaded before the next sync
+            for provider in failed:
+                provider.clear_cache()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+
+from abc import ABC, abstractmethod
+from typing import Dict, List, Set, Tuple
+
+
+class Watcher(ABC):
+    @abstractmethod
+    def watch(self, paths: List[str]):
+        pass
+
+    @abstractmethod
+    def wait(self, timeout: float) -> Set[str]:
+        pass
+
+    def close(self):
+        pass
+
+    # directories are watched rather than files, so that editors that replace files are still noticed
+    @staticmethod
+    def get_directories(paths: List[str]) -> Set[str]:
+        return {p if os.path.isdir(p) else os.path.dirname(p) for p in (os.path.abspath(p) for p in paths)}
+
+    @staticmethod
+    def create(interval: float) -> Watcher:
+        try:
+            return InotifyWatcher()
+        except OSError:
+            return PollingWatcher(interval)
+
+
+class InotifyWatcher(Watcher):
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_NONBLOCK = 0o4000
+
+    event_header = struct.Struct("iIII")
+
+    def __init__(self):
+        library = ctypes.util.find_library("c")
+
+        if not library:
+            raise OSError("libc is not available")
+
+        self.__libc = ctypes.CDLL(library, use_errno=True)
+
+        if not hasattr(self.__libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+
+        self.__fd = self.__libc.inotify_init1(self.IN_NONBLOCK)
+
+        if self.__fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.__directories: Dict[int, str] = {}
+
+    def watch(self, paths: List[str]):
+        mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_FROM | self.IN_MOVED_TO | self.IN_CREATE | self.IN_DELETE
+
+        for directory in self.get_directories(paths):
+            if directory in self.__directories.values():
+                continue
+
+            descriptor = self.__libc.inotify_add_watch(self.__fd, directory.encode("utf-8"), mask)
+
+            if descriptor < 0:
+                raise OSError(ctypes.get_errno(), f"Could not watch {directory}")
+
+            self.__directories[descriptor] = directory
+
+    def wait(self, timeout: float) -> Set[str]:
+        changed: Set[str] = set()
+        readable, _, _ = select.select([self.__fd], [], [], timeout)
+
+        if not readable:
+            return changed
+
+        data = os.read(self.__fd, 65536)
+        offset = 0
+
+        while offset + self.event_header.size <= len(data):
+            descriptor, _, _, length = self.event_header.unpack_from(data, offset)
+            offset += self.event_header.size
+            name = data[offset:offset + length].rstrip(b"\0").decode("utf-8", "replace")
+            offset += length
+
+            if descriptor in self.__directories and name:
+                changed.add(os.path.join(self.__directories[descriptor], name))
+
+        return changed
+
+    def close(self):
+        os.close(self.__fd)
+
+
+class PollingWatcher(Watcher):
+    def __init__(self, interval: float):
+        self.__interval = interval
+        self.__directories: Set[str] = set()
+        self.__state: Dict[str, Tuple[float, int]] = {}
+
+    def watch(self, paths: List[str]):
+        self.__directories.update(self.get_directories(paths))
+        self.__state = self.__snapshot()
+
+    def wait(self, timeout: float) -> Set[str]:
+        deadline = time.monotonic() + timeout
+
+        while True:
+            state = self.__snapshot()
+            changed = {p for p in set(state) | set(self.__state) if state.get(p) != self.__state.get(p)}
+            self.__state = state
+
+            if changed:
+                return changed
+
+            remaining = deadline - time.monotonic()
+
+            if remaining <= 0:
+                return set()
+
+            time.sleep(min(self.__interval, remaining))
+
+    def __snapshot(self) -> Dict[str, Tuple[float, int]]:
+        state: Dict[str, Tuple[float, int]] = {}
+
+        for directory in self.__directories:
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+
+            with entries:
+                for entry in entries:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        state[entry.path] = (stat.st_mtime, stat.st_size)
+
+        return state
@@ -2,3 +2,5 @@
 
 from .dns_record_type import DnsRecordType
 from .time import Time
+from .background import iter_in_background
+from .deadline import Deadline, DeadlineExceededError
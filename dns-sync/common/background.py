@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+import queue
+import threading
+
+from .deadline import Deadline
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+# Starts consuming items on a background thread right away, so that slow producers such as paged api listings keep
+# fetching while the caller is busy with the items it already has.
+def iter_in_background(items: Iterable[T], max_pending: int = 10000) -> Iterator[T]:
+    pending: queue.Queue = queue.Queue(maxsize=max_pending)
+    stopped = threading.Event()
+    done = object()
+
+    # the items are usually fetched over http, so they're bound by the caller's deadline
+    deadline = Deadline.current()
+
+    def put(item, error=None) -> bool:
+        while not stopped.is_set():
+            try:
+                pending.put((item, error), timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def produce():
+        try:
+            with deadline.activate():
+                for item in items:
+                    if not put(item):
+                        return
+        except Exception as e:
+            put(done, e)
+            return
+
+        put(done)
+
+    threading.Thread(target=produce, name="iter_in_background", daemon=True).start()
+
+    return BackgroundIterator(pending, stopped, done)
+
+
+# Stops the producer once the items run out, or as soon as it's closed or garbage collected, so a caller that gives up
+# on the items, or never starts reading them, doesn't leave the producer fetching pages that nobody will read.
+class BackgroundIterator(Iterator[T]):
+    def __init__(self, pending: queue.Queue, stopped: threading.Event, done: object):
+        self.__pending = pending
+        self.__stopped = stopped
+        self.__done = done
+
+    def __next__(self) -> T:
+        if self.__stopped.is_set():
+            raise StopIteration
+
+        item, error = self.__pending.get()
+
+        if error is not None:
+            self.close()
+            raise error
+
+        if item is self.__done:
+            self.close()
+            raise StopIteration
+
+        return item
+
+    def close(self):
+        self.__stopped.set()
+
+    def __del__(self):
+        self.close()
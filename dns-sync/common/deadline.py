@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+
+from typing import Iterator, Optional
+
+
+class DeadlineExceededError(Exception):
+    pass
+
+
+# A point in time that work has to finish by, or no limit at all. The active deadline is kept per thread, so http
+# requests made anywhere below a sync can be cut short without passing it through every call.
+class Deadline:
+    __local = threading.local()
+
+    def __init__(self, seconds: Optional[float] = None):
+        self.expires: Optional[float] = time.monotonic() + seconds if seconds is not None else None
+
+    @property
+    def remaining(self) -> Optional[float]:
+        if self.expires is None:
+            return None
+
+        return max(0.0, self.expires - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.expires is not None and time.monotonic() >= self.expires
+
+    def check(self, message: str = "Deadline passed"):
+        if self.expired:
+            raise DeadlineExceededError(message)
+
+    def cap(self, seconds: float) -> float:
+        remaining = self.remaining
+
+        # requests treats a timeout of 0 as invalid, so an expired deadline still gets a tiny timeout
+        return seconds if remaining is None else max(min(seconds, remaining), 0.001)
+
+    def within(self, seconds: Optional[float]) -> Deadline:
+        deadline = Deadline(seconds)
+
+        if self.expires is not None and (deadline.expires is None or self.expires < deadline.expires):
+            deadline.expires = self.expires
+
+        return deadline
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator[Deadline]:
+        previous = getattr(Deadline.__local, "current", None)
+        Deadline.__local.current = self
+
+        try:
+            yield self
+        finally:
+            Deadline.__local.current = previous
+
+    @staticmethod
+    def current() -> Deadline:
+        return getattr(Deadline.__local, "current", None) or Deadline()
@@ -1,3 +1,6 @@
 #!/usr/bin/env python3
 
-from .http import HttpMethod, HttpRequest, Http, HttpStatic
+from .concurrency import AdaptiveConcurrency
+from .rate_limit import SharedRateLimit
+from .http import HttpMethod, HttpNotFoundError, HttpRequest, Http, HttpStatic
+from .transport import Transport, RequestsTransport, RecordingTransport, ReplayTransport
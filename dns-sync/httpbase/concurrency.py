@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import contextlib
+import os
+import threading
+
+from ..common import Deadline, DeadlineExceededError
+from typing import Any, Dict, Iterator, Optional
+
+
+# Limits the requests in flight to one provider, raising the limit by one for each window of healthy responses and
+# halving it when the provider throttles, fails or slows down. Every provider has its own limit, since rate limits
+# differ between providers and even between accounts with the same provider.
+class AdaptiveConcurrency:
+    __scopes: Dict[str, AdaptiveConcurrency] = {}
+    __scopes_lock = threading.Lock()
+
+    # latency is smoothed over roughly the last 1 / latency_smoothing responses
+    latency_smoothing = 0.2
+
+    # latency this many times the best seen so far counts as the provider slowing down
+    latency_tolerance = 2.0
+
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 32):
+        self.minimum = minimum
+        self.maximum = max(maximum, minimum)
+        self.limit: float = min(max(initial, minimum), self.maximum)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        self.decreases = 0
+        self.total_seconds = 0.0
+        self.latency: Optional[float] = None
+        self.baseline: Optional[float] = None
+        self.__condition = threading.Condition()
+        self.__since_decrease = 0
+
+    @staticmethod
+    def for_scope(scope: str) -> AdaptiveConcurrency:
+        with AdaptiveConcurrency.__scopes_lock:
+            if scope not in AdaptiveConcurrency.__scopes:
+                AdaptiveConcurrency.__scopes[scope] = AdaptiveConcurrency(
+                    initial=int(os.environ.get("HTTP_CONCURRENCY") or 4),
+                    maximum=int(os.environ.get("HTTP_MAX_CONCURRENCY") or 32)
+                )
+
+            return AdaptiveConcurrency.__scopes[scope]
+
+    @staticmethod
+    def get_all() -> Dict[str, AdaptiveConcurrency]:
+        with AdaptiveConcurrency.__scopes_lock:
+            return dict(AdaptiveConcurrency.__scopes)
+
+    @contextlib.contextmanager
+    def slot(self) -> Iterator[None]:
+        deadline = Deadline.current()
+
+        with self.__condition:
+            while self.in_flight >= int(self.limit):
+                if deadline.expired:
+                    raise DeadlineExceededError("Deadline passed while waiting to send a request")
+
+                self.__condition.wait(timeout=deadline.cap(1))
+
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            yield
+        finally:
+            with self.__condition:
+                self.in_flight -= 1
+                self.__condition.notify()
+
+    def record(self, seconds: float, status: Optional[int]):
+        with self.__condition:
+            self.requests += 1
+            self.total_seconds += seconds
+            self.__since_decrease += 1
+
+            if status == 429:
+                self.throttled += 1
+                self.__decrease()
+            elif status is None or status >= 500:
+                self.errors += 1
+                self.__decrease()
+            else:
+                self.latency = seconds if self.latency is None else self.latency + (seconds - self.latency) * self.latency_smoothing
+
+                # the baseline follows the best latency down right away, but only creeps up, so slow periods still stand out
+                self.baseline = self.latency if self.baseline is None else min(self.latency, self.baseline + (self.latency - self.baseline) * 0.01)
+
+                # only a limit that's actually being reached can be blamed for slow responses or shown to go higher,
+                # otherwise latency just reflects the mix of requests being made
+                if self.in_flight >= self.limit - 1:
+                    if self.latency > self.baseline * self.latency_tolerance:
+                        self.__decrease()
+                    else:
+                        self.limit = min(self.limit + 1 / self.limit, self.maximum)
+
+            self.__condition.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        with self.__condition:
+            return {
+                "limit": int(self.limit),
+                "max_in_flight": self.max_in_flight,
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "errors": self.errors,
+                "decreases": self.decreases,
+                "mean_seconds": self.total_seconds / self.requests if self.requests else 0
+            }
+
+    def __decrease(self):
+        # responses to requests sent before the last decrease still reflect the old limit, so they don't count again
+        if self.__since_decrease < self.limit and self.decreases:
+            return
+
+        self.limit = max(self.limit / 2, self.minimum)
+        self.decreases += 1
+        self.__since_decrease = 0
+
+        # let the smoothed latency catch up with the new limit before judging it again
+        self.latency = self.baseline
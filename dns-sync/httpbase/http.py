@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import json
+import os
 import requests
+import time
 
+from .concurrency import AdaptiveConcurrency
+from .rate_limit import SharedRateLimit
+from .transport import Transport
+from ..common import Deadline, DeadlineExceededError
 from copy import deepcopy
 from enum import Enum, auto
-from typing import Any, ClassVar, Dict, Optional
+from typing import Any, ClassVar, Dict, Iterator, Optional, Tuple
 
 
 class HttpMethod(Enum):
@@ -43,6 +49,10 @@ class HttpMethod(Enum):
         ]
 
 
+class HttpNotFoundError(Exception):
+    pass
+
+
 class HttpRequest:
     def __init__(self, method: HttpMethod, url: str, params: Optional[Dict[str, str]] = None, headers: Optional[Dict[str, str]] = None, data: Any = None):
         self.method = method
@@ -50,6 +60,7 @@ class HttpRequest:
         self.params: Dict[str, str] = params or {}
         self.headers: Dict[str, str] = headers or {}
         self.data: Any = data
+        self.page: int = 1
 
 
 class Http:
@@ -61,6 +72,56 @@ class Http:
     def authorization(self) -> Optional[str]:
         return None
 
+    @property
+    def transport(self) -> Transport:
+        return Transport.get_default()
+
+    # Seconds to wait for a connection and for each read, from HTTP_CONNECT_TIMEOUT and HTTP_READ_TIMEOUT.
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        return float(os.environ.get("HTTP_CONNECT_TIMEOUT") or 10), float(os.environ.get("HTTP_READ_TIMEOUT") or 60)
+
+    @property
+    def scope(self) -> str:
+        return self.__class__.__module__.split(".")[-2]
+
+    # Requests per second the provider allows each account. Only enforced when HTTP_RATE_LIMIT_DIR is set, in which case
+    # every process on the host using the same account shares one budget. HTTP_RATE_LIMIT overrides it for every provider.
+    @property
+    def rate_limit(self) -> Optional[float]:
+        return None
+
+    @property
+    def shared_rate_limit(self) -> Optional[SharedRateLimit]:
+        directory = os.environ.get("HTTP_RATE_LIMIT_DIR")
+        rate = float(os.environ.get("HTTP_RATE_LIMIT") or 0) or self.rate_limit
+
+        if not directory or not rate:
+            return None
+
+        return SharedRateLimit.for_account(directory, self.scope, self.authorization, rate)
+
+    # Throttled requests are sent again this many times, after the delay the provider asks for.
+    @property
+    def max_retries(self) -> int:
+        return 3
+
+    # The largest page the API allows for paged listings, and the query parameter it is requested with.
+    @property
+    def max_page_size(self) -> Optional[int]:
+        return None
+
+    @property
+    def page_size_param(self) -> Optional[str]:
+        return None
+
+    # HTTP_PAGE_SIZE lowers the page size for a run, or 0 leaves it to the API's default.
+    @property
+    def page_size_override(self) -> Optional[int]:
+        value = os.environ.get("HTTP_PAGE_SIZE")
+
+        return int(value) if value else None
+
     def check_response(self, request: HttpRequest, response: requests.Response) -> Optional[Dict[str, Any]]:
         if 200 <= response.status_code < 300:
             try:
@@ -78,6 +139,11 @@ class Http:
             request.data = json.dumps(request.data)
             request.headers.setdefault("Content-Type", "application/json")
 
+        page_size = self.select_page_size(request)
+
+        if page_size and self.page_size_param:
+            request.params.setdefault(self.page_size_param, str(page_size))
+
         return request
 
     def mangle_paged_request(self, request: HttpRequest, page: int) -> HttpRequest:
@@ -85,29 +151,56 @@ class Http:
 
         return request
 
+    def mangle_cursor_request(self, request: HttpRequest, cursor: str) -> HttpRequest:
+        request.params["cursor"] = cursor
+
+        return request
+
     def mangle_response(self, request: HttpRequest, response: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         data = self.select_data(request, response)
-        pages = self.select_pages(request, response)
 
-        if pages is None or pages <= 1 or not isinstance(data, list):
+        if not isinstance(data, list):
             return data if data is not None else response
 
-        for page in range(2, pages + 1):
-            page_request = self.mangle_paged_request(deepcopy(request), page)
-            page_response = self.__send_internal(page_request)
-            page_data = self.select_data(request, page_response)
+        return data + list(self.__iter_pages(self.next_page_request(request, response)))
 
-            if page_data and isinstance(page_data, list):
-                data += page_data
+    def next_page_request(self, request: HttpRequest, response: Optional[Dict[str, Any]]) -> Optional[HttpRequest]:
+        # cursors and markers come from the previous response, so they take priority over page numbers
+        cursor = self.select_cursor(request, response)
 
-        return data
+        if cursor is not None:
+            return self.mangle_cursor_request(deepcopy(request), cursor)
+
+        pages = self.select_pages(request, response)
+
+        if pages is None or request.page >= pages:
+            return None
+
+        page_request = self.mangle_paged_request(deepcopy(request), request.page + 1)
+        page_request.page = request.page + 1
+
+        return page_request
 
     def select_data(self, request: HttpRequest, response: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         return None
 
+    def select_page_size(self, request: HttpRequest) -> Optional[int]:
+        if request.method != HttpMethod.GET or not self.max_page_size:
+            return None
+
+        override = self.page_size_override
+
+        if override is None:
+            return self.max_page_size
+
+        return min(override, self.max_page_size) if override > 0 else None
+
     def select_pages(self, request: HttpRequest, response: Optional[Dict[str, Any]]) -> Optional[int]:
         return None
 
+    def select_cursor(self, request: HttpRequest, response: Optional[Dict[str, Any]]) -> Optional[str]:
+        return None
+
     def __send_internal(self, request: HttpRequest) -> Optional[Dict[str, Any]]:
         kwargs = {}
 
@@ -118,10 +211,66 @@ class Http:
             kwargs["allow_redirects"] = True
 
         url = f"{self.base_url.rstrip('/')}/{request.url.lstrip('/')}" if self.base_url else request.url
-        response = requests.request(request.method.requests_name, url, params=request.params, headers=request.headers, **kwargs)
+        scope = self.scope
+        concurrency = AdaptiveConcurrency.for_scope(scope)
+        rate_limit = self.shared_rate_limit
+        deadline = Deadline.current()
+        attempt = 0
+
+        while True:
+            # a request never waits past the deadline of the zone or run that made it
+            deadline.check(f"Deadline passed before {request.method.name} {request.url}")
+            kwargs["timeout"] = tuple(deadline.cap(t) for t in self.timeout)
+
+            if rate_limit:
+                rate_limit.acquire()
+
+            with concurrency.slot():
+                start = time.monotonic()
+                status = None
+
+                try:
+                    response = self.transport.send(scope, request.method.requests_name, request.url, url, request.params, request.headers, **kwargs)
+                    status = response.status_code
+                except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                    # a read that times out while the body is downloaded is raised as a connection error instead
+                    if deadline.expired:
+                        raise DeadlineExceededError(f"Deadline passed during {request.method.name} {request.url}") from e
+
+                    raise
+                finally:
+                    concurrency.record(time.monotonic() - start, status)
+
+            if status == 429 and rate_limit:
+                rate_limit.drain()
+
+            if status != 429 or attempt >= self.max_retries:
+                break
+
+            attempt += 1
+            time.sleep(deadline.cap(self.retry_delay(response, attempt)))
 
         return self.check_response(request, response)
 
+    @staticmethod
+    def retry_delay(response: requests.Response, attempt: int) -> float:
+        try:
+            return float(response.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            return 2 ** (attempt - 1)
+
+    def __iter_pages(self, request: Optional[HttpRequest]) -> Iterator[Any]:
+        while request is not None:
+            response = self.__send_internal(request)
+            data = self.select_data(request, response)
+
+            if not data or not isinstance(data, list):
+                return
+
+            yield from data
+
+            request = self.next_page_request(request, response)
+
     def __send(self, request: HttpRequest) -> Optional[Dict[str, Any]]:
         request = self.mangle_request(request)
         data = self.__send_internal(request)
@@ -134,6 +283,19 @@ class Http:
     def get(self, url, params=None, headers=None):
         return self.__send(HttpRequest(HttpMethod.GET, url, params=params, headers=headers))
 
+    # Like get, but yields the items of a paged listing as each page arrives instead of returning them all at the end.
+    def iter_get(self, url, params=None, headers=None) -> Iterator[Any]:
+        request = self.mangle_request(HttpRequest(HttpMethod.GET, url, params=params, headers=headers))
+        response = self.__send_internal(request)
+        data = self.select_data(request, response)
+
+        if not isinstance(data, list):
+            yield data if data is not None else response
+            return
+
+        yield from data
+        yield from self.__iter_pages(self.next_page_request(request, response))
+
     def patch(self, url, params=None, headers=None, data=None):
         return self.__send(HttpRequest(HttpMethod.PATCH, url, params=params, headers=headers, data=data))
 
@@ -169,6 +331,10 @@ class HttpStatic:
             def get(cls, url, params=None, headers=None):
                 return cls.api.get(url, params=params, headers=headers)
 
+            @classmethod
+            def iter_get(cls, url, params=None, headers=None):
+                return cls.api.iter_get(url, params=params, headers=headers)
+
             @classmethod
             def patch(cls, url, params=None, headers=None, data=None):
                 return cls.api.patch(url, params=params, headers=headers, data=data)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import threading
+import time
+
+from ..common import Deadline, DeadlineExceededError
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:
+    # without file locks the budget is only shared between threads of this process
+    fcntl = None
+
+
+# A token bucket kept in a small file, so every process on the host using the same provider account draws from one
+# budget. The file is locked while it's read and written back, and tokens refill by the time elapsed since the last
+# update, so no process has to keep it topped up.
+class SharedRateLimit:
+    __instances: Dict[Tuple[str, float], SharedRateLimit] = {}
+    __instances_lock = threading.Lock()
+
+    # stay just under the provider's limit, since other clients of the account may not share the budget
+    headroom = 0.9
+
+    def __init__(self, path: str, rate: float):
+        self.path = path
+        self.rate = rate * self.headroom
+        self.capacity = max(1.0, self.rate)
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def for_account(directory: str, scope: str, credential: Optional[str], rate: float) -> SharedRateLimit:
+        # the credential is hashed so it never ends up in a file name
+        key = hashlib.sha256(f"{scope}\n{credential or ''}".encode("utf-8")).hexdigest()[:16]
+        path = os.path.join(directory, f"{scope}-{key}.bucket")
+
+        with SharedRateLimit.__instances_lock:
+            if (path, rate) not in SharedRateLimit.__instances:
+                os.makedirs(directory, exist_ok=True)
+                SharedRateLimit.__instances[(path, rate)] = SharedRateLimit(path, rate)
+
+            return SharedRateLimit.__instances[(path, rate)]
+
+    def acquire(self):
+        deadline = Deadline.current()
+
+        while True:
+            with self.__bucket() as bucket:
+                if bucket[0] >= 1:
+                    bucket[0] -= 1
+                    return
+
+                wait = (1 - bucket[0]) / self.rate
+
+            if deadline.expired:
+                raise DeadlineExceededError("Deadline passed while waiting for the rate limit")
+
+            time.sleep(deadline.cap(wait))
+
+    # Empties the bucket after the provider throttled a request, so every process sharing it backs off.
+    def drain(self):
+        with self.__bucket() as bucket:
+            bucket[0] = min(bucket[0], 0.0)
+
+    @contextlib.contextmanager
+    def __bucket(self) -> Iterator[List[float]]:
+        with self.__lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+
+            try:
+                if fcntl:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+
+                now = time.time()
+                tokens, updated = self.__parse(os.read(fd, 64), now)
+                bucket = [min(self.capacity, tokens + max(0.0, now - updated) * self.rate)]
+
+                yield bucket
+
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.ftruncate(fd, 0)
+                os.write(fd, f"{bucket[0]} {now}".encode("utf-8"))
+            finally:
+                os.close(fd)
+
+    def __parse(self, content: bytes, now: float) -> Tuple[float, float]:
+        try:
+            tokens, updated = content.decode("utf-8").split()
+
+            return float(tokens), min(float(updated), now)
+        except ValueError:
+            # a new or unreadable bucket starts full
+            return self.capacity, now
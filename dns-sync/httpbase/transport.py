@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import json
+import os
+import requests
+import threading
+import time
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+
+class Transport(ABC):
+    __default: Optional[Transport] = None
+    __default_lock = threading.Lock()
+
+    @abstractmethod
+    def send(self, scope: str, method: str, path: str, url: str, params: Dict[str, str], headers: Dict[str, str], **kwargs) -> requests.Response:
+        pass
+
+    @staticmethod
+    def get_default() -> Transport:
+        with Transport.__default_lock:
+            if not Transport.__default:
+                Transport.__default = Transport.from_environment()
+
+            return Transport.__default
+
+    @staticmethod
+    def set_default(transport: Optional[Transport]):
+        with Transport.__default_lock:
+            Transport.__default = transport
+
+    @staticmethod
+    def from_environment() -> Transport:
+        record_path = os.environ.get("HTTP_RECORD_PATH")
+        replay_path = os.environ.get("HTTP_REPLAY_PATH")
+
+        if record_path and replay_path:
+            raise ValueError("HTTP_RECORD_PATH and HTTP_REPLAY_PATH environment variables cannot both be specified.")
+
+        if record_path:
+            return RecordingTransport(record_path)
+
+        if replay_path:
+            return ReplayTransport(
+                replay_path,
+                latency=float(os.environ.get("HTTP_REPLAY_LATENCY", 0)),
+                rate_limit=float(os.environ.get("HTTP_REPLAY_RATE_LIMIT", 0))
+            )
+
+        return RequestsTransport()
+
+
+class RequestsTransport(Transport):
+    def __init__(self):
+        self.__local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        # sessions aren't safe to share between threads, so each thread keeps its own connection pool
+        if not hasattr(self.__local, "session"):
+            self.__local.session = requests.Session()
+
+        return self.__local.session
+
+    def send(self, scope: str, method: str, path: str, url: str, params: Dict[str, str], headers: Dict[str, str], **kwargs) -> requests.Response:
+        return self.session.request(method, url, params=params, headers=headers, **kwargs)
+
+
+class Interaction:
+    def __init__(self, scope: str, method: str, path: str, params: Dict[str, str], data: Optional[str]):
+        self.scope: str = scope
+        self.method: str = method
+        self.path: str = path.lstrip("/")
+        self.params: Dict[str, str] = params or {}
+        self.data: Optional[str] = data
+        self.status: int = 0
+        self.headers: Dict[str, str] = {}
+        self.body: str = ""
+
+    @property
+    def key(self) -> Tuple[str, str, str, str, Optional[str]]:
+        return self.scope, self.method, self.path, urlencode(sorted(self.params.items())), self.data
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "scope": self.scope,
+            "method": self.method,
+            "path": self.path,
+            "params": self.params,
+            "data": self.data,
+            "status": self.status,
+            "headers": self.headers,
+            "body": self.body
+        }
+
+    def to_response(self, url: str) -> requests.Response:
+        response = requests.Response()
+        response.status_code = self.status
+        response.headers.update(self.headers)
+        response.encoding = "utf-8"
+        response.url = url
+        response._content = self.body.encode("utf-8")
+
+        return response
+
+    @staticmethod
+    def from_json(value: Dict[str, Any]) -> Interaction:
+        interaction = Interaction(value["scope"], value["method"], value["path"], value.get("params"), value.get("data"))
+        interaction.status = value["status"]
+        interaction.headers = value.get("headers") or {}
+        interaction.body = value.get("body") or ""
+
+        return interaction
+
+    @staticmethod
+    def from_request(scope: str, method: str, path: str, params: Dict[str, str], kwargs: Dict[str, Any]) -> Interaction:
+        data = kwargs.get("data")
+
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+
+        return Interaction(scope, method, path, dict(params or {}), data)
+
+
+class RecordingTransport(Transport):
+    def __init__(self, path: str, transport: Optional[Transport] = None):
+        self.__path = path
+        self.__transport = transport or RequestsTransport()
+        self.__lock = threading.Lock()
+
+        # start with an empty cassette so that each run is recorded on its own
+        open(self.__path, "w").close()
+
+    def send(self, scope: str, method: str, path: str, url: str, params: Dict[str, str], headers: Dict[str, str], **kwargs) -> requests.Response:
+        response = self.__transport.send(scope, method, path, url, params, headers, **kwargs)
+        interaction = Interaction.from_request(scope, method, path, params, kwargs)
+        interaction.status = response.status_code
+        interaction.headers = dict(response.headers)
+        interaction.body = response.text
+
+        with self.__lock:
+            with open(self.__path, "a") as f:
+                f.write(json.dumps(interaction.to_json()) + "\n")
+
+        return response
+
+
+class ReplayTransport(Transport):
+    def __init__(self, path: str, latency: float = 0, rate_limit: float = 0):
+        self.__latency = latency
+        self.__interval = 1 / rate_limit if rate_limit > 0 else 0
+        self.__next_slot = 0.0
+        self.__lock = threading.Lock()
+        self.__interactions: Dict[Tuple[str, str, str, str, Optional[str]], List[Interaction]] = {}
+
+        with open(path, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+
+                interaction = Interaction.from_json(json.loads(line))
+
+                self.__interactions.setdefault(interaction.key, []).append(interaction)
+
+    def send(self, scope: str, method: str, path: str, url: str, params: Dict[str, str], headers: Dict[str, str], **kwargs) -> requests.Response:
+        key = Interaction.from_request(scope, method, path, params, kwargs).key
+
+        with self.__lock:
+            interactions = self.__interactions.get(key)
+
+            if not interactions:
+                raise Exception(f"No recorded response for {method.upper()} {path}")
+
+            # repeat the last response once a request has been replayed as many times as it was recorded
+            interaction = interactions.pop(0) if len(interactions) > 1 else interactions[0]
+
+            now = time.monotonic()
+            slot = max(now, self.__next_slot)
+            self.__next_slot = slot + self.__interval
+
+        delay = slot - now + self.__latency
+
+        if delay > 0:
+            time.sleep(delay)
+
+        return interaction.to_response(url)
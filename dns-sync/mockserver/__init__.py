@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+
+from .api import MockApi
+from .cloudflare import CloudflareMockApi
+from .digitalocean import DigitalOceanMockApi
+from .godaddy import GoDaddyMockApi
+from .linode import LinodeMockApi
+from .namecom import NamecomMockApi
+from .server import MockServer, MockRequestHandler
+from .store import MockStore, MockZone
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+from .store import MockStore
+from abc import ABC, abstractmethod
+from math import ceil
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class MockApi(ABC):
+    default_page_size = 100
+    max_page_size = 100
+    page_param = "page"
+    page_size_param = "per_page"
+
+    def __init__(self, store: MockStore, page_size: Optional[int] = None):
+        self.store = store
+        self.page_size = page_size
+
+    @abstractmethod
+    def handle(self, method: str, parts: List[str], query: Dict[str, str], body: Any, headers: Dict[str, str]) -> Tuple[int, Any]:
+        pass
+
+    @abstractmethod
+    def error(self, status: int, message: str) -> Tuple[int, Any]:
+        pass
+
+    def get_page_size(self, query: Dict[str, str]) -> int:
+        requested = int(query.get(self.page_size_param) or 0)
+        limit = self.page_size or self.max_page_size
+
+        if not requested:
+            requested = self.page_size or self.default_page_size
+
+        return max(1, min(requested, limit))
+
+    def get_page(self, items: List[Any], query: Dict[str, str]) -> Tuple[List[Any], int, int]:
+        size = self.get_page_size(query)
+        page = max(1, int(query.get(self.page_param) or 1))
+        pages = max(1, ceil(len(items) / size))
+
+        return items[(page - 1) * size:page * size], page, pages
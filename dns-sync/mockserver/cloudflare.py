@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+
+from .api import MockApi
+from .store import MockStore, MockZone
+from ..common import DnsRecordType
+from ..zonebase import Record, join_srv_host
+from typing import Any, Dict, List, Tuple
+
+
+class CloudflareMockApi(MockApi):
+    default_page_size = 100
+    max_page_size = 5000
+
+    def handle(self, method: str, parts: List[str], query: Dict[str, str], body: Any, headers: Dict[str, str]) -> Tuple[int, Any]:
+        if parts == ["zones"] and method == "GET":
+            zones = [z for z in self.store.zones.values() if not query.get("name") or z.domain == query["name"]]
+
+            return self.__paged([self.__zone_json(z) for z in zones], query)
+
+        if len(parts) < 3 or parts[0] != "zones" or parts[2] != "dns_records":
+            return self.error(404, "Route not found")
+
+        zone = self.store.get_zone(parts[1])
+
+        if not zone:
+            return self.error(404, "Zone not found")
+
+        if parts[3:] == ["export"] and method == "GET":
+            return 200, self.__export(zone)
+
+        if len(parts) == 3 and method == "GET":
+            return self.__paged([self.__record_json(zone, r) for r in zone.records], query)
+
+        if len(parts) == 3 and method == "POST":
+            record = self.store.add_record(zone, self.__parse_record(zone, body))
+
+            return 200, self.__envelope(self.__record_json(zone, record))
+
+        record = zone.get_record(parts[3]) if len(parts) == 4 else None
+
+        if not record:
+            return self.error(404, "Record not found")
+
+        if method == "PATCH":
+            new_record = self.__parse_record(zone, {"name": record.host, "type": f"{record.type}", **body})
+
+            with self.store.lock:
+                record.host = new_record.host
+                record.type = new_record.type
+                record.ttl = new_record.ttl
+                record.data = new_record.data
+
+            return 200, self.__envelope(self.__record_json(zone, record))
+
+        if method == "DELETE":
+            with self.store.lock:
+                zone.records.remove(record)
+
+            return 200, self.__envelope({"id": f"{record.id}"})
+
+        return self.error(405, "Method not allowed")
+
+    def error(self, status: int, message: str) -> Tuple[int, Any]:
+        return status, {"success": False, "errors": [{"code": status, "message": message}], "messages": [], "result": None}
+
+    def __paged(self, items: List[Any], query: Dict[str, str]) -> Tuple[int, Any]:
+        page_items, page, pages = self.get_page(items, query)
+        response = self.__envelope(page_items)
+        response["result_info"] = {
+            "page": page,
+            "per_page": self.get_page_size(query),
+            "count": len(page_items),
+            "total_count": len(items),
+            "total_pages": pages
+        }
+
+        return 200, response
+
+    @staticmethod
+    def __envelope(result: Any) -> Dict[str, Any]:
+        return {"success": True, "errors": [], "messages": [], "result": result}
+
+    @staticmethod
+    def __zone_json(zone: MockZone) -> Dict[str, Any]:
+        return {
+            "id": f"{zone.id}",
+            "name": zone.domain,
+            "status": "active",
+            "name_servers": ["ns1.mock.example", "ns2.mock.example"]
+        }
+
+    @staticmethod
+    def __record_json(zone: MockZone, record: Record) -> Dict[str, Any]:
+        data = {
+            "id": f"{record.id}",
+            "zone_id": f"{zone.id}",
+            "zone_name": zone.domain,
+            "name": zone.absolute_host(record.host),
+            "type": f"{record.type}",
+            "content": record.data.raw,
+            "proxied": False,
+            "ttl": record.ttl.seconds if record.ttl else 1
+        }
+
+        if record.type == DnsRecordType.MX:
+            data["content"] = record.data.target.rstrip(".") or "."
+            data["priority"] = record.data.priority
+
+        if record.type == DnsRecordType.SRV:
+            data["content"] = f"{record.data.weight} {record.data.port} {record.data.target.rstrip('.') or '.'}"
+            data["priority"] = record.data.priority
+
+        if record.type == DnsRecordType.CNAME:
+            data["content"] = record.data.target.rstrip(".") or "."
+
+        if record.type in [DnsRecordType.TXT, DnsRecordType.SPF]:
+            data["content"] = record.data.normalized
+
+        return data
+
+    @staticmethod
+    def __export(zone: MockZone) -> str:
+        lines = [
+            ";;",
+            f";; Domain:     {zone.domain}.",
+            ";;",
+            f"{zone.domain}.\t3600\tIN\tSOA\tns1.mock.example. dns.mock.example. (",
+            "\t\t2024010100 10000 2400 604800 3600 )"
+        ]
+
+        for record in zone.records:
+            ttl = record.ttl.seconds if record.ttl else 1
+            lines.append(f"{zone.absolute_host(record.host)}.\t{ttl}\tIN\t{record.type}\t{record.data} ; cf_tags=cf-proxied:false")
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def __parse_record(zone: MockZone, body: Dict[str, Any]) -> Record:
+        rtype = DnsRecordType.parse(body["type"])
+        ttl = None if body.get("ttl", 1) == 1 else body["ttl"]
+
+        if rtype == DnsRecordType.SRV and "data" in body:
+            srv = body["data"]
+            name = zone.relative_host(srv.get("name"))
+            host = join_srv_host(srv["service"], srv["proto"], name)
+            data = f"{srv['priority']} {srv['weight']} {srv['port']} {srv['target']}"
+
+            return MockStore.make_record(host, rtype, ttl, data=data)
+
+        host = zone.relative_host(body.get("name"))
+
+        if rtype in [DnsRecordType.TXT, DnsRecordType.SPF]:
+            return MockStore.make_record(host, rtype, ttl, text=body.get("content"))
+
+        if rtype == DnsRecordType.MX:
+            return MockStore.make_record(host, rtype, ttl, data=f"{body.get('priority') or 0} {body.get('content')}")
+
+        return MockStore.make_record(host, rtype, ttl, data=body.get("content"))
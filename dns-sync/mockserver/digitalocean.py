@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+from .api import MockApi
+from .store import MockStore, MockZone
+from ..common import DnsRecordType
+from ..zonebase import Record
+from typing import Any, Dict, List, Tuple
+
+
+class DigitalOceanMockApi(MockApi):
+    default_page_size = 20
+    max_page_size = 200
+
+    def handle(self, method: str, parts: List[str], query: Dict[str, str], body: Any, headers: Dict[str, str]) -> Tuple[int, Any]:
+        if parts == ["domains"] and method == "GET":
+            return self.__paged("domains", [self.__zone_json(z) for z in self.store.zones.values()], parts, query)
+
+        if len(parts) == 2 and parts[0] == "domains" and method == "GET":
+            zone = self.store.get_zone(parts[1])
+
+            return (200, {"domain": self.__zone_json(zone)}) if zone else self.error(404, "The resource you were accessing could not be found.")
+
+        if len(parts) < 3 or parts[0] != "domains" or parts[2] != "records":
+            return self.error(404, "The resource you were accessing could not be found.")
+
+        zone = self.store.get_zone(parts[1])
+
+        if not zone:
+            return self.error(404, "The resource you were accessing could not be found.")
+
+        if len(parts) == 3 and method == "GET":
+            return self.__paged("domain_records", [self.__record_json(r) for r in zone.records], parts, query)
+
+        if len(parts) == 3 and method == "POST":
+            record = self.store.add_record(zone, self.__parse_record(body))
+
+            return 201, {"domain_record": self.__record_json(record)}
+
+        record = zone.get_record(parts[3]) if len(parts) == 4 else None
+
+        if not record:
+            return self.error(404, "The resource you were accessing could not be found.")
+
+        if method == "PUT":
+            new_record = self.__parse_record({"name": record.host, "type": f"{record.type}", **body})
+
+            with self.store.lock:
+                record.host = new_record.host
+                record.ttl = new_record.ttl
+                record.data = new_record.data
+
+            return 200, {"domain_record": self.__record_json(record)}
+
+        if method == "DELETE":
+            with self.store.lock:
+                zone.records.remove(record)
+
+            return 204, None
+
+        return self.error(405, "Method not allowed")
+
+    def error(self, status: int, message: str) -> Tuple[int, Any]:
+        return status, {"id": "too_many_requests" if status == 429 else "not_found", "message": message}
+
+    def __paged(self, key: str, items: List[Any], parts: List[str], query: Dict[str, str]) -> Tuple[int, Any]:
+        page_items, page, pages = self.get_page(items, query)
+        response = {key: page_items, "links": {}, "meta": {"total": len(items)}}
+
+        if pages > 1:
+            path = "/".join(parts)
+            size = self.get_page_size(query)
+
+            response["links"]["pages"] = {
+                "first": f"{path}?page=1&per_page={size}",
+                "last": f"{path}?page={pages}&per_page={size}"
+            }
+
+        return 200, response
+
+    @staticmethod
+    def __zone_json(zone: MockZone) -> Dict[str, Any]:
+        return {"name": zone.domain, "ttl": 1800, "zone_file": ""}
+
+    @staticmethod
+    def __record_json(record: Record) -> Dict[str, Any]:
+        data = {
+            "id": record.id,
+            "type": f"{record.type}",
+            "name": record.host,
+            "data": record.data.raw,
+            "priority": record.data.priority,
+            "port": record.data.port,
+            "ttl": record.ttl.seconds if record.ttl else 1800,
+            "weight": record.data.weight,
+            "flags": None,
+            "tag": None
+        }
+
+        if record.data.target is not None:
+            data["data"] = record.data.target.rstrip(".") or "@"
+
+        if record.type in [DnsRecordType.TXT, DnsRecordType.SPF]:
+            data["data"] = record.data.normalized
+
+        return data
+
+    @staticmethod
+    def __parse_record(body: Dict[str, Any]) -> Record:
+        rtype = DnsRecordType.parse(body["type"])
+        host = body.get("name") or "@"
+        ttl = body.get("ttl")
+        value = body.get("data")
+
+        if rtype in [DnsRecordType.TXT, DnsRecordType.SPF]:
+            return MockStore.make_record(host, rtype, ttl, text=value)
+
+        if rtype == DnsRecordType.MX:
+            return MockStore.make_record(host, rtype, ttl, data=f"{body.get('priority') or 0} {value}")
+
+        if rtype == DnsRecordType.SRV:
+            return MockStore.make_record(host, rtype, ttl, data=f"{body.get('priority') or 0} {body.get('weight') or 0} {body.get('port') or 0} {value}")
+
+        return MockStore.make_record(host, rtype, ttl, data=value)
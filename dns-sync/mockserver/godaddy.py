@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+from .api import MockApi
+from .store import MockStore, MockZone
+from ..common import DnsRecordType
+from ..zonebase import Record, split_srv_host, join_srv_host
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class GoDaddyMockApi(MockApi):
+    default_page_size = 500
+    max_page_size = 500
+    page_size_param = "limit"
+
+    def handle(self, method: str, parts: List[str], query: Dict[str, str], body: Any, headers: Dict[str, str]) -> Tuple[int, Any]:
+        if parts == ["domains"] and method == "GET":
+            return 200, self.__zones_json(query)
+
+        if len(parts) == 2 and parts[0] == "domains" and method == "GET":
+            zone = self.store.get_zone(parts[1])
+
+            return (200, self.__zone_json(zone, True)) if zone else self.error(404, "Not found")
+
+        if len(parts) < 3 or parts[0] != "domains" or parts[2] != "records":
+            return self.error(404, "Not found")
+
+        zone = self.store.get_zone(parts[1])
+
+        if not zone:
+            return self.error(404, "The given domain is not registered, or does not have a zone file")
+
+        rtype = DnsRecordType.parse(parts[3]) if len(parts) > 3 else None
+        name = parts[4] if len(parts) > 4 else None
+
+        if method == "GET":
+            records = [r for r in zone.records if self.__in_group(r, rtype, name)]
+            offset = int(query.get("offset") or 0)
+            limit = self.get_page_size(query)
+
+            return 200, [self.__record_json(r) for r in records[offset:offset + limit]]
+
+        if method == "PUT":
+            new_records = [self.__parse_record({"type": f"{rtype}", "name": name, **item} if rtype else item) for item in body or []]
+
+            with self.store.lock:
+                zone.records = [r for r in zone.records if not self.__in_group(r, rtype, name)]
+
+                for record in new_records:
+                    self.store.add_record(zone, record)
+
+            return 200, None
+
+        if method == "DELETE" and name:
+            with self.store.lock:
+                zone.records = [r for r in zone.records if not self.__in_group(r, rtype, name)]
+
+            return 204, None
+
+        return self.error(405, "Method not allowed")
+
+    def error(self, status: int, message: str) -> Tuple[int, Any]:
+        return status, {"code": "TOO_MANY_REQUESTS" if status == 429 else "NOT_FOUND", "message": message}
+
+    def __zones_json(self, query: Dict[str, str]) -> List[Dict[str, Any]]:
+        zones = sorted(self.store.zones.values(), key=lambda z: z.domain)
+        marker = query.get("marker")
+
+        if marker:
+            zones = [z for z in zones if z.domain > marker]
+
+        zones = zones[:self.get_page_size(query)]
+
+        include_nameservers = "nameServers" in (query.get("includes") or "").split(",")
+
+        return [self.__zone_json(z, include_nameservers) for z in zones]
+
+    @staticmethod
+    def __zone_json(zone: MockZone, include_nameservers: bool) -> Dict[str, Any]:
+        data = {"domainId": zone.id, "domain": zone.domain, "status": "ACTIVE"}
+
+        if include_nameservers:
+            data["nameServers"] = ["ns01.domaincontrol.com", "ns02.domaincontrol.com"]
+
+        return data
+
+    @staticmethod
+    def __in_group(record: Record, rtype: Optional[DnsRecordType], name: Optional[str]) -> bool:
+        if rtype is not None and record.type != rtype:
+            return False
+
+        if name is not None and record.host != name:
+            return False
+
+        return True
+
+    @staticmethod
+    def __record_json(record: Record) -> Dict[str, Any]:
+        data = {
+            "type": f"{record.type}",
+            "name": record.host,
+            "data": record.data.raw,
+            "ttl": record.ttl.seconds if record.ttl else 3600
+        }
+
+        if record.data.target is not None:
+            data["data"] = record.data.target.rstrip(".") or "@"
+
+        if record.type in [DnsRecordType.TXT, DnsRecordType.SPF]:
+            data["data"] = record.data.normalized
+
+        if record.type in [DnsRecordType.MX, DnsRecordType.SRV]:
+            data["priority"] = record.data.priority
+
+        if record.type == DnsRecordType.SRV:
+            data["service"], data["protocol"], name = split_srv_host(record.host)
+            data["name"] = name or "@"
+            data["weight"] = record.data.weight
+            data["port"] = record.data.port
+
+        return data
+
+    @staticmethod
+    def __parse_record(body: Dict[str, Any]) -> Record:
+        rtype = DnsRecordType.parse(body["type"])
+        host = body.get("name") or "@"
+        ttl = body.get("ttl")
+        value = body.get("data")
+
+        if rtype == DnsRecordType.SRV:
+            host = join_srv_host(body.get("service"), body.get("protocol"), host)
+
+            return MockStore.make_record(host, rtype, ttl, data=f"{body.get('priority') or 0} {body.get('weight') or 0} {body.get('port') or 0} {value}")
+
+        if rtype in [DnsRecordType.TXT, DnsRecordType.SPF]:
+            return MockStore.make_record(host, rtype, ttl, text=value)
+
+        if rtype == DnsRecordType.MX:
+            return MockStore.make_record(host, rtype, ttl, data=f"{body.get('priority') or 0} {value}")
+
+        return MockStore.make_record(host, rtype, ttl, data=value)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+
+import json
+
+from .api import MockApi
+from .store import MockStore, MockZone
+from ..common import DnsRecordType
+from ..zonebase import Record, split_srv_host
+from typing import Any, Dict, List, Tuple
+
+
+class LinodeMockApi(MockApi):
+    default_page_size = 100
+    max_page_size = 500
+    page_size_param = "page_size"
+
+    def handle(self, method: str, parts: List[str], query: Dict[str, str], body: Any, headers: Dict[str, str]) -> Tuple[int, Any]:
+        if parts == ["domains"] and method == "GET":
+            domain = json.loads(headers.get("X-Filter") or "{}").get("domain")
+            zones = [z for z in self.store.zones.values() if not domain or z.domain == domain]
+
+            return self.__paged([self.__zone_json(z) for z in zones], query)
+
+        if len(parts) == 3 and parts[0] == "domains" and parts[2] == "zone-file" and method == "GET":
+            zone = self.store.get_zone(parts[1])
+
+            return (200, {"zone_file": self.__zone_file(zone)}) if zone else self.error(404, "Not found")
+
+        if len(parts) < 3 or parts[0] != "domains" or parts[2] != "records":
+            return self.error(404, "Not found")
+
+        zone = self.store.get_zone(parts[1])
+
+        if not zone:
+            return self.error(404, "Not found")
+
+        if len(parts) == 3 and method == "GET":
+            return self.__paged([self.__record_json(r) for r in zone.records], query)
+
+        if len(parts) == 3 and method == "POST":
+            record = self.store.add_record(zone, self.__parse_record(body))
+
+            return 200, self.__record_json(record)
+
+        record = zone.get_record(parts[3]) if len(parts) == 4 else None
+
+        if not record:
+            return self.error(404, "Not found")
+
+        if method == "PUT":
+            new_record = self.__parse_record({"name": record.host, "type": f"{record.type}", **body})
+
+            with self.store.lock:
+                record.host = new_record.host
+                record.ttl = new_record.ttl
+                record.data = new_record.data
+
+            return 200, self.__record_json(record)
+
+        if method == "DELETE":
+            with self.store.lock:
+                zone.records.remove(record)
+
+            return 200, {}
+
+        return self.error(405, "Method not allowed")
+
+    def error(self, status: int, message: str) -> Tuple[int, Any]:
+        return status, {"errors": [{"reason": message}]}
+
+    def __paged(self, items: List[Any], query: Dict[str, str]) -> Tuple[int, Any]:
+        page_items, page, pages = self.get_page(items, query)
+
+        return 200, {"data": page_items, "page": page, "pages": pages, "results": len(items)}
+
+    @staticmethod
+    def __zone_json(zone: MockZone) -> Dict[str, Any]:
+        return {
+            "id": zone.id,
+            "domain": zone.domain,
+            "soa_email": f"hostmaster@{zone.domain}",
+            "type": "master",
+            "status": "active"
+        }
+
+    @staticmethod
+    def __record_json(record: Record) -> Dict[str, Any]:
+        data = {
+            "id": record.id,
+            "name": "" if record.host == "@" else record.host,
+            "type": f"{record.type}",
+            "target": record.data.raw,
+            "priority": record.data.priority or 0,
+            "weight": record.data.weight or 0,
+            "port": record.data.port or 0,
+            "service": None,
+            "protocol": None,
+            "ttl_sec": record.ttl.seconds if record.ttl else 0,
+            "tag": None
+        }
+
+        if record.data.target is not None:
+            data["target"] = record.data.target.rstrip(".") or "."
+
+        if record.type in [DnsRecordType.TXT, DnsRecordType.SPF]:
+            data["target"] = record.data.normalized
+
+        if record.type == DnsRecordType.SRV:
+            service, protocol, _ = split_srv_host(record.host)
+            data["service"], data["protocol"] = service.lstrip("_"), protocol.lstrip("_")
+
+        return data
+
+    @staticmethod
+    def __parse_record(body: Dict[str, Any]) -> Record:
+        rtype = DnsRecordType.parse(body["type"])
+        host = body.get("name") or "@"
+        ttl = body.get("ttl_sec")
+        target = body.get("target")
+
+        if rtype in [DnsRecordType.TXT, DnsRecordType.SPF]:
+            return MockStore.make_record(host, rtype, ttl, text=target)
+
+        if rtype == DnsRecordType.MX:
+            return MockStore.make_record(host, rtype, ttl, data=f"{body.get('priority') or 0} {target}")
+
+        if rtype == DnsRecordType.SRV:
+            return MockStore.make_record(host, rtype, ttl, data=f"{body.get('priority') or 0} {body.get('weight') or 0} {body.get('port') or 0} {target}")
+
+        return MockStore.make_record(host, rtype, ttl, data=target)
+
+    @staticmethod
+    def __zone_file(zone: MockZone) -> List[str]:
+        lines = [
+            f"; {zone.domain} [{zone.id}]",
+            f"$ORIGIN {zone.domain}.",
+            "$TTL 86400",
+            f"@\tIN\tSOA\tns1.linode.com. admin.{zone.domain}. (",
+            "\t\t2024010100 14400 14400 1209600 86400 )"
+        ]
+
+        for record in zone.records:
+            ttl = f"\t{record.ttl.seconds}" if record.ttl else ""
+            lines.append(f"{record.host}{ttl}\tIN\t{record.type}\t{record.data}")
+
+        return lines
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+from .api import MockApi
+from .store import MockStore, MockZone
+from ..common import DnsRecordType
+from ..zonebase import Record
+from typing import Any, Dict, List, Tuple
+
+
+class NamecomMockApi(MockApi):
+    default_page_size = 1000
+    max_page_size = 1000
+    page_size_param = "perPage"
+
+    def handle(self, method: str, parts: List[str], query: Dict[str, str], body: Any, headers: Dict[str, str]) -> Tuple[int, Any]:
+        if parts == ["domains"] and method == "GET":
+            return self.__paged("domains", [self.__zone_json(z) for z in self.store.zones.values()], query)
+
+        if len(parts) == 2 and parts[0] == "domains" and method == "GET":
+            zone = self.store.get_zone(parts[1])
+
+            return (200, self.__zone_json(zone)) if zone else self.error(404, "Not Found")
+
+        if len(parts) < 3 or parts[0] != "domains" or parts[2] != "records":
+            return self.error(404, "Not Found")
+
+        zone = self.store.get_zone(parts[1])
+
+        if not zone:
+            return self.error(404, "Not Found")
+
+        if len(parts) == 3 and method == "GET":
+            return self.__paged("records", [self.__record_json(zone, r) for r in zone.records], query)
+
+        if len(parts) == 3 and method == "POST":
+            record = self.store.add_record(zone, self.__parse_record(body))
+
+            return 200, self.__record_json(zone, record)
+
+        record = zone.get_record(parts[3]) if len(parts) == 4 else None
+
+        if not record:
+            return self.error(404, "Not Found")
+
+        if method == "PUT":
+            new_record = self.__parse_record({"host": record.host, "type": f"{record.type}", **body})
+
+            with self.store.lock:
+                record.host = new_record.host
+                record.ttl = new_record.ttl
+                record.data = new_record.data
+
+            return 200, self.__record_json(zone, record)
+
+        if method == "DELETE":
+            with self.store.lock:
+                zone.records.remove(record)
+
+            return 200, {}
+
+        return self.error(405, "Method Not Allowed")
+
+    def error(self, status: int, message: str) -> Tuple[int, Any]:
+        return status, {"message": message, "details": f"mock server returned {status}"}
+
+    def __paged(self, key: str, items: List[Any], query: Dict[str, str]) -> Tuple[int, Any]:
+        page_items, page, pages = self.get_page(items, query)
+        response = {key: page_items}
+
+        if page < pages:
+            response["nextPage"] = page + 1
+
+        if pages > 1:
+            response["lastPage"] = pages
+
+        return 200, response
+
+    @staticmethod
+    def __zone_json(zone: MockZone) -> Dict[str, Any]:
+        return {"domainName": zone.domain, "locked": False, "autorenewEnabled": False}
+
+    @staticmethod
+    def __record_json(zone: MockZone, record: Record) -> Dict[str, Any]:
+        data = {
+            "id": record.id,
+            "domainName": zone.domain,
+            "fqdn": f"{zone.absolute_host(record.host)}.",
+            "type": f"{record.type}",
+            "answer": record.data.raw,
+            "ttl": record.ttl.seconds if record.ttl else 300
+        }
+
+        if record.host != "@":
+            data["host"] = record.host
+
+        if record.type == DnsRecordType.MX:
+            data["answer"] = record.data.target
+            data["priority"] = record.data.priority
+
+        if record.type == DnsRecordType.SRV:
+            data["answer"] = f"{record.data.weight} {record.data.port} {record.data.target}"
+            data["priority"] = record.data.priority
+
+        if record.type in [DnsRecordType.TXT, DnsRecordType.SPF]:
+            data["answer"] = record.data.normalized
+
+        return data
+
+    @staticmethod
+    def __parse_record(body: Dict[str, Any]) -> Record:
+        rtype = DnsRecordType.parse(body["type"])
+        host = body.get("host") or "@"
+        ttl = body.get("ttl")
+        answer = body.get("answer")
+
+        if rtype in [DnsRecordType.TXT, DnsRecordType.SPF]:
+            return MockStore.make_record(host, rtype, ttl, text=answer)
+
+        if rtype in [DnsRecordType.MX, DnsRecordType.SRV]:
+            return MockStore.make_record(host, rtype, ttl, data=f"{body.get('priority') or 0} {answer}")
+
+        return MockStore.make_record(host, rtype, ttl, data=answer)
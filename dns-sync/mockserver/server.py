@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+import json
+import random
+import threading
+import time
+
+from .api import MockApi
+from .cloudflare import CloudflareMockApi
+from .digitalocean import DigitalOceanMockApi
+from .godaddy import GoDaddyMockApi
+from .linode import LinodeMockApi
+from .namecom import NamecomMockApi
+from .store import MockStore
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlparse
+
+
+class MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    env_vars = {
+        "cloudflare": "CF_API_URL",
+        "digitalocean": "DO_API_URL",
+        "godaddy": "GD_API_URL",
+        "linode": "LINODE_API_URL",
+        "namecom": "NAMECOM_API_URL"
+    }
+
+    def __init__(self, host: str, port: int, stores: Dict[str, MockStore], page_size: Optional[int] = None, latency: float = 0, throttle_rate: float = 0, max_concurrency: int = 0):
+        super().__init__((host, port), MockRequestHandler)
+
+        self.stores = stores
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.concurrency = threading.BoundedSemaphore(max_concurrency) if max_concurrency > 0 else None
+        self.apis: Dict[str, MockApi] = {
+            "cloudflare": CloudflareMockApi(stores["cloudflare"], page_size),
+            "digitalocean": DigitalOceanMockApi(stores["digitalocean"], page_size),
+            "godaddy": GoDaddyMockApi(stores["godaddy"], page_size),
+            "linode": LinodeMockApi(stores["linode"], page_size),
+            "namecom": NamecomMockApi(stores["namecom"], page_size)
+        }
+        self.request_count = 0
+        self.throttled_count = 0
+        self.__count_lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+
+        return f"http://{host}:{port}"
+
+    def count_request(self, throttled: bool):
+        with self.__count_lock:
+            self.request_count += 1
+
+            if throttled:
+                self.throttled_count += 1
+
+    def dispatch(self, method: str, path: str, body: Any, headers: Optional[Dict[str, str]] = None) -> Tuple[int, Any]:
+        url = urlparse(path)
+        parts = [unquote(p) for p in url.path.split("/") if p]
+        query = dict(parse_qsl(url.query))
+
+        if not parts or parts[0] not in self.apis:
+            return 404, {"message": f"Unknown provider in path {url.path}"}
+
+        api = self.apis[parts[0]]
+
+        if self.throttle_rate and random.random() < self.throttle_rate:
+            self.count_request(True)
+            return api.error(429, "Too many requests")
+
+        if self.concurrency and not self.concurrency.acquire(blocking=False):
+            self.count_request(True)
+            return api.error(429, "Too many concurrent requests")
+
+        try:
+            self.count_request(False)
+
+            if self.latency:
+                time.sleep(self.latency)
+
+            try:
+                return api.handle(method, parts[1:], query, body, headers or {})
+            except (KeyError, ValueError) as e:
+                return api.error(400, f"Invalid request: {e}")
+        finally:
+            if self.concurrency:
+                self.concurrency.release()
+
+
+class MockRequestHandler(BaseHTTPRequestHandler):
+    server: MockServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args):
+        pass
+
+    def do_GET(self):
+        self.__handle("GET")
+
+    def do_POST(self):
+        self.__handle("POST")
+
+    def do_PUT(self):
+        self.__handle("PUT")
+
+    def do_PATCH(self):
+        self.__handle("PATCH")
+
+    def do_DELETE(self):
+        self.__handle("DELETE")
+
+    def __handle(self, method: str):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = None
+
+        if length:
+            try:
+                body = json.loads(self.rfile.read(length))
+            except ValueError:
+                body = None
+
+        status, response = self.server.dispatch(method, self.path, body, dict(self.headers))
+        if isinstance(response, str):
+            content = response.encode("utf-8")
+        else:
+            content = b"" if response is None else json.dumps(response).encode("utf-8")
+
+        self.send_response(status)
+
+        if status == 429:
+            self.send_header("Retry-After", "1")
+
+        if isinstance(response, str):
+            self.send_header("Content-Type", "text/plain")
+        elif response is not None:
+            self.send_header("Content-Type", "application/json")
+
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import threading
+
+from ..common import DnsRecordType
+from ..zonebase import Record, absolute_host, relative_host
+from typing import Dict, List, Optional, Union
+
+
+class MockZone:
+    def __init__(self, zone_id: int, domain: str):
+        self.id: int = zone_id
+        self.domain: str = domain
+        self.records: List[Record] = []
+
+    def get_record(self, record_id: Union[int, str]) -> Optional[Record]:
+        return next((r for r in self.records if f"{r.id}" == f"{record_id}"), None)
+
+    def relative_host(self, name: Optional[str]) -> str:
+        return relative_host(name, self.domain)
+
+    def absolute_host(self, host: Optional[str]) -> str:
+        return absolute_host(host, self.domain)
+
+
+class MockStore:
+    def __init__(self):
+        self.zones: Dict[str, MockZone] = {}
+        self.lock = threading.RLock()
+        self.__next_id = 1
+
+    def next_id(self) -> int:
+        with self.lock:
+            value = self.__next_id
+            self.__next_id += 1
+
+            return value
+
+    def add_zone(self, domain: str) -> MockZone:
+        with self.lock:
+            if domain not in self.zones:
+                self.zones[domain] = MockZone(self.next_id(), domain)
+
+            return self.zones[domain]
+
+    def get_zone(self, key: Union[int, str]) -> Optional[MockZone]:
+        with self.lock:
+            if key in self.zones:
+                return self.zones[key]
+
+            return next((z for z in self.zones.values() if f"{z.id}" == f"{key}"), None)
+
+    def add_record(self, zone: MockZone, record: Record) -> Record:
+        with self.lock:
+            record.id = self.next_id()
+            zone.records.append(record)
+
+            return record
+
+    @staticmethod
+    def make_record(host: Optional[str], rtype: Union[DnsRecordType, str], ttl: Optional[int], data: Optional[str] = None, text: Optional[str] = None) -> Record:
+        record = Record()
+        record.host = host
+        record.type = rtype
+        record.ttl = ttl or None
+
+        if text is not None:
+            record.data.normalized = text
+        else:
+            record.data = data
+
+        return record
+
+    def seed_synthetic(self, zones: int, records: int):
+        for zone_index in range(zones):
+            zone = self.add_zone(f"zone{zone_index}.example")
+
+            self.add_record(zone, self.make_record("@", DnsRecordType.MX, 3600, data=f"10 mail.{zone.domain}."))
+            self.add_record(zone, self.make_record("@", DnsRecordType.TXT, 3600, text="v=spf1 mx -all"))
+
+            for record_index in range(records):
+                self.add_record(zone, self.make_record(f"host{record_index}", DnsRecordType.A, 300, data=f"10.{record_index // 65536 % 256}.{record_index // 256 % 256}.{record_index % 256}"))
+
+    def seed_provider(self, provider):
+        for domain in provider.list_zones():
+            source_zone = provider.get_zone(domain)
+
+            if not source_zone:
+                continue
+
+            zone = self.add_zone(domain)
+
+            for source_record in source_zone.records:
+                record = self.make_record(source_record.host, source_record.type, source_record.ttl.seconds if source_record.ttl else None, data=f"{source_record.data}")
+                self.add_record(zone, record)
@@ -16,6 +16,19 @@ class Api(Http):
     def authorization(self) -> Optional[str]:
         return f"Bearer {self.__token}"
 
+    @property
+    def max_page_size(self) -> Optional[int]:
+        return 5000
+
+    @property
+    def page_size_param(self) -> Optional[str]:
+        return "per_page"
+
+    @property
+    def rate_limit(self) -> Optional[float]:
+        # 1200 requests every 5 minutes per user
+        return 1200 / 300
+
     def __init__(self, token: str = None):
         self.__base_url = os.environ.get("CF_API_URL", "https://api.cloudflare.com/client/v4/")
         self.__token = token or os.environ.get("CF_API_TOKEN")
@@ -30,6 +43,10 @@ class Api(Http):
             response_json = None
 
         if 200 <= response.status_code < 300:
+            # zone exports are returned as plain text instead of json
+            if response_json is None and response.headers.get("Content-Type", "").startswith("text/"):
+                return {"success": True, "result": response.text}
+
             return response_json
 
         if response_json and "errors" in response_json and response_json["errors"]:
@@ -43,5 +60,19 @@ class Api(Http):
     def select_pages(self, request: HttpRequest, response: Optional[Dict[str, Any]]) -> Optional[int]:
         return response and "result_info" in response and "total_pages" in response["result_info"] and response["result_info"]["total_pages"] or None
 
+    def select_page_size(self, request: HttpRequest) -> Optional[int]:
+        page_size = super().select_page_size(request)
+
+        # the zone listing allows smaller pages than the record listing, and exports aren't paged at all
+        if request.url == "zones":
+            return page_size and min(page_size, 50)
+
+        return page_size if request.url.endswith("/dns_records") else None
+
+    def select_cursor(self, request: HttpRequest, response: Optional[Dict[str, Any]]) -> Optional[str]:
+        cursors = response and "result_info" in response and response["result_info"].get("cursors")
+
+        return cursors and cursors.get("after") or None
+
 
 StaticApi = HttpStatic.make_static(Api)
@@ -4,8 +4,8 @@ from .api import StaticApi
 from .record import Record
 from .zone import Zone
 from ...common import DnsRecordType
-from ...zonebase import Provider as BaseProvider
-from typing import List, Optional
+from ...zonebase import Provider as BaseProvider, split_srv_host
+from typing import Any, Dict, List, Optional
 
 
 class Provider(BaseProvider):
@@ -16,21 +16,39 @@ class Provider(BaseProvider):
     @property
     def zones(self):
         if self.__zones is None:
-            zones = StaticApi.get("zones")
+            found = [Zone(zone) for zone in StaticApi.get("zones")]
 
-            self.__zones = [Zone(zone) for zone in zones]
+            # keep zones that were already looked up on their own, since their records may have been loaded or changed
+            self.__zones = [self.__found_zones.get(z.domain) or z for z in found]
 
         return self.__zones
 
     def __init__(self):
         self.__zones = None
+        self.__found_zones: Dict[str, Optional[Zone]] = {}
+
+    def clear_cache(self):
+        self.__zones = None
+        self.__found_zones = {}
 
     def list_zones(self) -> List[str]:
         return [zone.domain for zone in self.zones]
 
     def get_zone(self, zone: str) -> Optional[Zone]:
+        if self.__zones is None:
+            # look the zone up on its own rather than listing every zone in the account
+            if zone not in self.__found_zones:
+                self.__found_zones[zone] = self.__find_zone(zone)
+
+            return self.__found_zones[zone]
+
         return next((z for z in self.zones if z.domain == zone), None)
 
+    def __find_zone(self, zone: str) -> Optional[Zone]:
+        zones = StaticApi.get("zones", params={"name": zone})
+
+        return next((Zone(z) for z in zones if z["name"] == zone), None)
+
     def can_read_type(self, rtype: DnsRecordType) -> bool:
         return rtype in self.can_write_type(rtype) or rtype in [
             DnsRecordType.NS
@@ -46,13 +64,15 @@ class Provider(BaseProvider):
             DnsRecordType.TXT
         ]
 
+    def get_planned_record(self, zone: str, record: Record, record_id: Any) -> Optional[Record]:
+        planned = Record(record, zone)
+        planned.id = record_id
+
+        return planned
+
     def create_record(self, zone: str, record: Record) -> Record:
         z = self.get_zone(zone)
 
-        for _ in z.records:
-            # this is just to ensure records are loaded
-            pass
-
         cf_record = {
             "name": record.host,
             "type": f"{record.type}",
@@ -66,10 +86,7 @@ class Provider(BaseProvider):
             cf_record["priority"] = record.data.priority or 0
 
         if record.type == DnsRecordType.SRV:
-            name_parts = record.host.split(".")
-
-            cf_service, cf_proto = name_parts[:2]
-            cf_name = ".".join(name_parts[2:]) or "@"
+            cf_service, cf_proto, cf_name = split_srv_host(record.host)
 
             cf_record = {
                 "type": "SRV",
@@ -87,15 +104,18 @@ class Provider(BaseProvider):
             }
 
         response = StaticApi.post(f"zones/{z.id}/dns_records", data=cf_record)
-        record = Record(response)
+        record = Record(response, z.domain)
 
-        z.records.append(record)
+        z.track_created(record)
 
         return record
 
     def update_record(self, zone: str, record: Record, new_record: Record) -> Record:
         z = self.get_zone(zone)
 
+        if record.id is None:
+            z.resolve_ids()
+
         cf_record = {
             "name": new_record.host,
             "type": f"{new_record.type}",
@@ -108,10 +128,7 @@ class Provider(BaseProvider):
             cf_record["priority"] = record.data.priority or 0
 
         if new_record.type == DnsRecordType.SRV:
-            name_parts = new_record.host.split(".")
-
-            cf_service, cf_proto = name_parts[:2]
-            cf_name = ".".join(name_parts[2:]) or "@"
+            cf_service, cf_proto, cf_name = split_srv_host(new_record.host)
 
             cf_record = {
                 "type": "SRV",
@@ -136,6 +153,9 @@ class Provider(BaseProvider):
     def delete_record(self, zone: str, record: Record):
         z = self.get_zone(zone)
 
+        if record.id is None:
+            z.resolve_ids()
+
         StaticApi.delete(f"zones/{z.id}/dns_records/{record.id}")
 
-        z.records.remove(record)
+        z.track_deleted(record)
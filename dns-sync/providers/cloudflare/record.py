@@ -3,15 +3,31 @@
 import re
 
 from ...common import DnsRecordType
-from ...zonebase import Record as BaseRecord, TxtRecordData
+from ...zonebase import Record as BaseRecord, TxtRecordData, relative_host
 
 
 class Record(BaseRecord):
-    def __init__(self, record):
+    matches_managed_ttl = True
+
+    @property
+    def managed_ttl(self) -> bool:
+        return self.cf_proxied
+
+    def __init__(self, record, domain: str):
         super().__init__()
 
+        if isinstance(record, BaseRecord):
+            self.id = None
+            self.host = record.host
+            self.type = record.type
+            self.cf_proxied = False
+            self.ttl = None if record.ttl == 1 else record.ttl
+            self.data = f"{record.data}"
+            return
+
         self.id = record["id"]
-        self.host = ".".join(record["name"].split(".")[:-2])
+        # a zone's records always belong to it, even names under a delegated subdomain that's also in the account
+        self.host = relative_host(record["name"], record.get("zone_name") or domain)
         self.type = record["type"]
         self.cf_proxied = record.get("proxied", False)
 
@@ -32,12 +48,3 @@ class Record(BaseRecord):
             content = TxtRecordData.quote_data(content)
 
         self.data = content
-
-    def compare_ttl(self, record: BaseRecord) -> bool:
-        if self.cf_proxied:
-            return True
-
-        if hasattr(record, "cf_proxied") and record.cf_proxied:
-            return True
-
-        return super().compare_ttl(record)
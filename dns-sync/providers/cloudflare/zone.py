@@ -1,26 +1,54 @@
 #!/usr/bin/env python3
 
+import os
+
 from .api import StaticApi
 from .record import Record
-from ...zonebase import Zone as BaseZone
-from typing import List
+from ..zonefile.bind import parse_bind
+from ...zonebase import LazyZone as BaseZone
+from typing import Iterable, List
 
 
 class Zone(BaseZone):
-    @property
-    def records(self) -> List[Record]:
-        if self.__records is None:
-            records = StaticApi.get(f"zones/{self.id}/dns_records")
-            self.__records = [Record(r) for r in records]
-
-        return self.__records
-
-    @records.setter
-    def records(self, value: List[Record]):
-        pass
-
     def __init__(self, zoneinfo):
+        super().__init__()
+
         self.domain = zoneinfo["name"]
         self.id = zoneinfo["id"]
         self.nameservers = zoneinfo["name_servers"]
-        self.__records = None
+        self.__ids_resolved = False
+
+    def load_records(self) -> Iterable[Record]:
+        if os.environ.get("CF_ZONE_EXPORT"):
+            return self.__load_export()
+
+        return (Record(r, self.domain) for r in StaticApi.iter_get(f"zones/{self.id}/dns_records"))
+
+    def resolve_ids(self):
+        # records the api doesn't list, such as the exported SOA, never get an id, so the zone is only listed once
+        if self.__ids_resolved:
+            return
+
+        pending = [r for r in self.records if r.id is None]
+        self.__ids_resolved = True
+
+        if not pending:
+            return
+
+        listed = [Record(r, self.domain) for r in StaticApi.iter_get(f"zones/{self.id}/dns_records")]
+
+        for record, listed_record in self.match_records(pending, listed):
+            record.id = listed_record.id
+            record.cf_proxied = listed_record.cf_proxied
+
+    def __load_export(self) -> List[Record]:
+        # the export has no record ids, so they are only looked up by resolve_ids once a record needs to change
+        zone, comments = parse_bind(StaticApi.get(f"zones/{self.id}/dns_records/export"), self.domain)
+        records = []
+
+        for exported, comment in zip(zone.records, comments):
+            record = Record(exported, self.domain)
+            record.cf_proxied = "cf-proxied:true" in (comment or "")
+            records.append(record)
+
+        return records
@@ -4,7 +4,7 @@ import os
 import requests
 import urllib.parse
 
-from ...httpbase import Http, HttpStatic, HttpRequest
+from ...httpbase import Http, HttpNotFoundError, HttpStatic, HttpRequest
 from typing import Any, Dict, Optional
 
 
@@ -17,6 +17,19 @@ class Api(Http):
     def authorization(self) -> Optional[str]:
         return f"Bearer {self.__token}"
 
+    @property
+    def max_page_size(self) -> Optional[int]:
+        return 200
+
+    @property
+    def page_size_param(self) -> Optional[str]:
+        return "per_page"
+
+    @property
+    def rate_limit(self) -> Optional[float]:
+        # 5000 requests per hour per token
+        return 5000 / 3600
+
     def __init__(self, token: str = None):
         self.__base_url = os.environ.get("DO_API_URL", "https://api.digitalocean.com/v2/")
         self.__token = token or os.environ.get("DO_API_TOKEN")
@@ -24,14 +37,6 @@ class Api(Http):
         if not self.__token:
             raise ValueError("token must be specified or DO_API_TOKEN environment variable must exist.")
 
-    def mangle_request(self, request: HttpRequest) -> HttpRequest:
-        request = super().mangle_request(request)
-
-        # use maxiumum page size that's allowed per documentation
-        request.params["per_page"] = str(200)
-
-        return request
-
     def check_response(self, request: HttpRequest, response: requests.Response) -> Optional[Dict[str, Any]]:
         try:
             response_json = response.json()
@@ -41,6 +46,9 @@ class Api(Http):
         if 200 <= response.status_code < 300:
             return response_json
 
+        if response.status_code == 404:
+            raise HttpNotFoundError(response.text)
+
         if "message" in response_json:
             raise Exception(f"{response_json['id']}: {response_json['message']}" if "id" in response_json else response_json["message"])
 
@@ -3,7 +3,7 @@
 import os
 import requests
 
-from ...httpbase import Http, HttpStatic, HttpRequest
+from ...httpbase import Http, HttpMethod, HttpNotFoundError, HttpStatic, HttpRequest
 from typing import Any, Dict, Optional
 
 
@@ -16,6 +16,19 @@ class Api(Http):
     def authorization(self) -> Optional[str]:
         return f"sso-key {self.__api_key}:{self.__api_secret}"
 
+    @property
+    def max_page_size(self) -> Optional[int]:
+        return 500
+
+    @property
+    def page_size_param(self) -> Optional[str]:
+        return "limit"
+
+    @property
+    def rate_limit(self) -> Optional[float]:
+        # 60 requests per minute per endpoint, applied to the whole account to be safe
+        return 60 / 60
+
     def __init__(self, api_key: str = None, api_secret: str = None, shopper_id: str = None):
         self.__base_url = os.environ.get("GD_API_URL", "https://api.godaddy.com/v1/")
         self.__api_key = api_key or os.environ.get("GD_API_KEY")
@@ -33,6 +46,40 @@ class Api(Http):
 
         return request
 
+    def mangle_cursor_request(self, request: HttpRequest, cursor: str) -> HttpRequest:
+        request.params["marker" if request.url == "domains" else "offset"] = cursor
+
+        return request
+
+    def select_data(self, request: HttpRequest, response: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        return response if isinstance(response, list) else None
+
+    def select_page_size(self, request: HttpRequest) -> Optional[int]:
+        # only the domain and record listings are paged
+        if request.url != "domains" and not request.url.endswith("/records"):
+            return None
+
+        return super().select_page_size(request)
+
+    def select_cursor(self, request: HttpRequest, response: Optional[Dict[str, Any]]) -> Optional[str]:
+        if request.method != HttpMethod.GET or not isinstance(response, list) or not response:
+            return None
+
+        # a page shorter than the requested limit is the last one, without a limit the listing ends at an empty page
+        limit = int(request.params.get(self.page_size_param) or 0)
+
+        if limit and len(response) < limit:
+            return None
+
+        # the domains listing is paged by passing the last domain of the previous page as a marker
+        if request.url == "domains":
+            return response[-1]["domain"]
+
+        if request.url.endswith("/records"):
+            return str(int(request.params.get("offset") or 0) + len(response))
+
+        return None
+
     def check_response(self, request: HttpRequest, response: requests.Response) -> Optional[Dict[str, Any]]:
         try:
             response_json = response.json()
@@ -42,6 +89,9 @@ class Api(Http):
         if 200 <= response.status_code < 300:
             return response_json
 
+        if response.status_code == 404:
+            raise HttpNotFoundError(response.text)
+
         if "message" in response_json:
             raise Exception(f"{response_json['code']}: {response_json['message']}")
 
@@ -4,11 +4,15 @@ from .api import StaticApi
 from .zone import Zone
 from .record import Record
 from ...common import DnsRecordType
-from ...zonebase import TransactionProvider as BaseTransactionProvider, Record as BaseRecord
-from typing import List, Optional
+from ...httpbase import HttpNotFoundError
+from ...zonebase import TransactionProvider as BaseTransactionProvider, Record as BaseRecord, split_srv_host
+from typing import Dict, List, Optional, Set, Tuple
 
 
 class Provider(BaseTransactionProvider):
+    # Above this many per-group requests, a single PUT of the whole zone is cheaper.
+    max_group_requests = 5
+
     @property
     def description(self) -> str:
         return "GoDaddy sync provider."
@@ -23,19 +27,47 @@ class Provider(BaseTransactionProvider):
 
             zones = StaticApi.get("domains", params=params)
 
-            self.__zones = [Zone(zone) for zone in zones if self.__has_godaddy_nameserver(zone["nameServers"])]
+            found = [Zone(zone) for zone in zones if self.__has_godaddy_nameserver(zone["nameServers"])]
+
+            # keep zones that were already looked up on their own, since their records may have been loaded or changed
+            self.__zones = [self.__found_zones.get(z.domain) or z for z in found]
 
         return self.__zones
 
     def __init__(self):
         self.__zones = None
+        self.__found_zones: Dict[str, Optional[Zone]] = {}
+        self.__changes: Dict[str, Set[Tuple[DnsRecordType, Optional[str]]]] = {}
+
+    def clear_cache(self):
+        self.__zones = None
+        self.__found_zones = {}
+        self.__changes = {}
 
     def list_zones(self) -> List[str]:
         return [zone.domain for zone in self.zones]
 
     def get_zone(self, zone: str) -> Optional[Zone]:
+        if self.__zones is None:
+            # look the zone up on its own rather than listing every zone in the account
+            if zone not in self.__found_zones:
+                self.__found_zones[zone] = self.__find_zone(zone)
+
+            return self.__found_zones[zone]
+
         return next((z for z in self.zones if z.domain == zone), None)
 
+    def __find_zone(self, zone: str) -> Optional[Zone]:
+        try:
+            zoneinfo = StaticApi.get(f"domains/{zone}")
+        except HttpNotFoundError:
+            return None
+
+        if zoneinfo.get("status") != "ACTIVE" or not self.__has_godaddy_nameserver(zoneinfo.get("nameServers")):
+            return None
+
+        return Zone(zoneinfo)
+
     def can_read_type(self, rtype: DnsRecordType) -> bool:
         return rtype in self.can_write_type(rtype) or rtype in [
             DnsRecordType.NS
@@ -61,16 +93,20 @@ class Provider(BaseTransactionProvider):
         new_record = Record(record)
 
         z.records.append(new_record)
+        self.__mark_changed(zone, new_record)
 
         return record
 
     def update_record(self, zone: str, record: Record, new_record: BaseRecord) -> Record:
         record.set_data(new_record)
+        self.__mark_changed(zone, record)
+
         return record
 
     def delete_record(self, zone: str, record: Record):
         z = self.get_zone(zone)
         z.records.remove(record)
+        self.__mark_changed(zone, record)
 
     def __get_request_info(self, record):
         data = {
@@ -81,10 +117,7 @@ class Provider(BaseTransactionProvider):
         }
 
         if record.type == DnsRecordType.SRV:
-            parts = record.host.split(".")
-
-            data["service"], data["protocol"] = parts[:2]
-            data["name"] = ".".join(parts[2:]) or "@"
+            data["service"], data["protocol"], data["name"] = split_srv_host(record.host)
 
         if record.type == DnsRecordType.TXT:
             data["data"] = record.data.normalized
@@ -110,8 +143,67 @@ class Provider(BaseTransactionProvider):
 
         return next((ns for ns in nameservers if ns.endswith(".domaincontrol.com")), None) is not None
 
-    def commit_zone(self, zone: str):
-        z = self.get_zone(zone)
+    def __mark_changed(self, zone: str, record: Record):
+        self.__changes.setdefault(zone, set()).add(self.__get_group(record))
+
+    @staticmethod
+    def __get_group(record: Record) -> Tuple[DnsRecordType, Optional[str]]:
+        # SRV records are keyed by service and protocol as well as name, so they are always replaced by type.
+        if record.type == DnsRecordType.SRV:
+            return record.type, None
+
+        return record.type, record.host
+
+    def __put_zone(self, z: Zone):
         data = [self.__get_request_info(r) for r in z.records]
 
         StaticApi.put(f"domains/{z.domain}/records", data=data)
+
+    def __put_group(self, z: Zone, rtype: DnsRecordType, host: Optional[str], records: List[Record]):
+        data = [self.__get_request_info(r) for r in records]
+
+        if host is None:
+            StaticApi.put(f"domains/{z.domain}/records/{rtype}", data=data)
+            return
+
+        if not data:
+            StaticApi.delete(f"domains/{z.domain}/records/{rtype}/{host}")
+            return
+
+        for item in data:
+            del item["type"]
+            del item["name"]
+
+        StaticApi.put(f"domains/{z.domain}/records/{rtype}/{host}", data=data)
+
+    def commit_zone(self, zone: str):
+        z = self.get_zone(zone)
+        changes = self.__changes.get(zone, set())
+
+        # the changes are dropped even if the commit fails, so a later commit doesn't replay them
+        try:
+            groups: Dict[Tuple[DnsRecordType, Optional[str]], List[Record]] = {group: [] for group in changes}
+
+            for record in z.records:
+                group = self.__get_group(record)
+
+                if group in groups:
+                    groups[group].append(record)
+
+            group_records = sum(len(records) for records in groups.values())
+            empty_type_groups = any(host is None and not records for (_, host), records in groups.items())
+
+            if not groups or empty_type_groups or len(groups) > self.max_group_requests or group_records >= len(z.records):
+                self.__put_zone(z)
+                return
+
+            try:
+                for (rtype, host), records in sorted(groups.items(), key=lambda g: (g[0][0].name, g[0][1] or "")):
+                    self.__put_group(z, rtype, host, records)
+            except Exception as e:
+                # each group is its own request, so a failure can leave the zone half changed, and the whole zone is
+                # replaced instead to put every record in place at once
+                print(f"Could not commit changed records of zone {zone} to provider {self.id} by type and name, replacing the zone: {e}")
+                self.__put_zone(z)
+        finally:
+            self.__changes.pop(zone, None)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from ...common import DnsRecordType
-from ...zonebase import Record as BaseRecord
+from ...zonebase import Record as BaseRecord, join_srv_host
 
 
 class Record(BaseRecord):
@@ -22,10 +22,7 @@ class Record(BaseRecord):
         self.ttl = data["ttl"] or None
 
         if self.type == DnsRecordType.SRV:
-            if self.host == "@":
-                self.host = f"{data['service']}.{data['protocol']}"
-            else:
-                self.host = f"{data['service']}.{data['protocol']}.{data['name']}"
+            self.host = join_srv_host(data["service"], data["protocol"], data["name"])
 
         if self.type in [DnsRecordType.TXT, DnsRecordType.SPF]:
             self.data.normalized = data["data"]
@@ -16,6 +16,19 @@ class Api(Http):
     def authorization(self) -> Optional[str]:
         return f"Bearer {self.__token}"
 
+    @property
+    def max_page_size(self) -> Optional[int]:
+        return 500
+
+    @property
+    def page_size_param(self) -> Optional[str]:
+        return "page_size"
+
+    @property
+    def rate_limit(self) -> Optional[float]:
+        # 1600 requests per minute per user
+        return 1600 / 60
+
     def __init__(self, token: str = None):
         self.__base_url = os.environ.get("LINODE_API_URL", "https://api.linode.com/v4/")
         self.__token = token or os.environ.get("LINODE_API_TOKEN")
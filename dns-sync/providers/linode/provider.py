@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 
+import json
+
 from .api import StaticApi
 from .zone import Zone
 from .record import Record
 from ...common import DnsRecordType
-from ...zonebase import Provider as BaseProvider, Record as BaseRecord
-from typing import List, Optional
+from ...zonebase import Provider as BaseProvider, Record as BaseRecord, split_srv_host
+from typing import Any, Dict, List, Optional
 
 
 class Provider(BaseProvider):
@@ -18,19 +20,39 @@ class Provider(BaseProvider):
         if self.__zones is None:
             zones = StaticApi.get("domains")
 
-            self.__zones = [Zone(zone) for zone in zones]
+            found = [Zone(zone) for zone in zones]
+
+            # keep zones that were already looked up on their own, since their records may have been loaded or changed
+            self.__zones = [self.__found_zones.get(z.domain) or z for z in found]
 
         return self.__zones
 
     def __init__(self):
         self.__zones = None
+        self.__found_zones: Dict[str, Optional[Zone]] = {}
+
+    def clear_cache(self):
+        self.__zones = None
+        self.__found_zones = {}
 
     def list_zones(self) -> List[str]:
         return [zone.domain for zone in self.zones]
 
     def get_zone(self, zone: str) -> Optional[Zone]:
+        if self.__zones is None:
+            # look the zone up on its own rather than listing every zone in the account
+            if zone not in self.__found_zones:
+                self.__found_zones[zone] = self.__find_zone(zone)
+
+            return self.__found_zones[zone]
+
         return next((z for z in self.zones if z.domain == zone), None)
 
+    def __find_zone(self, zone: str) -> Optional[Zone]:
+        zones = StaticApi.get("domains", headers={"X-Filter": json.dumps({"domain": zone})})
+
+        return next((Zone(z) for z in zones if z["domain"] == zone), None)
+
     def can_read_type(self, rtype: DnsRecordType) -> bool:
         return rtype in [
             DnsRecordType.A,
@@ -44,23 +66,29 @@ class Provider(BaseProvider):
     def can_write_type(self, rtype: DnsRecordType) -> bool:
         return self.can_read_type(rtype)
 
+    def get_planned_record(self, zone: str, record: BaseRecord, record_id: Any) -> Optional[Record]:
+        planned = Record(record)
+        planned.id = record_id
+
+        return planned
+
     def create_record(self, zone: str, record: BaseRecord) -> Record:
         z = self.get_zone(zone)
 
-        for _ in z.records:
-            # this is just to ensure records are loaded
-            pass
-
         data = self.__get_request_info(record)
         response = StaticApi.post(f"domains/{z.id}/records", data=data)
         record = Record(response)
 
-        z.records.append(record)
+        z.track_created(record)
 
         return record
 
     def update_record(self, zone: str, record: Record, new_record: BaseRecord) -> Record:
         z = self.get_zone(zone)
+
+        if record.id is None:
+            z.resolve_ids()
+
         data = self.__get_request_info(new_record, record)
         response = StaticApi.put(f"domains/{z.id}/records/{record.id}", data=data)
 
@@ -71,9 +99,12 @@ class Provider(BaseProvider):
     def delete_record(self, zone: str, record: Record):
         z = self.get_zone(zone)
 
+        if record.id is None:
+            z.resolve_ids()
+
         StaticApi.delete(f"domains/{z.id}/records/{record.id}")
 
-        z.records.remove(record)
+        z.track_deleted(record)
 
     def __get_request_info(self, record, old_record=None):
         data = {
@@ -93,7 +124,7 @@ class Provider(BaseProvider):
             data["name"] = ""
 
         if record.type == DnsRecordType.SRV:
-            data["service"], data["protocol"] = (x.lstrip("_") for x in data["name"].split(".")[:2])
+            data["service"], data["protocol"] = (x.lstrip("_") for x in split_srv_host(record.host)[:2])
 
         if record.type == DnsRecordType.TXT:
             data["target"] = record.data.normalized
@@ -2,30 +2,49 @@
 
 from __future__ import annotations
 
+import os
+
 from .api import StaticApi
 from .record import Record
-from ...zonebase import Zone as BaseZone
-from typing import List
+from ..zonefile.bind import parse_bind
+from ...zonebase import LazyZone as BaseZone
+from typing import Iterable, List
 
 
 class Zone(BaseZone):
-    @property
-    def records(self) -> List[Record]:
-        if self.__records is None:
-            records = StaticApi.get(f"domains/{self.id}/records")
-            self.__records = [Record(r) for r in records]
-
-        return self.__records
-
-    @records.setter
-    def records(self, value: List[Record]):
-        pass
-
     def __init__(self, zoneinfo):
         super().__init__()
 
         self.id = zoneinfo["id"]
         self.domain = BaseZone.normalize_domain(zoneinfo["domain"])
         self.soa_email = zoneinfo["soa_email"]
-        self.__records = None
+        self.__ids_resolved = False
+
+    def load_records(self) -> Iterable[Record]:
+        if os.environ.get("LINODE_ZONE_EXPORT"):
+            return self.__load_export()
+
+        return (Record(r) for r in StaticApi.iter_get(f"domains/{self.id}/records"))
+
+    def resolve_ids(self):
+        # records the api doesn't list, such as the exported SOA, never get an id, so the zone is only listed once
+        if self.__ids_resolved:
+            return
+
+        pending = [r for r in self.records if r.id is None]
+        self.__ids_resolved = True
+
+        if not pending:
+            return
+
+        listed = [Record(r) for r in StaticApi.iter_get(f"domains/{self.id}/records")]
+
+        for record, listed_record in self.match_records(pending, listed):
+            record.id = listed_record.id
+
+    def __load_export(self) -> List[Record]:
+        # the zone file has no record ids, so they are only looked up by resolve_ids once a record needs to change
+        response = StaticApi.get(f"domains/{self.id}/zone-file")
+        zone, _ = parse_bind("\n".join(response["zone_file"]), self.domain)
 
+        return [Record(r) for r in zone.records]
@@ -3,7 +3,7 @@
 import os
 import requests
 
-from ...httpbase import Http, HttpStatic, HttpRequest
+from ...httpbase import Http, HttpNotFoundError, HttpStatic, HttpRequest
 from base64 import b64encode
 from typing import Any, Dict, Optional
 
@@ -17,6 +17,19 @@ class Api(Http):
     def authorization(self) -> Optional[str]:
         return f"Basic {self.__token}"
 
+    @property
+    def max_page_size(self) -> Optional[int]:
+        return 1000
+
+    @property
+    def page_size_param(self) -> Optional[str]:
+        return "perPage"
+
+    @property
+    def rate_limit(self) -> Optional[float]:
+        # 3000 requests per hour per account
+        return 3000 / 3600
+
     def __init__(self, username: str = None, password: str = None):
         self.__base_url = os.environ.get("NAMECOM_API_URL", "https://api.name.com/v4/")
 
@@ -37,6 +50,9 @@ class Api(Http):
         if 200 <= response.status_code < 300:
             return response_json
 
+        if response.status_code == 404:
+            raise HttpNotFoundError(response.text)
+
         if response_json and "errors" in response_json and response_json["errors"]:
             raise Exception(f"{response_json['message']}: {response_json['details']}" if "details" in response_json else response_json["message"])
 
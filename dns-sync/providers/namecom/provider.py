@@ -4,8 +4,9 @@ from .api import StaticApi
 from .zone import Zone
 from .record import Record
 from ...common import DnsRecordType
+from ...httpbase import HttpNotFoundError
 from ...zonebase import Provider as BaseProvider, Record as BaseRecord
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 
 class Provider(BaseProvider):
@@ -18,19 +19,40 @@ class Provider(BaseProvider):
         if self.__zones is None:
             zones = StaticApi.get("domains")
 
-            self.__zones = [Zone(zone) for zone in zones]
+            found = [Zone(zone) for zone in zones]
+
+            # keep zones that were already looked up on their own, since their records may have been loaded or changed
+            self.__zones = [self.__found_zones.get(z.domain) or z for z in found]
 
         return self.__zones
 
     def __init__(self):
         self.__zones = None
+        self.__found_zones: Dict[str, Optional[Zone]] = {}
+
+    def clear_cache(self):
+        self.__zones = None
+        self.__found_zones = {}
 
     def list_zones(self) -> List[str]:
         return [zone.domain for zone in self.zones]
 
     def get_zone(self, zone: str) -> Optional[Zone]:
+        if self.__zones is None:
+            # look the zone up on its own rather than listing every zone in the account
+            if zone not in self.__found_zones:
+                self.__found_zones[zone] = self.__find_zone(zone)
+
+            return self.__found_zones[zone]
+
         return next((z for z in self.zones if z.domain == zone), None)
 
+    def __find_zone(self, zone: str) -> Optional[Zone]:
+        try:
+            return Zone(StaticApi.get(f"domains/{zone}"))
+        except HttpNotFoundError:
+            return None
+
     def can_read_type(self, rtype: DnsRecordType) -> bool:
         return rtype in self.can_write_type(rtype) or rtype in [
             DnsRecordType.NS
@@ -46,18 +68,20 @@ class Provider(BaseProvider):
             DnsRecordType.TXT
         ]
 
+    def get_planned_record(self, zone: str, record: BaseRecord, record_id: Any) -> Optional[Record]:
+        planned = Record(record)
+        planned.id = record_id
+
+        return planned
+
     def create_record(self, zone: str, record: BaseRecord) -> Record:
         z = self.get_zone(zone)
 
-        for _ in z.records:
-            # this is just to ensure records are loaded
-            pass
-
         data = self.__get_request_info(record)
         response = StaticApi.post(f"domains/{z.domain}/records", data=data)
         record = Record(response)
 
-        z.records.append(record)
+        z.track_created(record)
 
         return record
 
@@ -75,7 +99,7 @@ class Provider(BaseProvider):
 
         StaticApi.delete(f"domains/{z.domain}/records/{record.id}")
 
-        z.records.remove(record)
+        z.track_deleted(record)
 
     def __get_request_info(self, record, old_record=None):
         data = {
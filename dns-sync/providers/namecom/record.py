@@ -10,6 +10,14 @@ class Record(BaseRecord):
     def __init__(self, data):
         super().__init__()
 
+        if isinstance(data, BaseRecord):
+            self.id = None
+            self.host = data.host
+            self.type = data.type
+            self.ttl = data.ttl
+            self.data = f"{data.data}"
+            return
+
         self.host = data["host"] if "host" in data else "@"
         self.type = data["type"]
         self.id = None
@@ -0,0 +1,6 @@
+#!/usr/bin/env python3
+
+from .database import Database
+from .provider import Provider
+from .record import Record
+from .zone import Zone
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+import os
+import sqlite3
+import threading
+
+from typing import Any, Iterable, List, Optional, Tuple
+
+
+class Database:
+    schema = [
+        "CREATE TABLE IF NOT EXISTS zones (id INTEGER PRIMARY KEY, domain TEXT NOT NULL UNIQUE)",
+        "CREATE TABLE IF NOT EXISTS records (id INTEGER PRIMARY KEY, zone_id INTEGER NOT NULL REFERENCES zones(id) ON DELETE CASCADE, host TEXT NOT NULL, type TEXT NOT NULL, ttl INTEGER, data TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS records_zone_host_type ON records (zone_id, host, type)"
+    ]
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self.__connection is None:
+            self.__connection = sqlite3.connect(self.path, check_same_thread=False)
+            self.__connection.execute("PRAGMA foreign_keys = ON")
+            self.__connection.execute("PRAGMA journal_mode = WAL")
+
+            with self.__connection:
+                for statement in self.schema:
+                    self.__connection.execute(statement)
+
+        return self.__connection
+
+    def __init__(self, path: str = None):
+        self.path = path or os.environ.get("SNAPSHOT_PATH", "dns-sync-snapshot.sqlite")
+        self.lock = threading.RLock()
+        self.__connection: Optional[sqlite3.Connection] = None
+
+    def query(self, sql: str, params: Iterable[Any] = ()) -> List[Tuple]:
+        with self.lock:
+            return self.connection.execute(sql, tuple(params)).fetchall()
+
+    def close(self):
+        with self.lock:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+from .database import Database
+from .record import Record
+from .zone import Zone
+from ...common import DnsRecordType
+from ...zonebase import TransactionProvider as BaseTransactionProvider, Record as BaseRecord
+from typing import Dict, List, Optional, Tuple
+
+
+class Provider(BaseTransactionProvider):
+    @property
+    def description(self) -> str:
+        return "Local SQLite snapshot provider."
+
+    @property
+    def zones(self) -> Dict[str, Zone]:
+        if self.__zones is None:
+            rows = self.__database.query("SELECT id, domain FROM zones ORDER BY domain")
+
+            self.__zones = {domain: Zone(self.__database, domain, zone_id) for zone_id, domain in rows}
+
+        return self.__zones
+
+    def __init__(self):
+        self.__database = Database()
+        self.__zones: Optional[Dict[str, Zone]] = None
+        self.__pending: Dict[str, List[Tuple[str, Record]]] = {}
+        self.__new_zones: Dict[str, Zone] = {}
+
+    def clear_cache(self):
+        self.__zones = None
+        self.__pending = {}
+        self.__new_zones = {}
+
+    def list_zones(self) -> List[str]:
+        return list(self.zones.keys())
+
+    def get_zone(self, zone: str) -> Optional[Zone]:
+        with self.__database.lock:
+            return self.zones.get(zone)
+
+    def get_destination_zone(self, zone: str) -> Optional[Zone]:
+        with self.__database.lock:
+            if zone in self.zones:
+                return self.zones[zone]
+
+            # a snapshot can mirror any zone, so unknown zones start out empty and are only saved when committed
+            if zone not in self.__new_zones:
+                self.__new_zones[zone] = Zone(self.__database, zone)
+
+            return self.__new_zones[zone]
+
+    def can_read_type(self, rtype: DnsRecordType) -> bool:
+        return rtype != DnsRecordType.SOA
+
+    def can_write_type(self, rtype: DnsRecordType) -> bool:
+        return self.can_read_type(rtype)
+
+    def create_record(self, zone: str, record: BaseRecord) -> Record:
+        z = self.get_destination_zone(zone)
+        new_record = Record(record)
+
+        z.records.append(new_record)
+        self.__pending.setdefault(zone, []).append(("create", new_record))
+
+        return new_record
+
+    def update_record(self, zone: str, record: Record, new_record: BaseRecord) -> Record:
+        record.set_data(new_record)
+        self.__pending.setdefault(zone, []).append(("update", record))
+
+        return record
+
+    def delete_record(self, zone: str, record: Record):
+        z = self.get_destination_zone(zone)
+
+        z.records.remove(record)
+        self.__pending.setdefault(zone, []).append(("delete", record))
+
+    def commit_zone(self, zone: str):
+        z = self.get_destination_zone(zone)
+        pending = self.__pending.pop(zone, [])
+        created: Dict[int, Tuple[Record, int]] = {}
+
+        with self.__database.lock:
+            with self.__database.connection as connection:
+                zone_id = z.id if z.id is not None else connection.execute("INSERT INTO zones (domain) VALUES (?)", (z.domain,)).lastrowid
+
+                for action, record in pending:
+                    if action == "create":
+                        created[id(record)] = (record, connection.execute("INSERT INTO records (zone_id, host, type, ttl, data) VALUES (?, ?, ?, ?, ?)", (zone_id, *record.to_row())).lastrowid)
+                    elif id(record) in created:
+                        # the record was created in this commit and its insert has already been written with its final
+                        # values, unless it was deleted again
+                        if action == "delete":
+                            connection.execute("DELETE FROM records WHERE id = ?", (created[id(record)][1],))
+                    elif action == "update":
+                        connection.execute("UPDATE records SET host = ?, type = ?, ttl = ?, data = ? WHERE id = ?", (*record.to_row(), record.id))
+                    elif action == "delete":
+                        connection.execute("DELETE FROM records WHERE id = ?", (record.id,))
+
+            # ids and the zone cache are only updated once the transaction has been committed
+            if z.id is None:
+                z.id = zone_id
+                self.zones[zone] = self.__new_zones.pop(zone)
+
+            for record, record_id in created.values():
+                record.id = record_id
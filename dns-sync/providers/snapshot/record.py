@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+from ...zonebase import Record as BaseRecord
+from typing import Optional, Tuple
+
+
+class Record(BaseRecord):
+    def __init__(self, data=None):
+        super().__init__()
+
+        self.id: Optional[int] = None
+
+        if isinstance(data, BaseRecord):
+            self.host = data.host
+            self.type = data.type
+            self.set_data(data)
+            return
+
+        if data is not None:
+            self.id, self.host, self.type, self.ttl, self.data = data
+
+    def set_data(self, data: BaseRecord):
+        self.ttl = data.ttl
+        self.data = f"{data.data}"
+
+    def to_row(self) -> Tuple[str, str, Optional[int], str]:
+        return self.host, f"{self.type}", self.ttl.seconds if self.ttl else None, f"{self.data}"
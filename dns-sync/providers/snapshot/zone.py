@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+from .database import Database
+from .record import Record
+from ...zonebase import Zone as BaseZone
+from typing import List, Optional
+
+
+class Zone(BaseZone):
+    @property
+    def records(self) -> List[Record]:
+        if self.__records is None:
+            if self.id is None:
+                self.__records = []
+            else:
+                rows = self.__database.query("SELECT id, host, type, ttl, data FROM records WHERE zone_id = ? ORDER BY id", (self.id,))
+                self.__records = [Record(r) for r in rows]
+
+        return self.__records
+
+    @records.setter
+    def records(self, value: List[Record]):
+        pass
+
+    def __init__(self, database: Database, domain: str, zone_id: Optional[int] = None):
+        super().__init__()
+
+        self.domain = BaseZone.normalize_domain(domain)
+        self.id: Optional[int] = zone_id
+        self.__database = database
+        self.__records: Optional[List[Record]] = None
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+from .include_index import IncludeIndex
 from .provider import Provider
 from .record import Record, RecordDefaults
 from .zone import Zone
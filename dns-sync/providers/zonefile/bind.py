@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+import re
+
+from .zone import Zone
+from ...common import DnsRecordType
+from ...zonebase import relative_host
+from typing import List, Optional, Tuple
+
+record_regex = re.compile("^(?P<owner>[^\\s]+)?\\s+(?:(?P<ttl>[0-9][^\\s]*)\\s+)?(?:(?:IN|CH|HS)\\s+)?(?:(?P<class_ttl>[0-9][^\\s]*)\\s+)?(?P<type>[A-Za-z0-9]+)\\s+(?P<data>.*)$", re.IGNORECASE)
+
+
+# Parses a zone exported by a provider API, which may use absolute names, comments and multi-line records, into a Zone.
+# Returns the zone along with the comment of each record, in the same order as the zone's records.
+def parse_bind(text: str, domain: str) -> Tuple[Zone, List[Optional[str]]]:
+    lines: List[str] = []
+    comments: List[Optional[str]] = []
+    origin = domain
+    owner = "@"
+
+    for content, comment in join_lines(text):
+        if content.startswith("$"):
+            parts = content.split()
+
+            if parts[0].upper() == "$ORIGIN" and len(parts) > 1:
+                origin = parts[1].rstrip(".")
+            elif parts[0].upper() == "$TTL" and len(parts) > 1:
+                lines.append(f"$TTL {parts[1]}")
+
+            continue
+
+        match = record_regex.match(content)
+
+        if not match:
+            continue
+
+        try:
+            rtype = DnsRecordType.parse(match.group("type"))
+        except ValueError:
+            continue
+
+        if match.group("owner"):
+            owner = absolute_name(match.group("owner"), origin)
+
+        if rtype == DnsRecordType.SOA:
+            continue
+
+        ttl = match.group("ttl") or match.group("class_ttl")
+        host = relative_host(owner, domain)
+
+        lines.append(f"{host} {ttl} IN {rtype} {match.group('data').strip()}" if ttl else f"{host} IN {rtype} {match.group('data').strip()}")
+        comments.append(comment)
+
+    return Zone("\n".join(lines), domain), comments
+
+
+def absolute_name(name: str, origin: str) -> str:
+    if name == "@":
+        return origin
+
+    if name.endswith("."):
+        return name.rstrip(".")
+
+    return f"{name}.{origin}"
+
+
+def join_lines(text: str) -> List[Tuple[str, Optional[str]]]:
+    lines: List[Tuple[str, Optional[str]]] = []
+    pending = ""
+    pending_comment: Optional[str] = None
+    depth = 0
+
+    for line in text.replace("\r", "").split("\n"):
+        content, comment, depth_change = split_line(line)
+
+        if not content.strip() and not depth:
+            continue
+
+        depth += depth_change
+        pending = f"{pending} {content.strip()}" if pending else content.rstrip()
+        pending_comment = pending_comment or comment
+
+        if depth <= 0:
+            lines.append((pending, pending_comment))
+            pending = ""
+            pending_comment = None
+            depth = 0
+
+    return lines
+
+
+# Splits off a trailing comment and removes grouping parentheses, ignoring both inside quoted strings.
+def split_line(line: str) -> Tuple[str, Optional[str], int]:
+    content = []
+    quoted = False
+    escaped = False
+    depth_change = 0
+
+    for i, c in enumerate(line):
+        if escaped:
+            escaped = False
+        elif c == "\\":
+            escaped = True
+        elif c == '"':
+            quoted = not quoted
+        elif not quoted and c == ";":
+            return "".join(content), line[i + 1:].strip() or None, depth_change
+        elif not quoted and c in "()":
+            depth_change += 1 if c == "(" else -1
+            content.append(" ")
+            continue
+
+        content.append(c)
+
+    return "".join(content), None, depth_change
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import json
+import os
+
+from typing import Callable, Dict, List, Set
+
+
+# Paths are kept with symlinks resolved, since git reports changed files under the repository's real path.
+class IncludeIndex:
+    index_version = 2
+
+    @property
+    def includes(self) -> Dict[str, Set[str]]:
+        includes: Dict[str, Set[str]] = {}
+
+        for zone, files in self.__zones.items():
+            for path in files:
+                includes.setdefault(path, set()).add(zone)
+
+        return includes
+
+    def __init__(self, path: str):
+        self.path = path
+        self.__zones: Dict[str, Dict[str, float]] = {}
+
+        if not os.path.isfile(path):
+            return
+
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except ValueError:
+            return
+
+        if data.get("version") == self.index_version:
+            self.__zones = data.get("zones") or {}
+
+    def update(self, zones: List[str], get_zone_files: Callable[[str], List[str]]) -> bool:
+        changed = False
+
+        for zone in list(self.__zones):
+            if zone not in zones:
+                del self.__zones[zone]
+                changed = True
+
+        for zone in zones:
+            # a zone only needs rescanning when one of the files it read before has changed
+            if zone in self.__zones and all(self.__get_mtime(p) == m for p, m in self.__zones[zone].items()):
+                continue
+
+            self.__zones[zone] = {os.path.realpath(p): self.__get_mtime(p) for p in get_zone_files(zone)}
+            changed = True
+
+        return changed
+
+    def save(self):
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        with open(self.path, "w") as f:
+            json.dump({"version": self.index_version, "zones": self.__zones}, f, indent=2, sort_keys=True)
+
+    def get_zones(self, paths: Set[str]) -> Set[str]:
+        paths = {os.path.realpath(p) for p in paths}
+
+        return {zone for zone, files in self.__zones.items() if paths.intersection(files)}
+
+    def get_files(self) -> Set[str]:
+        return {path for files in self.__zones.values() for path in files}
+
+    @staticmethod
+    def __get_mtime(path: str) -> float:
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return -1
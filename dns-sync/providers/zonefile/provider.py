@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 
+import hashlib
 import os
+import subprocess
 
+from .include_index import IncludeIndex
 from .zone import Zone
 from ...common import DnsRecordType
 from ...zonebase import ReadOnlyProvider as BaseReadOnlyProvider
+from datetime import datetime
 from queue import PriorityQueue
-from typing import List, Optional
+from typing import List, Optional, Set
 
 
 class Provider(BaseReadOnlyProvider):
@@ -69,6 +73,96 @@ class Provider(BaseReadOnlyProvider):
 
         return Zone("\n".join(zonedata), domain)
 
+    def get_zone_files(self, zone: str) -> List[str]:
+        basepath = os.environ.get("ZONEFILE_PATH", ".")
+        filepath = os.path.join(basepath, f"{zone}.db")
+        files = []
+        pending = [filepath]
+
+        while pending:
+            path = pending.pop(0)
+
+            if path in files or not os.path.isfile(path):
+                continue
+
+            files.append(path)
+
+            with open(path, "r") as f:
+                for line in f.readlines():
+                    line = line.strip()
+
+                    if line.startswith("$INCLUDE"):
+                        _, include_file = line.split(" ")
+                        pending.append(os.path.join(basepath, include_file))
+
+        return files
+
+    def get_include_index(self) -> IncludeIndex:
+        index = IncludeIndex(os.environ.get("ZONEFILE_INDEX_PATH") or self.__get_default_index_path())
+
+        if index.update(self.list_zones(), self.get_zone_files):
+            index.save()
+
+        return index
+
+    @staticmethod
+    def __get_default_index_path() -> str:
+        # the index is kept out of the zone file directory, which is often a git checkout or read only, with one index
+        # for each zone file directory
+        basepath = os.path.realpath(os.environ.get("ZONEFILE_PATH", "."))
+        cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        key = hashlib.sha256(basepath.encode("utf-8")).hexdigest()[:16]
+
+        return os.path.join(cache, "dns-sync", f"index-{key}.json")
+
+    def get_changed_zones(self, since: str) -> List[str]:
+        index = self.get_include_index()
+        timestamp = self.__parse_timestamp(since)
+
+        if timestamp is not None:
+            changed = {p for p in index.get_files() if os.path.isfile(p) and os.path.getmtime(p) > timestamp}
+        else:
+            changed = self.__get_git_changes(since)
+
+        return sorted(index.get_zones(changed))
+
+    # Times start with @, like @1706702400 or @2024-01-31T12:00:00, since short commit hashes can be all digits.
+    @staticmethod
+    def __parse_timestamp(since: str) -> Optional[float]:
+        if not since.startswith("@"):
+            return None
+
+        try:
+            return float(since[1:])
+        except ValueError:
+            pass
+
+        try:
+            return datetime.fromisoformat(since[1:]).timestamp()
+        except ValueError:
+            raise ValueError(f"{since} is not a Unix timestamp or an ISO 8601 date")
+
+    @staticmethod
+    def __get_git_changes(ref: str) -> Set[str]:
+        basepath = os.environ.get("ZONEFILE_PATH", ".")
+
+        def git(*args: str) -> List[str]:
+            result = subprocess.run(["git", "-C", basepath, *args], capture_output=True, text=True)
+
+            if result.returncode != 0:
+                raise ValueError(f"{ref} is not a git revision in {basepath}: {result.stderr.strip()}")
+
+            return [line for line in result.stdout.splitlines() if line]
+
+        root = os.path.realpath(git("rev-parse", "--show-toplevel")[0])
+        changed = git("diff", "--name-only", ref, "--") + git("ls-files", "--others", "--exclude-standard", "--full-name")
+
+        return {os.path.realpath(os.path.join(root, path)) for path in changed}
+
+    def prefetch_zone(self, zone: str):
+        # zone files are parsed when requested and aren't cached, so there's nothing to warm
+        pass
+
     def can_read_type(self, rtype: DnsRecordType) -> bool:
         return rtype in [
             DnsRecordType.A,
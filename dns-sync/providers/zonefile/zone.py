@@ -2,6 +2,7 @@
 
 from .record import Record, RecordDefaults
 from ...zonebase import Zone as BaseZone
+from typing import TextIO
 
 
 class Zone(BaseZone):
@@ -28,16 +29,12 @@ class Zone(BaseZone):
         self.__defaults = RecordDefaults(default_lines)
         self.records = [Record(line, self.__defaults) for line in record_lines]
 
-    def __str__(self) -> str:
-        outlines = []
+    def write(self, out: TextIO):
+        defaults = f"{self.__defaults}" if self.__defaults else ""
 
-        if self.__defaults:
-            outlines.append(f"{self.__defaults}")
+        out.write(defaults)
 
-        out = "\n".join(outlines)
-        superout = super().__str__()
+        if defaults and self.records:
+            out.write("\n")
 
-        if out and superout:
-            out += "\n"
-
-        return out + superout
+        super().write(out)
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 
+from .columnar_zone import ColumnarZone
+from .lazy_zone import LazyZone
+from .names import intern_host, relative_host, absolute_host, split_srv_host, join_srv_host
 from .provider import Provider, ReadOnlyProvider, TransactionProvider
 from .record import Record
 from .record_data import RecordData, UnparsedRecordData, IpRecordData, MxRecordData, SrvRecordData, CnameRecordData, TxtRecordData
 from .zone import Zone
+from .zone_index import ZoneIndex
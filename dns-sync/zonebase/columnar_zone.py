@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+from array import array
+from .record import Record
+from .zone import Zone
+from ..common import DnsRecordType
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Stored in the ttl column for records without a ttl.
+no_ttl = -1
+
+
+# A zone stored as parallel columns instead of Record objects, which are only built when records is first used.
+class ColumnarZone(Zone):
+    @property
+    def records(self) -> List[Record]:
+        if self.__records is None:
+            self.__records = [self.record(i) for i in range(len(self))]
+
+        return self.__records
+
+    @records.setter
+    def records(self, value: List[Record]):
+        self.__records = None
+        self.hosts: List[str] = []
+        self.types = array("H")
+        self.ttls = array("l")
+        self.data: List[str] = []
+        self.normalized: List[str] = []
+
+        for record in value or []:
+            self.append(record.host, record.type, record.ttl.seconds if record.ttl else None, f"{record.data}", record.data.normalized)
+
+    def __init__(self, domain: Optional[str] = None, records: Optional[Iterable[Record]] = None):
+        self.__records: Optional[List[Record]] = None
+
+        super().__init__()
+
+        self.domain = domain
+        self.records = records
+
+    def __len__(self) -> int:
+        return len(self.hosts)
+
+    @classmethod
+    def from_zone(cls, zone: Zone) -> ColumnarZone:
+        return cls(zone.domain, zone.records)
+
+    def append(self, host: str, rtype: DnsRecordType, ttl: Optional[int], data: str, normalized: Optional[str] = None):
+        self.__records = None
+        self.hosts.append(Record.normalize_host(host))
+        self.types.append(rtype.value)
+        self.ttls.append(no_ttl if ttl is None else ttl)
+        self.data.append(data)
+        self.normalized.append(data if normalized is None or normalized == data else normalized)
+
+    def record(self, index: int) -> Record:
+        record = Record()
+        record.host = self.hosts[index]
+        record.type = DnsRecordType(self.types[index])
+        record.ttl = None if self.ttls[index] == no_ttl else self.ttls[index]
+        record.data = self.data[index]
+
+        return record
+
+    def iter_records(self, indexes: Optional[Iterable[int]] = None) -> Iterator[Record]:
+        for index in range(len(self)) if indexes is None else indexes:
+            yield self.record(index)
+
+    def select(self, types: Optional[Iterable[DnsRecordType]] = None, hosts: Optional[Iterable[str]] = None) -> List[int]:
+        type_values: Optional[Set[int]] = None if types is None else {t.value for t in types}
+        host_values: Optional[Set[str]] = None if hosts is None else {Record.normalize_host(h) for h in hosts}
+
+        if type_values is None and host_values is None:
+            return list(range(len(self)))
+
+        if host_values is None:
+            return [i for i, t in enumerate(self.types) if t in type_values]
+
+        if type_values is None:
+            return [i for i, h in enumerate(self.hosts) if h in host_values]
+
+        return [i for i, (h, t) in enumerate(zip(self.hosts, self.types)) if t in type_values and h in host_values]
+
+    def filter(self, types: Optional[Iterable[DnsRecordType]] = None, hosts: Optional[Iterable[str]] = None) -> ColumnarZone:
+        zone = ColumnarZone(self.domain)
+
+        for i in self.select(types, hosts):
+            zone.append(self.hosts[i], DnsRecordType(self.types[i]), None if self.ttls[i] == no_ttl else self.ttls[i], self.data[i], self.normalized[i])
+
+        return zone
+
+    def groups(self, indexes: Optional[Iterable[int]] = None) -> Dict[Tuple[str, int], List[int]]:
+        groups: Dict[Tuple[str, int], List[int]] = {}
+
+        for i in range(len(self)) if indexes is None else indexes:
+            groups.setdefault((self.hosts[i], self.types[i]), []).append(i)
+
+        return groups
+
+    # Returns (source, destination) index pairs to update, source indexes to create and destination indexes to delete.
+    def diff(self, destination: ColumnarZone, types: Optional[Iterable[DnsRecordType]] = None) -> Tuple[List[Tuple[int, int]], List[int], List[int]]:
+        source_groups = self.groups(None if types is None else self.select(types))
+        destination_groups = destination.groups(None if types is None else destination.select(types))
+        updates: List[Tuple[int, int]] = []
+        creates: List[int] = []
+        deletes: List[int] = []
+
+        for key in sorted({*source_groups.keys(), *destination_groups.keys()}):
+            source_indexes = source_groups.get(key, [])
+            destination_indexes = destination_groups.get(key, [])
+            destination_by_data: Dict[str, List[int]] = {}
+            leftover_sources: List[int] = []
+
+            for di in destination_indexes:
+                destination_by_data.setdefault(destination.normalized[di], []).append(di)
+
+            for si in source_indexes:
+                candidates = destination_by_data.get(self.normalized[si])
+
+                if not candidates:
+                    leftover_sources.append(si)
+                    continue
+
+                # prefer a duplicate that already has the right ttl, like pair_records does
+                di = next((d for d in candidates if destination.ttls[d] == self.ttls[si]), candidates[0])
+                candidates.remove(di)
+
+                if destination.ttls[di] != self.ttls[si]:
+                    updates.append((si, di))
+
+            leftover_sources.sort(key=lambda i: (self.normalized[i], self.ttls[i]))
+            leftover_destinations = sorted((d for c in destination_by_data.values() for d in c), key=lambda i: (destination.normalized[i], destination.ttls[i]))
+            paired = min(len(leftover_sources), len(leftover_destinations))
+
+            updates.extend(zip(leftover_sources, leftover_destinations))
+            creates.extend(leftover_sources[paired:])
+            deletes.extend(leftover_destinations[paired:])
+
+        return updates, creates, deletes
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+from .record import Record
+from .zone import Zone
+from ..common import iter_in_background
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, List, Optional
+
+
+# A zone whose records are loaded on first use. While they are iterated for the first time, the next ones are already
+# being loaded in the background, and the full list is kept once iteration finishes.
+class LazyZone(Zone, ABC):
+    @property
+    def records(self) -> List[Record]:
+        if self.__records is None:
+            for _ in self.iter_records():
+                # this is just to ensure records are loaded
+                pass
+
+        return self.__records
+
+    @records.setter
+    def records(self, value: List[Record]):
+        pass
+
+    def __init__(self):
+        super().__init__()
+
+        self.__records: Optional[List[Record]] = None
+
+    def iter_records(self) -> Iterator[Record]:
+        if self.__records is not None:
+            return iter(self.__records)
+
+        return self.__collect(iter_in_background(self.load_records()))
+
+    def stream_records(self) -> Iterator[Record]:
+        if self.__records is not None:
+            return iter(self.__records)
+
+        return iter_in_background(self.load_records())
+
+    @abstractmethod
+    def load_records(self) -> Iterable[Record]:
+        pass
+
+    # Keeps the loaded records in step with a record created in the provider. Records that aren't loaded yet are left
+    # alone, since loading them will include it.
+    def track_created(self, record: Record):
+        if self.__records is not None:
+            self.__records.append(record)
+
+    # Records deleted by id, such as when resuming a sync, aren't the loaded objects, so they're also matched by id.
+    def track_deleted(self, record: Record):
+        if self.__records is None:
+            return
+
+        record_id = getattr(record, "id", None)
+        loaded = next((r for r in self.__records if r is record or (record_id is not None and getattr(r, "id", None) == record_id)), None)
+
+        if loaded is not None:
+            self.__records.remove(loaded)
+
+    def __collect(self, records: Iterator[Record]) -> Iterator[Record]:
+        loaded: List[Record] = []
+
+        for record in records:
+            loaded.append(record)
+            yield record
+
+        self.__records = loaded
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+import sys
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# Conversions are cached per (name, domain), which repeat for every record of the same host in a zone.
+cache_size = 65536
+
+
+def intern_host(host: Optional[str]) -> str:
+    # hosts like @, www and _sip._tcp repeat across records, so every record shares one copy
+    return sys.intern(host or "@")
+
+
+@lru_cache(maxsize=cache_size)
+def relative_host(name: Optional[str], domain: str) -> str:
+    name = (name or "").rstrip(".")
+
+    if not name or name == "@" or name == domain:
+        return intern_host(None)
+
+    if name.endswith(f".{domain}"):
+        return intern_host(name[:-len(domain) - 1])
+
+    return intern_host(name)
+
+
+@lru_cache(maxsize=cache_size)
+def absolute_host(host: Optional[str], domain: str) -> str:
+    if not host or host == "@":
+        return domain
+
+    return f"{host}.{domain}"
+
+
+@lru_cache(maxsize=cache_size)
+def split_srv_host(host: str) -> Tuple[str, str, str]:
+    service, protocol, *name = host.split(".")
+
+    return intern_host(service), intern_host(protocol), intern_host(".".join(name))
+
+
+@lru_cache(maxsize=cache_size)
+def join_srv_host(service: str, protocol: str, name: Optional[str]) -> str:
+    if not name or name == "@":
+        return intern_host(f"{service}.{protocol}")
+
+    return intern_host(f"{service}.{protocol}.{name}")
@@ -9,7 +9,7 @@ from .record import Record
 from .zone import Zone
 from ..common import DnsRecordType, Time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, List, Optional
 
 
 class Provider(ABC):
@@ -36,6 +36,28 @@ class Provider(ABC):
     def get_zone(self, zone: str) -> Optional[Zone]:
         pass
 
+    def clear_cache(self):
+        pass
+
+    # The zone to sync records into. Only providers that can hold any zone, like snapshot, return zones that don't exist yet.
+    def get_destination_zone(self, zone: str) -> Optional[Zone]:
+        return self.get_zone(zone)
+
+    # The provider's own record for one that was planned with its id, so it can be updated or deleted without listing the
+    # zone. Providers that can't change a record by its id alone return None.
+    def get_planned_record(self, zone: str, record: Record, record_id: Any) -> Optional[Record]:
+        return None
+
+    def prefetch_zone(self, zone: str):
+        z = self.get_zone(zone)
+
+        if not z:
+            return
+
+        for _ in z.records:
+            # this is just to ensure records are loaded
+            pass
+
     @abstractmethod
     def can_read_type(self, rtype: DnsRecordType) -> bool:
         pass
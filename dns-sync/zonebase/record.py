@@ -2,6 +2,7 @@
 
 import re
 
+from .names import intern_host
 from .record_data import RecordData, UnparsedRecordData
 from ..common import DnsRecordType, Time
 from typing import Optional, Union
@@ -80,12 +81,21 @@ class Record:
     def __str__(self):
         return self.raw
 
+    # Records whose ttl is managed by the provider, such as proxied Cloudflare records, match any ttl.
+    managed_ttl = False
+
+    # Whether the other record's managed ttl also counts as a match, for providers that manage ttls themselves.
+    matches_managed_ttl = False
+
     def compare_ttl(self, record: 'Record') -> bool:
+        if self.managed_ttl or (self.matches_managed_ttl and record.managed_ttl):
+            return True
+
         return self.ttl == record.ttl
 
     @staticmethod
     def normalize_host(host: Optional[str]) -> str:
-        return host or "@"
+        return intern_host(host)
 
     @staticmethod
     def normalize_ttl(ttl: Union[Time, int, str, None]) -> Optional[Time]:
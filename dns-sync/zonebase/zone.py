@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 
+import io
+
 from .record import Record
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
 
 
 class Zone:
@@ -25,9 +27,22 @@ class Zone:
         self.__domain: Optional[str] = self.normalize_domain(None)
         self.__records: List[Record] = []
 
+    def iter_records(self) -> Iterator[Record]:
+        return iter(self.records)
+
+    # Iterates the records without keeping them, for zones too large to hold in memory.
+    def stream_records(self) -> Iterator[Record]:
+        return self.iter_records()
+
     def __str__(self) -> str:
+        out = io.StringIO()
+
+        self.write(out)
+
+        return out.getvalue()
+
+    def write(self, out: TextIO):
         export_tab_width = 8
-        outlines = []
         longest_host = 0
         longest_ttl = 0
 
@@ -39,6 +54,7 @@ class Zone:
 
         longest_host_columns = longest_host // export_tab_width + 1
         longest_ttl_columns = longest_ttl // export_tab_width + 1
+        separator = ""
 
         for record in self.records:
             host = record.host + "\t" * (longest_host_columns - (len(record.host) // export_tab_width + 1) + 1)
@@ -48,9 +64,39 @@ class Zone:
                 ttl = f"{record.ttl.seconds}" if record.serialize_ttl else ""
                 ttl += "\t" * (longest_ttl_columns - (len(ttl) // export_tab_width + 1) + 1)
 
-            outlines.append(f"{host}{ttl}IN\t{record.type}\t{record.data}")
+            out.write(f"{separator}{host}{ttl}IN\t{record.type}\t{record.data}")
+            separator = "\n"
+
+    # Pairs records loaded without ids, such as from a zone export, with the same records from a listing that has them.
+    @staticmethod
+    def match_records(records: List[Record], listed: List[Record]) -> List[Tuple[Record, Record]]:
+        by_data: Dict[Tuple[str, str, str], List[Record]] = {}
+        by_type: Dict[Tuple[str, str], List[Record]] = {}
+        pairs: List[Tuple[Record, Record]] = []
+        leftovers: List[Record] = []
+
+        for record in listed:
+            by_data.setdefault((record.host, record.type.name, record.data.normalized), []).append(record)
+
+        for record in records:
+            candidates = by_data.get((record.host, record.type.name, record.data.normalized))
+
+            if candidates:
+                pairs.append((record, candidates.pop(0)))
+            else:
+                leftovers.append(record)
+
+        for candidates in by_data.values():
+            for record in candidates:
+                by_type.setdefault((record.host, record.type.name), []).append(record)
+
+        for record in leftovers:
+            candidates = by_type.get((record.host, record.type.name))
+
+            if candidates:
+                pairs.append((record, candidates.pop(0)))
 
-        return "\n".join(outlines)
+        return pairs
 
     @staticmethod
     def normalize_domain(domain: Optional[str]) -> Optional[str]:
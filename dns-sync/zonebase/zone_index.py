@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+from .names import intern_host
+from typing import Dict, Iterable, Optional, Tuple
+
+
+# Maps fully qualified names to the most specific zone containing them, using a trie of reversed labels.
+class ZoneIndex:
+    def __init__(self, domains: Iterable[str] = ()):
+        self.__root: Dict[str, dict] = {}
+        self.__zone_key = "."
+
+        for domain in domains:
+            self.add(domain)
+
+    def add(self, domain: str):
+        node = self.__root
+
+        for label in self.labels(domain):
+            node = node.setdefault(label, {})
+
+        node[self.__zone_key] = domain.rstrip(".")
+
+    def find(self, name: Optional[str]) -> Optional[str]:
+        node = self.__root
+        zone = node.get(self.__zone_key)
+
+        for label in self.labels(name):
+            node = node.get(label)
+
+            if node is None:
+                break
+
+            zone = node.get(self.__zone_key, zone)
+
+        return zone
+
+    def split(self, name: Optional[str]) -> Tuple[Optional[str], str]:
+        zone = self.find(name)
+
+        if zone is None:
+            return None, name
+
+        # the zone matched label by label, so the host is whatever labels are left in front of it
+        labels = name.rstrip(".").split(".")
+
+        return zone, intern_host(".".join(labels[:len(labels) - len(zone.split("."))]))
+
+    @staticmethod
+    def labels(name: Optional[str]) -> Iterable[str]:
+        name = (name or "").rstrip(".").lower()
+
+        if not name:
+            return []
+
+        return reversed(name.split("."))